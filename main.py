@@ -1,19 +1,28 @@
 import sys
-import argparse
-from sleekes.ui.main_window import SleekesMainWindow
-from sleekes.cli.main import main as cli_main
-from PySide6.QtWidgets import QApplication
 
 def main():
     # 간단한 인자 체크로 CLI 모드 진입 여부 결정
+    # CLI 경로에서는 PySide6를 전혀 로드하지 않도록 import를 분기 내부로 지연합니다.
     if len(sys.argv) > 1 and sys.argv[1] not in ["--gui", "-g"]:
+        from sleekes.cli.main import main as cli_main
         cli_main()
     else:
+        from PySide6.QtWidgets import QApplication
+        from sleekes.ui.main_window import SleekesMainWindow
         app = QApplication(sys.argv)
         app.setApplicationName("Sleekes")
         window = SleekesMainWindow()
         window.show()
-        sys.exit(app.exec())
+        code = app.exec()
+        if window.stuck_jobs:
+            # 제한 시간 안에 끝나지 않은 작업 스레드가 남아 있으면 Qt 정리 과정에서 실행 중인 QThread를
+            # 파괴하다 프로세스가 중단되므로, 로그만 비우고 즉시 종료합니다.
+            # (설정과 대기열은 창을 닫을 때 이미 기록되었고, 작업은 다음 실행 때 이어받습니다)
+            import logging
+            import os
+            logging.shutdown()
+            os._exit(code)
+        sys.exit(code)
 
 if __name__ == "__main__":
     main()
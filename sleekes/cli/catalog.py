@@ -0,0 +1,72 @@
+import argparse
+import os
+import time
+from typing import List, Optional
+
+from sleekes.core.catalog import ArchiveCatalog
+from sleekes.core.config import load_settings
+
+# =============================================================================
+# [Sleekes Archive Search]
+#
+# 아카이브 카탈로그(settings/archive_catalog.db)를 터미널에서 검색하는 하위 명령입니다.
+# 카탈로그는 download()가 끝날 때마다 자동으로 갱신되므로 평소에는 바로 검색하면 되고,
+# 다른 경로에서 복사해 온 폴더 등을 반영하려면 --rescan으로 증분 스캔을 먼저 실행합니다.
+# (처음 사용할 때는 아카이브 루트를 자동으로 스캔합니다)
+#
+# 사용법:
+#   python main.py search [검색어...] [--channel 이름] [--from 20240101] [--to 20241231]
+#                         [--limit 20] [--page 1] [--root Archives] [--rescan]
+# =============================================================================
+
+def _format_duration(seconds) -> str:
+    if not seconds:
+        return "--:--"
+    seconds = int(seconds)
+    hours, rest = divmod(seconds, 3600)
+    return f"{hours}:{rest // 60:02d}:{rest % 60:02d}" if hours else f"{rest // 60:02d}:{rest % 60:02d}"
+
+def _format_date(value: Optional[str]) -> str:
+    return f"{value[:4]}-{value[4:6]}-{value[6:8]}" if value and len(value) == 8 else "----------"
+
+def main(argv: Optional[List[str]] = None):
+    settings = load_settings()
+
+    parser = argparse.ArgumentParser(prog="main.py search", description="Sleekes 아카이브 카탈로그 검색")
+    parser.add_argument("query", nargs="*", help="제목/채널/설명/태그 검색어 (모든 단어 포함, 접두어 일치)")
+    parser.add_argument("--channel", help="채널명 (부분 일치)")
+    parser.add_argument("--from", dest="date_from", help="업로드 날짜 시작 (YYYYMMDD 또는 YYYY-MM-DD)")
+    parser.add_argument("--to", dest="date_to", help="업로드 날짜 끝 (YYYYMMDD 또는 YYYY-MM-DD)")
+    parser.add_argument("--limit", type=int, default=20, help="한 페이지에 표시할 결과 수 (기본값: 20)")
+    parser.add_argument("--page", type=int, default=1, help="페이지 번호 (기본값: 1)")
+    parser.add_argument("--root", default=settings.get("last_path", "Archives"),
+                        help="스캔할 아카이브 루트 폴더 (기본값: 마지막 사용 경로)")
+    parser.add_argument("--rescan", action="store_true", help="검색 전에 아카이브 루트를 증분 스캔")
+    args = parser.parse_args(argv)
+
+    catalog = ArchiveCatalog()
+    try:
+        if args.rescan or not catalog.has_root(args.root):
+            started = time.perf_counter()
+            stats = catalog.scan(args.root)
+            print(f"SCAN: {stats['folders']} folder(s), {stats['parsed']} re-read, {stats['removed']} removed "
+                  f"in {time.perf_counter() - started:.2f}s")
+
+        text = " ".join(args.query)
+        started = time.perf_counter()
+        total = catalog.count(text, args.channel, args.date_from, args.date_to)
+        results = catalog.search(text, args.channel, args.date_from, args.date_to,
+                                 limit=args.limit, offset=max(args.page - 1, 0) * args.limit)
+        elapsed = time.perf_counter() - started
+    finally:
+        catalog.close()
+
+    for item in results:
+        print(f"{_format_date(item['upload_date'])}  {_format_duration(item['duration']):>8}  "
+              f"{item['channel'] or '-'} | {item['title'] or item['video_id']}")
+        print(f"{'':22}{os.path.basename(item['folder'])}")
+    shown = f"{(args.page - 1) * args.limit + 1}-{(args.page - 1) * args.limit + len(results)}" if results else "0"
+    print(f"--- {shown} of {total} result(s) in {elapsed * 1000:.1f}ms ---")
+
+if __name__ == "__main__":
+    main()
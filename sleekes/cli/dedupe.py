@@ -0,0 +1,50 @@
+import argparse
+import time
+from typing import List, Optional
+
+from sleekes.core.config import load_settings
+from sleekes.core.manifest import DEFAULT_WORKERS, archive_folders
+from sleekes.core.dedupe import ContentStore, dedupe_tree
+
+# =============================================================================
+# [Sleekes Archive Dedupe]
+#
+# 아카이브 폴더 전체에서 내용이 같은 파일을 찾아, 가장 오래된 파일 하나만 남기고
+# 나머지를 그 파일의 링크(reflink 또는 하드링크)로 바꾸는 오프라인 하위 명령입니다.
+# 크기가 같은 파일만 해시하며, 매니페스트에 최신 해시가 있으면 파일을 다시 읽지 않습니다.
+#
+# 사용법:
+#   python main.py dedupe [폴더...] [--root Archives] [--dry-run] [--workers 8]
+# =============================================================================
+
+def main(argv: Optional[List[str]] = None):
+    settings = load_settings()
+
+    parser = argparse.ArgumentParser(prog="main.py dedupe", description="Sleekes 아카이브 중복 파일 정리")
+    parser.add_argument("folders", nargs="*", help="정리할 아카이브 폴더 (생략하면 --root 아래 전체)")
+    parser.add_argument("--root", default=settings.get("last_path", "Archives"),
+                        help="아카이브 루트 폴더 (기본값: 마지막 사용 경로)")
+    parser.add_argument("--dry-run", action="store_true", help="파일을 바꾸지 않고 절약할 수 있는 용량만 보고")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"동시에 해시할 파일 수 (기본값: {DEFAULT_WORKERS})")
+    args = parser.parse_args(argv)
+
+    folders = args.folders or archive_folders(args.root)
+    print(f"--- Sleekes Dedupe ({'dry run' if args.dry_run else 'linking duplicates'}, {len(folders)} folder(s)) ---")
+
+    started = time.perf_counter()
+    store = None if args.dry_run else ContentStore()
+    try:
+        stats = dedupe_tree(folders, workers=args.workers, dry_run=args.dry_run, store=store, log=print)
+    finally:
+        if store:
+            store.close()
+    elapsed = time.perf_counter() - started
+
+    print("-" * 40)
+    action = "could be linked" if args.dry_run else "linked"
+    print(f"[요약] {stats['files']} file(s) scanned, {stats['hashed']} hashed, {stats['linked']} {action} "
+          f"({stats['bytes'] / 1048576:.1f} MiB), {stats['failed']} failed in {elapsed:.1f}s")
+
+if __name__ == "__main__":
+    main()
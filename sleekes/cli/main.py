@@ -56,6 +56,14 @@ Sleekes는 yt-dlp를 기반으로 한 강력한 동영상 아카이빙 솔루션
    (기본적으로 되어있으나, 더 명확히 하려면)
    $ python main.py [URL]
 
+5. 대량 일괄 아카이빙
+   URL 목록 파일(한 줄에 하나)을 4개 작업으로 병렬 처리합니다.
+   $ python main.py --batch-file urls.txt --workers 4 --rec
+
+6. 아카이브 검색
+   받아 둔 영상을 제목/채널/설명/업로드 날짜로 찾습니다.
+   $ python main.py search 라이브 --channel 채널명 --from 2024-01-01
+
 [옵션 상세 설명]
 
 - **정밀 휴식 엔진**: 분 단위 랜덤 지연(5분~30분)을 통해 기계적 접근 탐지를 완벽히 우회.
@@ -71,13 +79,67 @@ Sleekes는 yt-dlp를 기반으로 한 강력한 동영상 아카이빙 솔루션
   -a, --archive  : 전체 아카이빙 모드 (영상+모든 데이터)
   -x, --audio    : 오디오만 추출 (MP3 변환)
   --skip-video   : 영상 파일은 건너뛰고 댓글/정보만 수집
+  --native       : 재인코딩 없이 원본 코덱/컨테이너 유지 (변환 CPU 절약)
+  --sub-langs [목록] : 자막 언어 우선순위 (orig = 원본만, all = 자동 번역 포함 전체)
+  --refresh-comments : 아카이빙한 영상의 새 댓글만 받아 기존 댓글 파일에 병합
+  --compress [형식] : info.json과 댓글 파일을 gzip/xz/zstd로 압축 저장
   --cookies [브라우저] : chrome, edge, firefox 등에서 쿠키 가져오기
   --sleep [초]   : 영상 다운로드 사이의 휴식 시간 (안티 밴)
   --playlist-items : 1-5, 10 등 특정 번호의 영상만 다운로드
+  --pp-workers [개수]     : 다운로드와 병행할 ffmpeg 변환 작업 수 (기본 2)
+  --ffmpeg-threads [개수] : ffmpeg 변환 작업당 CPU 스레드 수 (기본 2)
+  --no-validate  : 받은 미디어 파일 검증과 손상 파일 자동 재수신 끄기
+  --no-dedupe    : 다른 폴더에 이미 있는 영상/파일을 링크하지 않고 따로 저장
+  --force        : 아카이브 인덱스를 무시하고 이미 받은 영상도 새 폴더에 다시 아카이빙
+                   (중간에 끊긴 세션이 있으면 그 폴더에서 이어받음)
+
+  search [검색어] : 아카이브 카탈로그에서 제목/채널/설명으로 검색
+                   (--channel, --from/--to 날짜, --rescan 증분 스캔)
+  verify [폴더]  : 체크섬 매니페스트로 아카이브 무결성 검사
+                   (--full 전체 스크럽, --workers 병렬 수, --build 매니페스트 생성)
+  dedupe         : 아카이브 폴더 사이의 같은 파일을 하나로 링크해 디스크 절약
+                   (--dry-run 미리보기, --workers 병렬 수)
+
+  --batch-file [파일] : URL 목록 파일을 일괄 처리 ('-' 입력 시 표준입력)
+  --workers [개수]    : 일괄 처리 시 동시 작업 수 (기본 2)
+  --per-host [개수]   : 같은 사이트에 대한 최대 동시 작업 수 (기본 1)
 
 ================================================================
 """)
 
+def print_progress(record):
+    """
+    엔진의 진행률 레코드를 터미널 한 줄에 덮어써서 표시합니다.
+    """
+    from sleekes.core.progress import format_record
+
+    end = "\n" if record['status'] != 'downloading' else ""
+    print(f"\r{format_record(record):<70}", end=end, flush=True)
+
+def run_batch(args, options):
+    """
+    --batch-file로 전달된 URL 목록을 워커 풀에서 병렬로 처리하고 요약을 출력합니다.
+    """
+    from sleekes.core.batch import BatchRunner, iter_batch_urls, format_summary
+
+    print(f"\n--- Sleekes Pro CLI 일괄 처리 모드 ---")
+    print(f"입력: {'표준입력' if args.batch_file == '-' else args.batch_file}")
+    print(f"저장 경로: {os.path.abspath(args.output)}")
+    print(f"동시 작업: {args.workers}개 (사이트당 최대 {args.per_host}개)")
+    print("-" * 40)
+
+    runner = BatchRunner(workers=args.workers, per_host=args.per_host, log_callback=print)
+    if args.batch_file == "-":
+        stats = runner.run(iter_batch_urls(sys.stdin), args.output, options)
+    else:
+        with open(args.batch_file, "r", encoding="utf-8") as f:
+            stats = runner.run(iter_batch_urls(f), args.output, options)
+
+    print("-" * 40)
+    print(f"[요약] {format_summary(stats)}")
+    if stats["failed"]:
+        sys.exit(1)
+
 def main():
     """
     CLI 프로그램의 메인 실행 함수입니다.
@@ -89,6 +151,20 @@ def main():
         print_guide()
         sys.exit(0)
 
+    # 하위 명령(search, verify, dedupe)은 각 모듈로 넘깁니다 (다운로드 엔진을 불러오지 않음)
+    if len(sys.argv) > 1 and sys.argv[1] == "search":
+        from sleekes.cli.catalog import main as search_main
+        search_main(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == "verify":
+        from sleekes.cli.verify import main as verify_main
+        verify_main(sys.argv[2:])
+        return
+    if len(sys.argv) > 1 and sys.argv[1] == "dedupe":
+        from sleekes.cli.dedupe import main as dedupe_main
+        dedupe_main(sys.argv[2:])
+        return
+
     # 2. 사용자 설정 로드
     # 이전에 저장된 설정이 있다면 불러옵니다 (GUI와 설정 공유)
     settings = load_settings()
@@ -116,14 +192,22 @@ def main():
     dl_group.add_argument("-a", "--archive", action="store_true", help="전체 아카이빙 모드 (영상 + 자막 + 댓글 + 설명 + 썸네일)")
     dl_group.add_argument("-x", "--audio", action="store_true", help="오디오 전용 모드 (영상 없이 MP3 추출)")
     dl_group.add_argument("--skip-video", action="store_true", help="영상 다운로드 제외 (메타데이터만 빠르게 수집)")
+    dl_group.add_argument("--native", action="store_true", help="네이티브 컨테이너 모드 (재인코딩 없이 원본 코덱 유지, -x와 함께 쓰면 opus/m4a 그대로 저장)")
     
     # [상세 데이터 수집 옵션 그룹]
     meta_group = parser.add_argument_group('데이터 수집 상세 설정')
     meta_group.add_argument("--desc", action="store_true", help="영상 설명(.description) 저장")
     meta_group.add_argument("--json", action="store_true", help="메타데이터(.json) 저장")
     meta_group.add_argument("--subs", action="store_true", help="자막 파일 저장")
+    meta_group.add_argument("--sub-langs", default=settings.get("sub_langs", "orig"),
+                            help="자막 언어 우선순위 (예: orig,ko,en / all = 자동 번역 포함 전체, 기본값: orig)")
+    meta_group.add_argument("--sub-workers", type=int, default=4, help="자막 트랙 동시 수집 수 (기본값: 4)")
     meta_group.add_argument("--thumb", action="store_true", help="썸네일 이미지 저장")
-    meta_group.add_argument("--comments", action="store_true", help="댓글 목록(.json) 저장")
+    meta_group.add_argument("--comments", action="store_true", help="댓글 목록(.comments.jsonl) 저장")
+    meta_group.add_argument("--compress", choices=['gzip', 'xz', 'zstd'], default=settings.get("compress_metadata"),
+                            help="info.json과 댓글 파일을 압축 저장 (zstd는 zstandard 패키지 또는 Python 3.14 필요)")
+    meta_group.add_argument("--refresh-comments", action="store_true",
+                            help="이미 아카이빙한 URL의 새 댓글만 받아 기존 댓글 파일에 병합")
     
     # [엔진 및 안전 설정 그룹]
     engine_group = parser.add_argument_group('엔진 및 안전 설정 (Anti-Ban)')
@@ -133,6 +217,19 @@ def main():
     engine_group.add_argument("--playlist-items", help="플레이리스트 다운로드 범위 지정 (예: 1-5, 10)")
     engine_group.add_argument("--no-playlist", action="store_true", help="플레이리스트 URL이라도 단일 영상만 다운로드")
     engine_group.add_argument("--flat", action="store_true", help="폴더 구조를 만들지 않고 파일만 저장")
+    engine_group.add_argument("--pp-workers", type=int, default=2, help="동시에 실행할 ffmpeg 변환 작업 수 (기본값: 2)")
+    engine_group.add_argument("--ffmpeg-threads", type=int, default=2, help="ffmpeg 변환 작업당 스레드 수 (기본값: 2)")
+    engine_group.add_argument("--no-validate", action="store_true",
+                              help="받은 미디어 파일 검증(ffprobe + 앞/뒤 디코딩)과 손상 파일 자동 재수신을 끔")
+    engine_group.add_argument("--no-dedupe", action="store_true",
+                              help="다른 아카이브 폴더에 이미 있는 영상/파일을 링크하지 않고 따로 받아 저장")
+    engine_group.add_argument("--force", action="store_true", help="아카이브 인덱스를 무시하고 새 폴더에 다시 아카이빙 (중간에 끊긴 세션은 이어받음)")
+
+    # [일괄 처리 옵션 그룹]
+    batch_group = parser.add_argument_group('일괄 처리 (Batch)')
+    batch_group.add_argument("--batch-file", metavar="FILE", help="URL 목록 파일 (한 줄에 하나, '-' 입력 시 표준입력)")
+    batch_group.add_argument("--workers", type=int, default=2, help="동시에 실행할 작업 수 (기본값: 2)")
+    batch_group.add_argument("--per-host", type=int, default=1, help="같은 사이트에 대한 최대 동시 작업 수 (기본값: 1)")
 
     # 기본값 적용 (Config 내용 반영)
     # argparse의 set_defaults를 사용하여 저장된 설정을 기본값으로 주입합니다.
@@ -140,6 +237,7 @@ def main():
         "archive": settings.get("archive_mode", False),
         "audio": settings.get("only_audio", False),
         "skip_video": settings.get("skip_download", False),
+        "native": settings.get("native_container", False),
         "sleep": settings.get("sleep_interval", 0),
         "flat": settings.get("flat_output", False),
     }
@@ -161,7 +259,7 @@ def main():
         return
 
     # 2. URL 유효성 확인
-    if not args.url:
+    if not args.url and not args.batch_file:
         parser.print_help() # URL이 없으면 기본 도움말 출력
         return
 
@@ -182,9 +280,12 @@ def main():
             "archive_mode": args.archive,
             "only_audio": args.audio,
             "skip_download": args.skip_video,
+            "native_container": args.native,
             "sleep_interval": args.sleep if args.sleep else 0,
             "cookie_browser": args.cookies if args.cookies else "None",
             "flat_output": args.flat,
+            "sub_langs": args.sub_langs,
+            "compress_metadata": args.compress,
             "last_path": args.output
         })
         save_settings(new_settings)
@@ -206,16 +307,36 @@ def main():
         'archive_mode': args.archive,
         'only_audio': args.audio,
         'skip_download': args.skip_video,
+        'native_container': args.native,
         'sleep_interval': args.sleep,
         'max_sleep_interval': args.max_sleep,
         'cookies_from_browser': args.cookies,
         'playlist_items': args.playlist_items,
         'use_playlist': not args.no_playlist,
-        'flat_output': args.flat
+        'flat_output': args.flat,
+        'use_index': not args.force,
+        'pp_workers': args.pp_workers,
+        'ffmpeg_threads': args.ffmpeg_threads,
+        'validate_media': not args.no_validate,
+        'validate_workers': args.pp_workers,
+        'dedupe': not args.no_dedupe,
+        'refresh_comments': args.refresh_comments,
+        'compress_metadata': args.compress,
+        'sub_langs': args.sub_langs,
+        'sub_workers': args.sub_workers
     }
 
-    # 7. 다운로더 엔진 구동 및 실행
-    downloader = SleekesDownloader(log_callback=print)
+    # 7. 일괄 처리 모드 (--batch-file)
+    if args.batch_file:
+        run_batch(args, options)
+        return
+
+    # 8. 다운로더 엔진 구동 및 실행
+    downloader = SleekesDownloader(
+        progress_callback=print_progress if sys.stdout.isatty() else None,
+        log_callback=print,
+        progress_interval=0.5
+    )
     
     print(f"\n--- Sleekes Pro CLI 엔진 가동 ---")
     print(f"타겟 URL: {args.url}")
@@ -0,0 +1,112 @@
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Tuple
+
+# =============================================================================
+# [Sleekes CLI Startup Benchmark]
+#
+# CLI 진입 경로의 기동 비용을 측정하는 회귀 방지용 벤치마크입니다.
+# `python -X importtime main.py --info`를 하위 프로세스로 실행한 뒤,
+# stderr에 출력되는 import 시간 리포트를 파싱하여 요약합니다.
+#
+# 다음 조건 중 하나라도 위반하면 종료 코드 1을 반환하므로 CI에서 가드로 사용할 수 있습니다.
+# 1. CLI 경로에서 금지된 무거운 모듈(PySide6, yt_dlp)이 로드된 경우
+# 2. 전체 누적 import 시간이 예산(기본 300ms)을 초과한 경우
+#
+# CLI는 임시 작업 폴더에서 실행되므로 벤치마크가 settings/ 등 파일을 남기지 않습니다.
+#
+# 사용법:
+#   python -m sleekes.cli.startup_bench [--budget-ms 300] [--top 15] [-- CLI 인자...]
+# =============================================================================
+
+FORBIDDEN_MODULES = ("PySide6", "shiboken6", "yt_dlp")
+DEFAULT_BUDGET_MS = 300.0
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def parse_importtime(stderr: str) -> List[Tuple[str, float, float]]:
+    """
+    `-X importtime` 출력에서 (모듈명, self 시간 ms, 누적 시간 ms) 목록을 추출합니다.
+
+    Args:
+        stderr (str): 하위 프로세스의 stderr 전체 텍스트
+
+    Returns:
+        list: (module, self_ms, cumulative_ms) 튜플 목록
+    """
+    records = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|")
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = float(parts[0].strip())
+            cumulative_us = float(parts[1].strip())
+        except ValueError:
+            # 헤더 라인 ("self [us] | cumulative | imported package")
+            continue
+        records.append((parts[2][1:].rstrip(), self_us / 1000.0, cumulative_us / 1000.0))
+    return records
+
+def measure(cli_args: List[str]) -> Dict:
+    """
+    CLI 진입점을 `-X importtime`으로 실행하고 측정 결과를 반환합니다.
+
+    Args:
+        cli_args (list): main.py에 전달할 인자 목록 (예: ["--info"])
+
+    Returns:
+        dict: returncode, total_ms, forbidden(로드된 금지 모듈), records
+    """
+    cmd = [sys.executable, "-X", "importtime", os.path.join(PROJECT_ROOT, "main.py")] + cli_args
+    # CLI는 작업 폴더에 settings/를 만들므로, 체크아웃을 더럽히지 않도록 임시 폴더에서 실행합니다
+    with tempfile.TemporaryDirectory(prefix="sleekes-bench-") as cwd:
+        proc = subprocess.run(cmd, cwd=cwd, capture_output=True, text=True)
+    records = parse_importtime(proc.stderr)
+
+    # 최상위(들여쓰기 없는) 모듈의 누적 시간 합이 전체 import 비용입니다.
+    total_ms = sum(cum for name, _, cum in records if not name.startswith(" "))
+    loaded = {name.strip().split(".")[0] for name, _, _ in records}
+    forbidden = sorted(m for m in FORBIDDEN_MODULES if m in loaded)
+
+    return {"returncode": proc.returncode, "total_ms": total_ms, "forbidden": forbidden, "records": records}
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Sleekes CLI 기동 시간(import) 벤치마크")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="허용 누적 import 시간 (ms)")
+    parser.add_argument("--top", type=int, default=15, help="출력할 상위 모듈 개수")
+    parser.add_argument("cli_args", nargs="*", default=["--info"], help="main.py에 전달할 인자 (기본값: --info)")
+    args = parser.parse_args()
+
+    result = measure(args.cli_args)
+
+    print(f"--- Sleekes CLI Startup Report ({' '.join(args.cli_args)}) ---")
+    print(f"{'self(ms)':>10} {'cumul(ms)':>10}  module")
+    ranked = sorted(result["records"], key=lambda r: r[2], reverse=True)
+    for name, self_ms, cum_ms in ranked[:args.top]:
+        print(f"{self_ms:10.2f} {cum_ms:10.2f}  {name.strip()}")
+    print("-" * 40)
+    print(f"총 import 시간: {result['total_ms']:.2f}ms (예산 {args.budget_ms:.0f}ms)")
+
+    failed = False
+    if result["returncode"] != 0:
+        print(f"[실패] CLI 프로세스가 비정상 종료되었습니다 (exit {result['returncode']}).")
+        failed = True
+    if result["forbidden"]:
+        print(f"[실패] CLI 경로에서 금지된 모듈이 로드되었습니다: {', '.join(result['forbidden'])}")
+        failed = True
+    if result["total_ms"] > args.budget_ms:
+        print("[실패] 기동 시간이 예산을 초과했습니다.")
+        failed = True
+
+    if not failed:
+        print("[성공] CLI 기동 경로가 가볍게 유지되고 있습니다.")
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
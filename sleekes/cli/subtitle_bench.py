@@ -0,0 +1,98 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import time
+from typing import Dict, List
+
+from sleekes.core.subtitles import convert_tracks
+
+# =============================================================================
+# [Sleekes Subtitle Conversion Benchmark]
+#
+# 자막 변환 경로 두 가지의 소요 시간을 비교합니다.
+#   1. ffmpeg : 트랙마다 ffmpeg 프로세스 1개 (이전 방식)
+#   2. native : 순수 파이썬 변환기로 모든 트랙을 한 번에 (현재 방식)
+#
+# 자동 번역 자막이 많은 영상을 흉내 내기 위해, 지정한 개수의 VTT 트랙을 임시 폴더에 생성해
+# 두 경로로 각각 변환합니다. ffmpeg가 없으면 native 경로만 측정합니다.
+#
+# 사용법:
+#   python -m sleekes.cli.subtitle_bench [--tracks 100] [--cues 600] [--rounds 3]
+# =============================================================================
+
+def _stamp(ms: int) -> str:
+    return f"{ms // 3600000:02d}:{ms // 60000 % 60:02d}:{ms // 1000 % 60:02d}.{ms % 1000:03d}"
+
+def write_sample_tracks(folder: str, tracks: int, cues: int) -> List[str]:
+    """YouTube 자동 자막과 비슷한 형태(<c> 태그, 단어별 타임스탬프)의 VTT 트랙을 생성합니다."""
+    paths = []
+    for n in range(tracks):
+        path = os.path.join(folder, f"sample.lang{n:03d}.vtt")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("WEBVTT\nKind: captions\nLanguage: xx\n\n")
+            for i in range(cues):
+                start, end = i * 2000, i * 2000 + 1900
+                f.write(f"{_stamp(start)} --> {_stamp(end)} align:start position:0%\n")
+                f.write(f"line {i}<{_stamp(start + 500)}><c> of</c><{_stamp(start + 900)}><c> track &amp; {n}</c>\n\n")
+        paths.append(path)
+    return paths
+
+def run_native(paths: List[str]) -> float:
+    started = time.perf_counter()
+    _, failed = convert_tracks(paths)
+    if failed:
+        raise RuntimeError(f"native conversion failed: {failed[0]}")
+    return time.perf_counter() - started
+
+def run_ffmpeg(ffmpeg: str, paths: List[str]) -> float:
+    started = time.perf_counter()
+    for src in paths:
+        dst = os.path.splitext(src)[0] + ".srt"
+        subprocess.run([ffmpeg, "-y", "-nostdin", "-loglevel", "error", "-i", src, dst], check=True)
+        os.remove(src)
+    return time.perf_counter() - started
+
+def measure(tracks: int, cues: int, rounds: int) -> Dict[str, float]:
+    """
+    각 경로를 rounds번 실행하여 가장 빠른 시간(초)을 반환합니다.
+
+    Returns:
+        dict: {"native": 초, "ffmpeg": 초 (ffmpeg가 없으면 생략)}
+    """
+    ffmpeg = shutil.which("ffmpeg")
+    runners = {"native": run_native}
+    if ffmpeg:
+        runners["ffmpeg"] = lambda paths: run_ffmpeg(ffmpeg, paths)
+
+    results = {}
+    for name, runner in runners.items():
+        best = None
+        for _ in range(rounds):
+            with tempfile.TemporaryDirectory(prefix="sleekes-subbench-") as folder:
+                elapsed = runner(write_sample_tracks(folder, tracks, cues))
+            best = elapsed if best is None else min(best, elapsed)
+        results[name] = best
+    return results
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Sleekes 자막 변환(VTT -> SRT) 벤치마크")
+    parser.add_argument("--tracks", type=int, default=100, help="영상 하나의 자막 트랙 수 (기본값: 100)")
+    parser.add_argument("--cues", type=int, default=600, help="트랙당 큐 개수 (기본값: 600, 약 20분 분량)")
+    parser.add_argument("--rounds", type=int, default=3, help="반복 횟수 (가장 빠른 값 사용)")
+    args = parser.parse_args()
+
+    results = measure(args.tracks, args.cues, args.rounds)
+
+    print(f"--- Sleekes Subtitle Conversion Report ({args.tracks} tracks x {args.cues} cues) ---")
+    for name, seconds in results.items():
+        print(f"{name:>8}: {seconds * 1000:10.1f}ms ({seconds * 1000 / args.tracks:.2f}ms/track)")
+    if "ffmpeg" in results:
+        print(f"native 경로가 {results['ffmpeg'] / results['native']:.1f}배 빠릅니다.")
+    else:
+        print("ffmpeg를 찾을 수 없어 native 경로만 측정했습니다.")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+import argparse
+import os
+import sys
+import time
+from typing import List, Optional
+
+from sleekes.core.config import load_settings
+from sleekes.core.manifest import DEFAULT_WORKERS, archive_folders, verify_folders
+
+# =============================================================================
+# [Sleekes Archive Verify]
+#
+# 아카이브 폴더의 체크섬 매니페스트(.sleekes_manifest.json)와 실제 파일을 대조하는 하위 명령입니다.
+# 기본은 크기/수정 시각이 바뀐 파일만 다시 해시하는 증분 검사이고, --full이면 모든 파일을 다시 읽습니다.
+# 문제가 하나라도 있으면 종료 코드 1을 반환하므로 cron 등에서 주기적으로 돌리기 좋습니다.
+#
+# 사용법:
+#   python main.py verify [폴더...] [--root Archives] [--full] [--workers 8] [--build]
+# =============================================================================
+
+def main(argv: Optional[List[str]] = None):
+    settings = load_settings()
+
+    parser = argparse.ArgumentParser(prog="main.py verify", description="Sleekes 아카이브 무결성 검사")
+    parser.add_argument("folders", nargs="*", help="검사할 아카이브 폴더 (생략하면 --root 아래 전체)")
+    parser.add_argument("--root", default=settings.get("last_path", "Archives"),
+                        help="아카이브 루트 폴더 (기본값: 마지막 사용 경로)")
+    parser.add_argument("--full", action="store_true", help="전체 스크럽: 크기/시각이 그대로인 파일까지 모두 다시 해시")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS,
+                        help=f"동시에 해시할 파일 수 (기본값: {DEFAULT_WORKERS})")
+    parser.add_argument("--build", action="store_true", help="매니페스트가 없는 폴더(이전 버전 아카이브)에 새로 생성")
+    args = parser.parse_args(argv)
+
+    folders = args.folders or archive_folders(args.root)
+    print(f"--- Sleekes Verify ({'full scrub' if args.full else 'changed files only'}, {len(folders)} folder(s)) ---")
+
+    started = time.perf_counter()
+    results = verify_folders(folders, full=args.full, workers=args.workers, build_missing=args.build, log=print)
+    elapsed = time.perf_counter() - started
+
+    checked = sum(r["checked"] for r in results.values())
+    problems = sum(len(r["problems"]) for r in results.values())
+    without = [folder for folder, r in results.items() if not r["manifest"]]
+    built = sum(1 for r in results.values() if r["built"])
+    untracked = sum(len(r["untracked"]) for r in results.values())
+
+    print("-" * 40)
+    print(f"[요약] {checked} file(s) re-hashed, {problems} problem(s), {built} manifest(s) created, "
+          f"{untracked} untracked file(s) in {elapsed:.1f}s")
+    if without:
+        print(f"매니페스트가 없는 폴더 {len(without)}개는 검사하지 못했습니다. (--build로 생성)")
+        for folder in without[:10]:
+            print(f"  - {os.path.basename(folder)}")
+    if problems:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
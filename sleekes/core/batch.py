@@ -0,0 +1,162 @@
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Deque, Dict, Iterable, Iterator, Optional, Tuple
+from urllib.parse import urlparse
+
+from sleekes.core.downloader import SleekesDownloader
+from sleekes.core.progress import format_bytes
+
+# =============================================================================
+# [Sleekes Batch Runner]
+#
+# 여러 URL을 하나의 프로세스에서 병렬로 아카이빙하기 위한 작업 실행기입니다.
+# URL은 파일/표준입력에서 한 줄씩 스트리밍으로 읽어 들이며, 전체 목록을 메모리에
+# 올리지 않고 제한된 개수(workers)만큼만 동시에 실행합니다.
+#
+# 주요 기능:
+# 1. 고정 크기 워커 풀 (ThreadPoolExecutor) + 대기열 상한 (backpressure)
+# 2. 호스트별 동시 실행 상한 (같은 사이트에 과도한 요청 방지)
+#    상한에 걸린 URL은 워커를 차지하지 않고 호스트별 대기열에서 기다리다가,
+#    같은 호스트의 작업이 끝나는 즉시 풀에 들어갑니다. (다른 호스트의 작업은 막히지 않음)
+# 3. 최종 요약 리포트 (성공 / 실패 / 건너뜀, 전송 바이트, 소요 시간)
+# =============================================================================
+
+def iter_batch_urls(lines: Iterable[str]) -> Iterator[str]:
+    """
+    배치 입력에서 URL을 하나씩 꺼냅니다.
+    빈 줄과 '#'으로 시작하는 주석 줄은 무시합니다.
+
+    Args:
+        lines (Iterable[str]): 파일 객체 또는 sys.stdin 등 줄 단위 입력
+    """
+    for line in lines:
+        url = line.strip()
+        if url and not url.startswith("#"):
+            yield url
+
+def host_key(url: str) -> str:
+    """
+    호스트별 동시 실행 제한에 사용할 키를 반환합니다. (www./m. 접두어 제거)
+    """
+    host = (urlparse(url).hostname or "").lower()
+    for prefix in ("www.", "m."):
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+    return host or "unknown"
+
+class BatchRunner:
+    def __init__(self, workers: int = 2, per_host: int = 1, log_callback: Optional[Callable] = None):
+        self.workers = max(1, workers)
+        self.per_host = max(1, per_host)
+        self.log_callback = log_callback
+
+        self._lock = threading.Lock()
+        # 호스트별 실행 중인 작업 수 / 상한 때문에 대기 중인 작업
+        self._running: Dict[str, int] = {}
+        self._parked: Dict[str, Deque[Tuple]] = {}
+        self.stats = {"succeeded": 0, "failed": 0, "skipped": 0, "bytes": 0, "elapsed": 0.0}
+
+    def _log(self, message: str):
+        if self.log_callback:
+            self.log_callback(message)
+
+    def _count(self, key: str, amount: int = 1):
+        with self._lock:
+            self.stats[key] += amount
+
+    def _run_one(self, job_no: int, url: str, output_path: str, options: dict):
+        prefix = f"[#{job_no}]"
+
+        def on_progress(d):
+            # 파일 하나가 끝날 때마다 실제 전송된 바이트를 합산합니다
+            if d['status'] == 'finished':
+                self._count("bytes", d['total'] or d['downloaded'])
+
+        downloader = SleekesDownloader(
+            progress_callback=on_progress,
+            log_callback=lambda msg: self._log(f"{prefix} {msg}")
+        )
+
+        self._log(f"{prefix} START: {url}")
+        try:
+            success = downloader.download(url, output_path, options)
+        except Exception as e:
+            self._log(f"{prefix} ERROR: {str(e)}")
+            success = False
+
+        if success and downloader.skipped:
+            self._count("skipped")
+        else:
+            self._count("succeeded" if success else "failed")
+
+    def run(self, urls: Iterable[str], output_path: str, options: dict) -> dict:
+        """
+        URL 스트림을 워커 풀로 처리하고 요약 통계를 반환합니다.
+
+        Args:
+            urls (Iterable[str]): 처리할 URL (지연 평가 가능)
+            output_path (str): 저장 경로
+            options (dict): SleekesDownloader.download()에 전달할 옵션
+
+        Returns:
+            dict: succeeded, failed, skipped, bytes, elapsed(초)
+        """
+        started = time.monotonic()
+        seen = set()
+
+        # 실행 중 + 대기 중(호스트 대기열 포함)인 작업 수를 제한하여
+        # 입력이 아무리 길어도 메모리 사용량이 일정하게 유지되도록 합니다.
+        # 한 호스트의 URL이 이어져도 뒤따르는 다른 호스트의 URL을 읽어 들일 수 있도록 넉넉히 둡니다.
+        limit = self.workers * 4
+        in_flight = threading.BoundedSemaphore(limit)
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="sleekes-batch") as pool:
+            def submit(key, job):
+                future = pool.submit(self._run_one, *job)
+                future.add_done_callback(lambda _: finished(key))
+
+            def finished(key):
+                # 같은 호스트의 대기 작업이 있으면 방금 비운 자리를 그대로 넘깁니다
+                with self._lock:
+                    queue = self._parked.get(key)
+                    job = queue.popleft() if queue else None
+                    if job is None:
+                        self._running[key] -= 1
+                in_flight.release()
+                if job is not None:
+                    submit(key, job)
+
+            for job_no, url in enumerate(urls, start=1):
+                if url in seen:
+                    self._log(f"[#{job_no}] SKIP: Duplicate URL in batch ({url})")
+                    self._count("skipped")
+                    continue
+                seen.add(url)
+
+                in_flight.acquire()
+                key, job = host_key(url), (job_no, url, output_path, options)
+                with self._lock:
+                    ready = self._running.get(key, 0) < self.per_host
+                    if ready:
+                        self._running[key] = self._running.get(key, 0) + 1
+                    else:
+                        self._parked.setdefault(key, deque()).append(job)
+                if ready:
+                    submit(key, job)
+
+            # 대기열의 작업은 완료 콜백에서 풀에 들어가므로, 모두 끝날 때까지 풀을 닫지 않습니다
+            for _ in range(limit):
+                in_flight.acquire()
+
+        self.stats["elapsed"] = time.monotonic() - started
+        return self.stats
+
+def format_summary(stats: dict) -> str:
+    """배치 실행 결과를 사람이 읽기 쉬운 한 줄 요약으로 변환합니다."""
+    elapsed = int(stats["elapsed"])
+    return (
+        f"성공 {stats['succeeded']} / 실패 {stats['failed']} / 건너뜀 {stats['skipped']} | "
+        f"전송 {format_bytes(stats['bytes'])} | 소요 {elapsed // 3600:02d}:{elapsed % 3600 // 60:02d}:{elapsed % 60:02d}"
+    )
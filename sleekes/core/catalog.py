@@ -0,0 +1,272 @@
+import os
+import sqlite3
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sleekes.core.config import SETTINGS_DIR
+from sleekes.core import storage
+
+# =============================================================================
+# [Sleekes Archive Catalog]
+#
+# Archives 폴더 아래에 쌓인 info.json을 모아 제목/채널/업로드 날짜/설명으로 검색할 수 있게 해주는
+# SQLite 카탈로그입니다. (settings/archive_catalog.db)
+#
+# - 영상 하나(info.json 하나)가 한 행이며, 제목/채널/설명/태그는 FTS5 전문 검색 테이블에 들어갑니다.
+# - 스캔은 증분 방식입니다. 폴더의 수정 시각(mtime)이 그대로면 폴더 안을 열어보지도 않고,
+#   바뀐 폴더라도 info.json들의 (이름, 크기, 수정 시각)이 같으면 다시 파싱하지 않습니다.
+#   (영상 파일만 추가된 경우 등) 사라진 폴더는 카탈로그에서도 지웁니다.
+# - download()가 끝날 때마다 해당 아카이브 폴더 하나만 다시 읽어 카탈로그를 갱신합니다.
+# - info.json의 압축본(.gz/.xz/.zst)도 sleekes.core.storage를 통해 그대로 읽습니다.
+# - 폴더/루트 경로는 실제 절대 경로(realpath)로 저장합니다. 같은 루트를 상대 경로와 절대 경로로
+#   번갈아 스캔해도 한 번만 기록되고, 사라진 폴더도 표기와 관계없이 지워집니다.
+# =============================================================================
+
+CATALOG_FILE = os.path.join(SETTINGS_DIR, "archive_catalog.db")
+
+INFO_SUFFIX = ".info.json"
+
+RESULT_KEYS = ("folder", "info_path", "extractor", "video_id", "title", "channel", "upload_date", "duration")
+
+# 경로 정규화를 도입한 스키마 버전 (PRAGMA user_version)
+SCHEMA_VERSION = 2
+
+# 스캔 도중 이 개수만큼 폴더를 처리할 때마다 커밋합니다 (중단되어도 진행분 보존)
+COMMIT_EVERY = 500
+
+def normalize_path(path: str) -> str:
+    """카탈로그에 저장하고 비교할 경로 표기 (심볼릭 링크를 푼 절대 경로)"""
+    return os.path.realpath(path)
+
+def _info_files(folder: str) -> List[os.DirEntry]:
+    """폴더 안의 info.json(압축본 포함) 목록을 이름순으로 반환합니다."""
+    try:
+        with os.scandir(folder) as it:
+            entries = [e for e in it if e.is_file() and storage.strip_codec(e.name).endswith(INFO_SUFFIX)]
+    except OSError:
+        return []
+    return sorted(entries, key=lambda e: e.name)
+
+def _signature(entries: Iterable[os.DirEntry]) -> str:
+    parts = []
+    for entry in entries:
+        st = entry.stat()
+        parts.append(f"{entry.name}:{st.st_size}:{st.st_mtime_ns}")
+    return "|".join(parts)
+
+def _fts_query(text: str) -> str:
+    """사용자 입력을 FTS5 문법 오류가 나지 않도록 단어별 접두어 검색으로 바꿉니다."""
+    terms = [t.replace('"', '""') for t in text.split()]
+    return " ".join(f'"{t}"*' for t in terms if t)
+
+class ArchiveCatalog:
+    def __init__(self, path: str = CATALOG_FILE):
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        # 다운로드 작업과 검색이 동시에 열 수 있으므로 인덱스 DB와 같은 WAL 모드를 사용합니다
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(
+            "CREATE TABLE IF NOT EXISTS folders ("
+            " path TEXT PRIMARY KEY,"
+            " root TEXT NOT NULL,"
+            " mtime_ns INTEGER NOT NULL,"
+            " signature TEXT NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS folders_root ON folders (root);"
+            "CREATE TABLE IF NOT EXISTS videos ("
+            " id INTEGER PRIMARY KEY,"
+            " folder TEXT NOT NULL,"
+            " info_path TEXT NOT NULL UNIQUE,"
+            " extractor TEXT,"
+            " video_id TEXT,"
+            " title TEXT,"
+            " channel TEXT,"
+            " upload_date TEXT,"
+            " duration REAL);"
+            "CREATE INDEX IF NOT EXISTS videos_folder ON videos (folder);"
+            "CREATE INDEX IF NOT EXISTS videos_upload_date ON videos (upload_date);"
+            "CREATE INDEX IF NOT EXISTS videos_video_id ON videos (extractor, video_id);"
+            "CREATE VIRTUAL TABLE IF NOT EXISTS videos_fts USING fts5("
+            " title, channel, description, tags, tokenize = 'unicode61 remove_diacritics 2');"
+        )
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] < SCHEMA_VERSION:
+            self._normalize_stored_paths()
+            self.conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.commit()
+
+    def _normalize_stored_paths(self):
+        """
+        이전 버전이 입력 그대로 저장한 경로를 정리합니다. (최초 1회)
+        정규화된 표기와 다른 폴더 기록은 지우고, 해당 폴더는 다음 스캔에서 정규화된 경로로 다시 읽힙니다.
+        """
+        stale = [path for path, root in self.conn.execute("SELECT path, root FROM folders").fetchall()
+                 if normalize_path(path) != path or normalize_path(root) != root]
+        for path in stale:
+            self._drop_folder(path)
+
+    # --- 스캔 ---
+
+    def _drop_folder(self, folder: str):
+        ids = [row[0] for row in self.conn.execute("SELECT id FROM videos WHERE folder = ?", (folder,))]
+        self.conn.executemany("DELETE FROM videos_fts WHERE rowid = ?", [(i,) for i in ids])
+        self.conn.execute("DELETE FROM videos WHERE folder = ?", (folder,))
+        self.conn.execute("DELETE FROM folders WHERE path = ?", (folder,))
+
+    def _parse_folder(self, folder: str, entries: List[os.DirEntry]) -> int:
+        count = 0
+        for entry in entries:
+            path = os.path.join(folder, entry.name)
+            try:
+                info = storage.read_json(path)
+            except (OSError, ValueError, EOFError):
+                continue
+            # 재생목록/채널 자체의 info.json은 영상이 아니므로 제외합니다
+            if not isinstance(info, dict) or info.get("_type") in ("playlist", "multi_video"):
+                continue
+            cur = self.conn.execute(
+                "INSERT INTO videos (folder, info_path, extractor, video_id, title, channel, upload_date, duration)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (folder, path, (info.get("extractor_key") or info.get("extractor") or "").lower(), info.get("id"),
+                 info.get("title"), info.get("channel") or info.get("uploader"),
+                 info.get("upload_date"), info.get("duration"))
+            )
+            self.conn.execute(
+                "INSERT INTO videos_fts (rowid, title, channel, description, tags) VALUES (?, ?, ?, ?, ?)",
+                (cur.lastrowid, info.get("title") or "", info.get("channel") or info.get("uploader") or "",
+                 info.get("description") or "", " ".join(t for t in info.get("tags") or [] if isinstance(t, str)))
+            )
+            count += 1
+        return count
+
+    def update_folder(self, folder: str, root: Optional[str] = None, mtime_ns: Optional[int] = None) -> bool:
+        """
+        아카이브 폴더 하나를 카탈로그에 반영합니다. (커밋은 호출자 또는 commit()에서)
+
+        Returns:
+            bool: info.json을 다시 파싱했으면 True
+        """
+        folder = normalize_path(folder)
+        if not os.path.isdir(folder):
+            self._drop_folder(folder)
+            return False
+        if mtime_ns is None:
+            mtime_ns = os.stat(folder).st_mtime_ns
+        root = normalize_path(root) if root is not None else os.path.dirname(folder)
+
+        entries = _info_files(folder)
+        signature = _signature(entries)
+        row = self.conn.execute("SELECT signature FROM folders WHERE path = ?", (folder,)).fetchone()
+        changed = row is None or row[0] != signature
+        if changed:
+            self._drop_folder(folder)
+            self._parse_folder(folder, entries)
+        self.conn.execute(
+            "INSERT INTO folders (path, root, mtime_ns, signature) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (path) DO UPDATE SET root = excluded.root, mtime_ns = excluded.mtime_ns, signature = excluded.signature",
+            (folder, root, mtime_ns, signature)
+        )
+        return changed
+
+    def scan(self, root: str) -> Dict[str, int]:
+        """
+        아카이브 루트(예: Archives) 아래의 폴더를 증분 스캔합니다.
+
+        Returns:
+            dict: {"folders": 전체 폴더 수, "parsed": 다시 읽은 폴더 수, "removed": 지운 폴더 수}
+        """
+        root = normalize_path(root)
+        known = dict(self.conn.execute("SELECT path, mtime_ns FROM folders WHERE root = ?", (root,)))
+        stats = {"folders": 0, "parsed": 0, "removed": 0}
+        seen = set()
+
+        try:
+            with os.scandir(root) as it:
+                entries = [e for e in it if e.is_dir() and not e.name.startswith(".")]
+        except OSError:
+            # 루트에 접근할 수 없으면(외장 디스크 분리 등) 기존 기록을 지우지 않습니다
+            return stats
+
+        for entry in entries:
+            folder = os.path.join(root, entry.name)
+            seen.add(folder)
+            stats["folders"] += 1
+            try:
+                mtime_ns = entry.stat().st_mtime_ns
+            except OSError:
+                continue
+            # 폴더 mtime이 같으면 안의 파일 목록도 그대로이므로 열어보지 않습니다
+            if known.get(folder) == mtime_ns:
+                continue
+            if self.update_folder(folder, root, mtime_ns):
+                stats["parsed"] += 1
+            if stats["parsed"] and stats["parsed"] % COMMIT_EVERY == 0:
+                self.conn.commit()
+
+        for folder in set(known) - seen:
+            self._drop_folder(folder)
+            stats["removed"] += 1
+        self.conn.commit()
+        return stats
+
+    def commit(self):
+        self.conn.commit()
+
+    # --- 조회 ---
+
+    def roots(self) -> List[str]:
+        return [row[0] for row in self.conn.execute("SELECT DISTINCT root FROM folders")]
+
+    def has_root(self, root: str) -> bool:
+        """루트가 한 번이라도 스캔되었는지 확인합니다. (경로 표기와 관계없이)"""
+        return self.conn.execute("SELECT 1 FROM folders WHERE root = ? LIMIT 1", (normalize_path(root),)).fetchone() is not None
+
+    def _where(self, text: Optional[str], channel: Optional[str], date_from: Optional[str],
+               date_to: Optional[str]) -> Tuple[str, str, list]:
+        """(FROM 절, WHERE 절, 인자)를 만듭니다. 검색어가 있으면 FTS 테이블과 조인합니다."""
+        source, clauses, params = "videos v", [], []
+        query = _fts_query(text or "")
+        if query:
+            source = "videos_fts JOIN videos v ON v.id = videos_fts.rowid"
+            clauses.append("videos_fts MATCH ?")
+            params.append(query)
+        if channel:
+            clauses.append("v.channel LIKE ?")
+            params.append(f"%{channel}%")
+        if date_from:
+            clauses.append("v.upload_date >= ?")
+            params.append(date_from.replace("-", ""))
+        if date_to:
+            clauses.append("v.upload_date <= ?")
+            params.append(date_to.replace("-", ""))
+        return source, (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def search(self, text: Optional[str] = None, channel: Optional[str] = None, date_from: Optional[str] = None,
+               date_to: Optional[str] = None, limit: int = 50, offset: int = 0) -> List[dict]:
+        """
+        카탈로그를 검색합니다. 검색어가 있으면 관련도순, 없으면 최신 업로드순으로 정렬합니다.
+
+        Args:
+            text (str): 제목/채널/설명/태그 검색어 (단어별 접두어 일치, 모든 단어 포함)
+            channel (str): 채널명 부분 일치
+            date_from, date_to (str): 업로드 날짜 범위 (YYYYMMDD 또는 YYYY-MM-DD)
+            limit, offset (int): 페이지 범위
+
+        Returns:
+            list: {"folder", "info_path", "extractor", "video_id", "title", "channel", "upload_date", "duration"}
+        """
+        source, where, params = self._where(text, channel, date_from, date_to)
+        order = "bm25(videos_fts), v.id" if _fts_query(text or "") else "v.upload_date DESC, v.id DESC"
+        rows = self.conn.execute(
+            f"SELECT {', '.join('v.' + k for k in RESULT_KEYS)} FROM {source}{where} ORDER BY {order} LIMIT ? OFFSET ?",
+            params + [limit, offset]
+        )
+        return [dict(zip(RESULT_KEYS, row)) for row in rows]
+
+    def count(self, text: Optional[str] = None, channel: Optional[str] = None, date_from: Optional[str] = None,
+              date_to: Optional[str] = None) -> int:
+        source, where, params = self._where(text, channel, date_from, date_to)
+        return self.conn.execute(f"SELECT COUNT(*) FROM {source}{where}", params).fetchone()[0]
+
+    def close(self):
+        self.conn.close()
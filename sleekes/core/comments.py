@@ -0,0 +1,303 @@
+import glob
+import itertools
+import json
+import os
+from collections import deque
+from typing import Callable, Iterator, List, Optional, Set, Tuple
+
+from sleekes.core.config import write_json_atomic
+from sleekes.core import storage
+
+# =============================================================================
+# [Sleekes Comment Sidecar]
+#
+# yt-dlp의 기본 댓글 수집(getcomments)은 댓글 트리 전체를 info_dict 안의 리스트로 모은 뒤
+# info.json에 한 번에 기록하므로, 댓글이 수십만 개인 영상에서는 메모리가 수 GB까지 늘어납니다.
+#
+# 이 모듈은 댓글을 받는 즉시 영상별 JSONL 사이드카(<제목>.comments.jsonl)에 한 줄씩 기록하여
+# 댓글 수와 관계없이 메모리 사용량을 일정하게 유지합니다.
+#
+# 체크포인트(<제목>.comments.ckpt.json):
+#   - 수집을 시작할 때 먼저 만들고, 일정 개수마다 '디스크에 확정된 바이트 위치'를 갱신합니다.
+#   - 수집이 끝나면 삭제합니다. (사이드카만 있고 체크포인트가 없으면 완료된 수집)
+#   - 확정 위치와 함께 그 위치 직전에 기록한 댓글 ID 몇 개(recent_ids, 최대 RESUME_ANCHORS개)를 남깁니다.
+#   - 중단된 수집을 다시 실행하면 확정 위치 이후의 잘린 기록을 버리고, 다시 받는 스트림의
+#     예상 위치(count) 앞뒤 RESUME_SLACK개 범위를 버퍼에 담아 recent_ids 중 가장 나중에 기록한 댓글을 찾은 뒤
+#     그 다음부터 이어서 기록합니다. 이미 받은 댓글 ID를 모두 모아두지 않으므로 이어받기도 메모리가 일정합니다.
+#     (yt-dlp의 댓글 생성기는 이어받기 토큰을 노출하지 않으므로 앞쪽 페이지는 다시 요청합니다.
+#      마지막 댓글이 삭제되었으면 그 앞의 기록된 댓글을 기준으로 삼고, 범위 안에서 하나도 찾지 못하면
+#      예상 위치(count)부터 기록합니다. 어느 경우에도 버퍼의 댓글을 확인 없이 버리지 않습니다)
+#
+# 새 댓글 갱신(refresh):
+#   이미 아카이빙한 영상의 사이드카에서 가장 최근 댓글들을 찾은 뒤, 댓글을 최신순으로 받다가
+#   이미 저장된 (고정되지 않은) 최상위 댓글을 만나면 즉시 중단하고 새 댓글만 덧붙입니다.
+#   기존 스레드에 새로 달린 답글은 최신순 목록에 나타나지 않으므로 갱신 대상이 아닙니다.
+#   갱신을 시작할 때 체크포인트에 시작 위치를 남기고, 도중에 중단되면 다음 실행에서 그 위치까지 되돌려 다시 갱신합니다.
+#
+# 압축 저장:
+#   수집/갱신이 끝난 사이드카는 선택한 형식(gzip/xz/zstd)으로 압축할 수 있으며,
+#   읽기와 갱신은 압축 여부와 관계없이 동작합니다. (갱신 시에는 잠시 풀었다가 다시 압축)
+# =============================================================================
+
+SIDECAR_SUFFIX = ".comments.jsonl"
+CHECKPOINT_SUFFIX = ".comments.ckpt.json"
+CHECKPOINT_EVERY = 200
+# 이어받을 때 기준 댓글을 찾는 범위 (이미 기록한 개수 앞뒤로 이만큼)
+RESUME_SLACK = 1000
+# 체크포인트에 남기는 최근 댓글 ID 수 (마지막 댓글이 삭제되어도 그 앞의 댓글로 위치를 찾습니다)
+RESUME_ANCHORS = 20
+
+# 갱신 시 '최근 댓글'로 간주할 범위 (YouTube 댓글 시각은 "2일 전" 같은 근사값이므로 여유를 둡니다)
+RECENT_WINDOW = 2 * 24 * 3600
+# 저장된 댓글을 끝내 만나지 못할 때(최근 댓글이 모두 삭제된 경우 등) 중단할 기준
+STALE_LIMIT = 30 * 24 * 3600
+
+def iter_sidecar(path: str) -> Iterator[dict]:
+    """사이드카(압축본 포함)의 댓글을 한 줄씩 읽습니다. 잘린 줄(기록 도중 중단)은 건너뜁니다."""
+    actual = storage.resolve(path)
+    if actual is None:
+        return
+    with storage.open_file(actual, "rt") as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+def _is_top_level(comment: dict) -> bool:
+    return comment.get("parent", "root") == "root"
+
+def _skip_recorded(comments: Iterator[dict], count: int, anchors: List[str]) -> Iterator[dict]:
+    """
+    중단된 수집을 이어받을 때, 다시 받는 스트림에서 이미 기록한 댓글을 건너뛰고 나머지를 돌려줍니다.
+
+    Args:
+        comments: 처음부터 다시 받는 댓글 스트림
+        count (int): 이미 기록한 댓글 수
+        anchors (list): 마지막으로 기록한 댓글 ID들 (오래된 것부터)
+    """
+    comments = iter(comments)
+    if not anchors:
+        # 이전 형식의 체크포인트: 앞에서부터 count개
+        yield from itertools.islice(comments, count, None)
+        return
+
+    rank = {cid: i for i, cid in enumerate(anchors)}
+    low, high = max(0, count - RESUME_SLACK), count + RESUME_SLACK
+    window = []
+    best = None  # (rank, window 안의 위치)
+    for position, comment in enumerate(comments):
+        if position < low:
+            continue
+        window.append(comment)
+        r = rank.get(comment.get("id"))
+        if r is not None and (best is None or r >= best[0]):
+            best = (r, len(window) - 1)
+            if r == len(anchors) - 1:
+                break
+        if position + 1 >= high:
+            break
+
+    # 기준 댓글을 찾았으면 그 다음부터, 찾지 못했으면 예상 위치부터 기록합니다
+    start = best[1] + 1 if best is not None else count - low
+    for comment in window[start:]:
+        if comment.get("id") not in rank:
+            yield comment
+    yield from comments
+
+def find_sidecar(folder: str, video_id: str) -> Optional[str]:
+    """
+    폴더에서 video_id의 사이드카 기준 경로(확장자 제외)를 찾습니다.
+    영상 제목이 바뀌어 파일명이 달라진 경우를 위해 info.json의 ID로 대조합니다.
+    """
+    for info_path in glob.glob(os.path.join(glob.escape(folder), "*.info.json*")):
+        base = storage.strip_codec(info_path)[:-len(".info.json")]
+        if not storage.resolve(base + SIDECAR_SUFFIX):
+            continue
+        try:
+            if storage.read_json(info_path).get("id") == video_id:
+                return base
+        except (OSError, ValueError, EOFError):
+            continue
+    return None
+
+class CommentSidecar:
+    def __init__(self, base_path: str, codec: Optional[str] = None):
+        """
+        Args:
+            base_path (str): 확장자를 뺀 영상 파일 경로 (예: .../Title)
+            codec (str): 수집이 끝난 사이드카를 압축할 형식 (None이면 평문 유지)
+        """
+        self.path = base_path + SIDECAR_SUFFIX
+        self.checkpoint_path = base_path + CHECKPOINT_SUFFIX
+        self.codec = codec
+
+    def is_complete(self) -> bool:
+        return storage.resolve(self.path) is not None and not os.path.exists(self.checkpoint_path)
+
+    def count(self) -> int:
+        return sum(1 for _ in iter_sidecar(self.path))
+
+    def _unpack(self):
+        """기록을 이어가기 위해 압축된 사이드카를 평문으로 풉니다."""
+        actual = storage.resolve(self.path)
+        if actual and actual != self.path:
+            storage.decompress_file(actual)
+
+    def _pack(self):
+        if self.codec and os.path.exists(self.path):
+            storage.compress_file(self.path, self.codec)
+
+    def _load_checkpoint(self) -> dict:
+        try:
+            with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {"offset": 0, "count": 0}
+
+    def _commit(self, f, count: int, recent_ids: Optional[List[str]] = None):
+        f.flush()
+        os.fsync(f.fileno())
+        state = {"offset": f.tell(), "count": count, "mode": "capture"}
+        if recent_ids:
+            state["recent_ids"] = recent_ids
+        write_json_atomic(self.checkpoint_path, state)
+
+    def _recent_window(self) -> Tuple[Optional[int], Set[str]]:
+        """가장 최근 최상위 댓글의 시각과, 그 근처(RECENT_WINDOW) 최상위 댓글 ID 목록을 구합니다."""
+        newest = None
+        for comment in iter_sidecar(self.path):
+            if _is_top_level(comment) and comment.get("timestamp") is not None:
+                newest = max(newest or 0, comment["timestamp"])
+        if newest is None:
+            return None, {c.get("id") for c in iter_sidecar(self.path) if _is_top_level(c)}
+        return newest, {
+            c.get("id") for c in iter_sidecar(self.path)
+            if _is_top_level(c) and (c.get("timestamp") or 0) >= newest - RECENT_WINDOW
+        }
+
+    def refresh(self, comments: Iterator[dict]) -> int:
+        """
+        최신순 댓글 스트림에서 저장된 댓글보다 새로운 것만 사이드카에 덧붙입니다.
+        사이드카가 없거나 이전 수집이 중단된 상태라면 일반 수집(capture)으로 처리합니다.
+
+        Args:
+            comments: 최신순으로 정렬된 댓글 스트림
+
+        Returns:
+            int: 새로 추가한 댓글 수
+        """
+        self._unpack()
+        if os.path.exists(self.path) and self._load_checkpoint().get("mode") == "refresh":
+            # 중단된 갱신: 갱신을 시작한 위치까지 되돌린 뒤 처음부터 다시 갱신합니다
+            # (중간까지 덧붙인 새 댓글을 남겨두면 다음 갱신이 그 댓글에서 멈춰 그보다 오래된 새 댓글을 놓칩니다)
+            with open(self.path, "r+b") as f:
+                f.truncate(self._load_checkpoint()["offset"])
+            os.remove(self.checkpoint_path)
+        if not self.is_complete():
+            # 중단된 수집: 확정 위치 이후의 잘린 기록은 capture()가 버리므로 확정된 개수를 기준으로 셉니다
+            before = self._load_checkpoint()["count"] if os.path.exists(self.checkpoint_path) else self.count()
+            return self.capture(comments) - before
+
+        newest, recent_ids = self._recent_window()
+        count = self.count()
+        added = 0
+        with open(self.path, "ab") as f:
+            write_json_atomic(self.checkpoint_path, {"offset": f.tell(), "count": count, "mode": "refresh"})
+            for comment in comments:
+                top, pinned = _is_top_level(comment), comment.get("is_pinned")
+                if comment.get("id") in recent_ids:
+                    if top and not pinned:
+                        break
+                    continue
+                if top and not pinned and newest is not None and comment.get("timestamp") is not None \
+                        and comment["timestamp"] < newest - STALE_LIMIT:
+                    break
+                f.write((json.dumps(comment, ensure_ascii=False) + "\n").encode("utf-8"))
+                added += 1
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.remove(self.checkpoint_path)
+        self._pack()
+        return added
+
+    def capture(self, comments: Iterator[dict]) -> int:
+        """
+        댓글 스트림을 사이드카에 기록합니다. 완료된 사이드카면 수집하지 않습니다.
+
+        Returns:
+            int: 사이드카에 기록된 전체 댓글 수
+        """
+        if self.is_complete():
+            return self.count()
+
+        self._unpack()
+        state = {"offset": 0, "count": 0}
+        if os.path.exists(self.path) and os.path.exists(self.checkpoint_path):
+            # 중단된 수집: 확정된 위치까지만 남기고, 다시 받는 스트림에서 마지막으로 확정한 댓글 뒤부터 기록합니다
+            state = self._load_checkpoint()
+            with open(self.path, "r+b") as f:
+                f.truncate(state["offset"])
+        else:
+            write_json_atomic(self.checkpoint_path, state)
+
+        count = state["count"]
+        anchors = state.get("recent_ids") or ([state["last_id"]] if state.get("last_id") else [])
+        recent = deque(anchors, maxlen=RESUME_ANCHORS)
+        if count:
+            comments = _skip_recorded(comments, count, anchors)
+        with open(self.path, "ab") as f:
+            for comment in comments:
+                f.write((json.dumps(comment, ensure_ascii=False) + "\n").encode("utf-8"))
+                count += 1
+                recent.append(comment.get("id"))
+                if count % CHECKPOINT_EVERY == 0:
+                    self._commit(f, count, recent_ids=list(recent))
+            self._commit(f, count, recent_ids=list(recent))
+
+        os.remove(self.checkpoint_path)
+        self._pack()
+        return count
+
+class CommentStream:
+    """
+    yt-dlp의 '__post_extractor'를 대신하는 호출 가능 객체입니다.
+    댓글 생성기를 보관해 두었다가, 사이드카가 연결되어 있으면 사이드카로 흘려보내고
+    연결되지 않았으면 yt-dlp 기본 동작(리스트로 수집)을 그대로 따릅니다.
+    """
+
+    def __init__(self, generator: Iterator[dict], disabled_errors: Tuple[type, ...] = (), fatal_errors: Tuple[type, ...] = (),
+                 log: Optional[Callable[[str], None]] = None):
+        self.generator = generator
+        self.disabled_errors = disabled_errors
+        self.fatal_errors = fatal_errors
+        self.log = log
+        self.sidecar: Optional[CommentSidecar] = None
+        # True이면 전체 수집 대신 새 댓글만 덧붙입니다 (댓글이 최신순으로 들어와야 함)
+        self.refresh = False
+
+    def _log(self, message: str):
+        if self.log:
+            self.log(message)
+
+    def __call__(self) -> dict:
+        try:
+            if self.sidecar is None:
+                comments = list(self.generator)
+                return {"comments": comments, "comment_count": len(comments)}
+            if self.refresh:
+                added = self.sidecar.refresh(self.generator)
+                total = self.sidecar.count()
+                self._log(f"COMMENTS: {added} new comment(s) merged ({total} total)")
+                return {"comment_count": total}
+            # info.json에는 댓글 본문 대신 개수만 남깁니다 (본문은 사이드카에 있음)
+            return {"comment_count": self.sidecar.capture(self.generator)}
+        except self.disabled_errors:
+            return {"comments": None, "comment_count": None}
+        except self.fatal_errors:
+            raise
+        except Exception as e:
+            # 댓글 수집 실패가 영상 다운로드까지 막지 않도록 기록만 하고 넘어갑니다
+            self._log(f"COMMENTS ERROR: {str(e)}")
+            return {"comment_count": None}
@@ -1,11 +1,15 @@
+import atexit
 import json
 import os
+import sys
+import threading
 
 # =============================================================================
 # [Sleekes Configuration Manager]
 # 
 # 이 모듈은 애플리케이션의 사용자 설정(Settings)을 관리합니다.
 # 설정을 JSON 파일로 저장하고 불러오며, 파일이 없을 경우 기본값을 생성합니다.
+# 설정은 메모리에 캐시되며, 파일 쓰기는 지연·병합되어 원자적으로 수행됩니다.
 # =============================================================================
 
 SETTINGS_DIR = "settings"
@@ -16,6 +20,9 @@ DEFAULT_SETTINGS = {
     "archive_mode": True,       # 전체 아카이빙 모드 켜기
     "only_audio": False,        # 오디오 전용 끄기
     "skip_download": False,     # 영상 생략 끄기
+    "native_container": False,  # 네이티브 컨테이너(재인코딩 없음) 끄기
+    "sub_langs": "orig",        # 자막 언어 우선순위 (원본 자막만, 자동 번역 제외)
+    "compress_metadata": None,  # info.json/댓글 압축 안 함
     "sleep_interval": 5,        # 기본 휴식 시간 5초
     "max_sleep_interval": 10,   # 최대 랜덤 휴식 10초
     "cookie_browser": "None",   # 쿠키 브라우저 없음
@@ -24,69 +31,205 @@ DEFAULT_SETTINGS = {
     "last_path": os.getcwd()    # 마지막 사용 경로는 현재 폴더
 }
 
+def write_json_atomic(path, data, indent=4):
+    """
+    JSON 파일을 원자적으로 저장합니다.
+    임시 파일에 먼저 기록한 뒤 os.replace로 교체하므로, 저장 도중 프로세스가 죽어도
+    기존 파일이 반쯤 쓰인 상태로 남지 않습니다.
+
+    Args:
+        path (str): 저장할 파일 경로
+        data: JSON으로 직렬화할 데이터
+        indent (int): 들여쓰기 (None이면 한 줄로 저장)
+    """
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory, exist_ok=True)
+
+    # 같은 프로세스의 여러 스레드(지연 저장 타이머, 종료 시 flush 등)가 동시에 저장해도 겹치지 않도록
+    # 임시 파일 이름에 스레드 ID를 넣습니다
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+class SettingsStore:
+    """
+    설정 파일을 한 번만 읽어 메모리에 보관하고, 저장 요청은 모아서(debounce) 기록하는 저장소입니다.
+    CLI와 GUI가 같은 인스턴스(모듈 전역 _store)를 공유합니다.
+
+    - 읽기: 최초 1회만 파일을 파싱하고 이후에는 메모리 사본을 반환합니다.
+    - 쓰기: 마지막 저장 요청 후 delay초 동안 추가 요청이 없을 때 백그라운드 타이머 스레드에서
+      한 번만 기록합니다. (UI 스레드를 막지 않음)
+    - 종료: atexit에서 flush()를 호출하여 대기 중인 변경 사항을 잃지 않습니다.
+    - 오류: 백그라운드 저장 실패는 log_callback(없으면 표준 오류)으로 알립니다.
+    """
+    def __init__(self, path=SETTINGS_FILE, delay=0.5):
+        self.path = path
+        self.delay = delay
+        self.log_callback = None
+        self._lock = threading.RLock()
+        self._data = None
+        self._dirty = False
+        self._timer = None
+
+    def _ensure_loaded(self):
+        if self._data is not None:
+            return
+
+        # 설정 파일이 없으면 기본값으로 생성
+        if not os.path.exists(self.path):
+            self._data = dict(DEFAULT_SETTINGS)
+            self._dirty = True
+            self._schedule()
+            return
+
+        # 파일 읽기 시도
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                self._data = json.load(f)
+        except (OSError, ValueError):
+            # 읽기 실패 시(JSON 깨짐 등) 기본값 사용
+            self._data = dict(DEFAULT_SETTINGS)
+
+    def _schedule(self):
+        if self._timer:
+            self._timer.cancel()
+        self._timer = threading.Timer(self.delay, self._flush_in_background)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def load(self):
+        """메모리에 보관된 설정의 사본을 반환합니다."""
+        with self._lock:
+            self._ensure_loaded()
+            return dict(self._data)
+
+    def save(self, settings):
+        """설정을 메모리에 반영하고 지연 저장을 예약합니다. 변경이 없으면 아무것도 하지 않습니다."""
+        with self._lock:
+            self._ensure_loaded()
+            if settings == self._data:
+                return
+            self._data = dict(settings)
+            self._dirty = True
+            self._schedule()
+
+    def flush(self):
+        """예약된 저장을 즉시 수행합니다."""
+        with self._lock:
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return
+            write_json_atomic(self.path, self._data)
+            self._dirty = False
+
+    def _flush_in_background(self):
+        # 타이머 스레드의 예외는 아무도 받지 않으므로 여기서 기록합니다.
+        # 변경 사항은 dirty로 남아 다음 저장 요청이나 종료 시 flush()에서 다시 시도됩니다.
+        try:
+            self.flush()
+        except OSError as e:
+            message = f"WARNING: Could not save settings to {self.path}: {str(e)}"
+            if self.log_callback:
+                self.log_callback(message)
+            else:
+                print(message, file=sys.stderr)
+
+_store = SettingsStore()
+atexit.register(_store.flush)
+
 def load_settings():
     """
-    설정 파일(config.json)을 읽어 딕셔너리로 반환합니다.
-    파일이 없거나 손상된 경우 기본값(DEFAULT_SETTINGS)을 반환하고 파일을 새로 생성합니다.
+    설정(config.json)을 딕셔너리로 반환합니다.
+    파일은 프로세스당 최초 1회만 읽으며, 없거나 손상된 경우 기본값(DEFAULT_SETTINGS)을 사용합니다.
 
     Returns:
-        dict: 설정 딕셔너리
+        dict: 설정 딕셔너리 (호출자가 자유롭게 수정해도 되는 사본)
     """
-    # 설정 폴더가 없으면 생성
-    if not os.path.exists(SETTINGS_DIR):
-        os.makedirs(SETTINGS_DIR)
-    
-    # 설정 파일이 없으면 기본값으로 생성 후 반환
-    if not os.path.exists(SETTINGS_FILE):
-        save_settings(DEFAULT_SETTINGS)
-        return DEFAULT_SETTINGS
-    
-    # 파일 읽기 시도
-    try:
-        with open(SETTINGS_FILE, "r", encoding="utf-8") as f:
-            return json.load(f)
-    except:
-        # 읽기 실패 시(JSON 깨짐 등) 기본값 반환
-        return DEFAULT_SETTINGS
+    return _store.load()
 
 def save_settings(settings):
     """
-    주어진 설정 딕셔너리를 파일에 저장합니다.
+    주어진 설정 딕셔너리를 저장합니다.
+    실제 파일 기록은 짧은 지연 후 한 번으로 합쳐지며(coalesce), 원자적으로 수행됩니다.
 
     Args:
         settings (dict): 저장할 설정 데이터
     """
-    if not os.path.exists(SETTINGS_DIR):
-        os.makedirs(SETTINGS_DIR)
-        
-    with open(SETTINGS_FILE, "w", encoding="utf-8") as f:
-        json.dump(settings, f, indent=4, ensure_ascii=False)
+    _store.save(settings)
+
+def flush_settings():
+    """대기 중인 설정 저장을 즉시 파일에 반영합니다. (앱 종료 시 등)"""
+    _store.flush()
+
+def set_settings_log_callback(callback):
+    """
+    백그라운드 설정 저장이 실패했을 때 메시지를 받을 콜백을 지정합니다. (None이면 표준 오류로 출력)
+    콜백은 저장 타이머 스레드에서 호출되므로 GUI는 시그널 등으로 UI 스레드에 넘겨야 합니다.
+    """
+    _store.log_callback = callback
+
+COUNTER_DB = os.path.join(SETTINGS_DIR, "counters.db")
+LEGACY_COUNTER_FILE = os.path.join(SETTINGS_DIR, "counters.json")
+
+def _legacy_counter(today):
+    """
+    이전 버전의 counters.json에 기록된 오늘 카운트를 읽습니다. (최초 1회 마이그레이션용)
+    """
+    try:
+        with open(LEGACY_COUNTER_FILE, "r", encoding="utf-8") as f:
+            saved = json.load(f)
+        if saved.get("date") == today:
+            return int(saved.get("count", 0))
+    except (OSError, ValueError, TypeError):
+        pass
+    return 0
 
 def get_next_counter():
     """
     YYYYMMDD_XXXX 형식의 XXXX를 위한 일일 카운터를 관리합니다.
     날짜가 바뀌면 1로 초기화됩니다.
+
+    여러 Sleekes 프로세스/스레드가 동시에 호출해도 중복 번호가 나오지 않도록
+    SQLite의 즉시 잠금 트랜잭션(BEGIN IMMEDIATE) 안에서 읽기-증가-쓰기를 수행합니다.
+    트랜잭션은 원자적으로 커밋되므로 중간에 프로세스가 죽어도 파일이 손상되지 않습니다.
     """
-    counter_file = os.path.join(SETTINGS_DIR, "counters.json")
+    import sqlite3
     from datetime import datetime
     today = datetime.now().strftime("%Y%m%d")
-    
-    data = {"date": today, "count": 0}
-    if os.path.exists(counter_file):
-        try:
-            with open(counter_file, "r", encoding="utf-8") as f:
-                saved = json.load(f)
-                if saved.get("date") == today:
-                    data = saved
-        except:
-            pass
-            
-    data["count"] += 1
-    
+
     if not os.path.exists(SETTINGS_DIR):
-        os.makedirs(SETTINGS_DIR)
-        
-    with open(counter_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=4)
-        
-    return f"{data['count']:04d}"
+        os.makedirs(SETTINGS_DIR, exist_ok=True)
+
+    # isolation_level=None: 트랜잭션 경계를 직접 제어합니다
+    conn = sqlite3.connect(COUNTER_DB, timeout=60, isolation_level=None)
+    try:
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("CREATE TABLE IF NOT EXISTS counters (date TEXT PRIMARY KEY, count INTEGER NOT NULL)")
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT count FROM counters WHERE date = ?", (today,)).fetchone()
+            count = (row[0] if row else _legacy_counter(today)) + 1
+            conn.execute("INSERT OR REPLACE INTO counters (date, count) VALUES (?, ?)", (today, count))
+            conn.execute("DELETE FROM counters WHERE date <> ?", (today,))
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+    finally:
+        conn.close()
+
+    return f"{count:04d}"
@@ -0,0 +1,330 @@
+import errno
+import glob
+import os
+import shutil
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, List, Optional
+
+from sleekes.core.config import SETTINGS_DIR, write_json_atomic
+from sleekes.core.comments import SIDECAR_SUFFIX
+from sleekes.core.manifest import (MANIFEST_NAME, MANIFEST_VERSION, HASH_ALGORITHM, DEFAULT_WORKERS,
+                                   hash_file, list_files, load_manifest)
+from sleekes.core import storage
+
+# =============================================================================
+# [Sleekes Deduplication]
+#
+# 같은 영상이 여러 재생목록/채널 폴더에 아카이빙될 때 내용을 한 벌만 디스크에 두는 모듈입니다.
+#
+# 1. 영상 ID 기준 (다운로드 전, 대역폭 절약)
+#    아카이브 인덱스에 이미 다른 폴더에 완료로 기록된 영상은 yt-dlp가 건너뛰는데, 이때 원래 폴더의
+#    파일을 현재 폴더에 링크로 채워 넣어 폴더마다 온전한 아카이브를 유지합니다. (materialize_video)
+#
+# 2. 내용 해시 기준 (다운로드 후, 디스크 절약)
+#    매니페스트의 해시를 내용 주소로 삼아 settings/content_store.db에 기록하고,
+#    새로 받은 파일과 같은 내용이 이미 있으면 새 파일을 기존 파일의 링크로 바꿉니다. (dedupe_folder)
+#    --force로 다시 받은 영상, 인덱스 도입 이전 아카이브는 오프라인 dedupe 명령으로 정리합니다. (dedupe_tree)
+#
+# 링크 방식: reflink(쓰기 시 복사, btrfs/XFS 등)를 먼저 시도하고, 지원하지 않으면 하드링크를 씁니다.
+# 나중에 제자리에서 수정될 수 있는 메타데이터(info.json, 댓글 사이드카)는 링크하지 않고 복사합니다.
+# =============================================================================
+
+CONTENT_STORE_FILE = os.path.join(SETTINGS_DIR, "content_store.db")
+
+# 이보다 작은 파일은 링크로 얻는 이득보다 관리 비용이 크므로 대상에서 제외합니다
+MIN_DEDUPE_SIZE = 1024 * 1024
+
+# Linux ioctl FICLONE (_IOW(0x94, 9, int))
+FICLONE = 0x40049409
+
+_MUTABLE_SUFFIXES = (".info.json", SIDECAR_SUFFIX)
+
+def _is_mutable(name: str) -> bool:
+    return storage.strip_codec(name).endswith(_MUTABLE_SUFFIXES)
+
+def _reflink(src: str, dst: str) -> bool:
+    """src를 dst로 reflink합니다. 지원하지 않는 환경/파일 시스템이면 False."""
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+        return True
+    except OSError:
+        try:
+            os.remove(dst)
+        except OSError:
+            pass
+        return False
+
+def link_file(src: str, dst: str) -> str:
+    """
+    dst를 src와 같은 내용의 링크로 만듭니다. (dst가 있으면 원자적으로 교체)
+
+    Returns:
+        str: "reflink" 또는 "hardlink"
+
+    Raises:
+        OSError: 두 방식 모두 불가능한 경우 (다른 디스크 등)
+    """
+    tmp = dst + ".sleekes-link.tmp"
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    if _reflink(src, tmp):
+        shutil.copystat(src, tmp)
+        mode = "reflink"
+    else:
+        os.link(src, tmp)
+        mode = "hardlink"
+    os.replace(tmp, dst)
+    return mode
+
+def _same_inode(a: os.stat_result, b: os.stat_result) -> bool:
+    return a.st_dev == b.st_dev and a.st_ino == b.st_ino
+
+def video_files(folder: str, video_id: str) -> List[str]:
+    """
+    폴더에서 video_id에 속한 파일 이름 목록을 찾습니다. (info.json의 ID로 기준 파일명을 찾은 뒤
+    그 이름으로 시작하는 파일들. 다른 영상의 제목이 이 영상 제목으로 시작하는 경우도 구분합니다)
+    """
+    bases = {}
+    for info_path in glob.glob(os.path.join(glob.escape(folder), "*.info.json*")):
+        name = os.path.basename(storage.strip_codec(info_path))[:-len(".info.json")]
+        try:
+            bases[name] = storage.read_json(info_path).get("id")
+        except (OSError, ValueError, EOFError):
+            continue
+    if video_id not in bases.values():
+        return []
+
+    files = []
+    for name in list_files(folder):
+        owner = max((b for b in bases if name.startswith(b + ".")), key=len, default=None)
+        if owner is not None and bases[owner] == video_id:
+            files.append(name)
+    return sorted(files)
+
+def _adopt_manifest_entries(folder: str, entries: Dict[str, dict]):
+    """다른 폴더에서 가져온 파일의 해시를 현재 폴더의 매니페스트에 미리 넣어 다시 해시하지 않게 합니다."""
+    manifest = load_manifest(folder) or {"version": MANIFEST_VERSION, "algorithm": HASH_ALGORITHM, "files": {}}
+    for name, entry in entries.items():
+        st = os.stat(os.path.join(folder, name))
+        manifest["files"][name] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": entry["hash"]}
+    manifest["files"] = dict(sorted(manifest["files"].items()))
+    write_json_atomic(os.path.join(folder, MANIFEST_NAME), manifest, indent=None)
+
+def materialize_video(video_id: str, src_folder: str, dst_folder: str) -> Dict[str, int]:
+    """
+    다른 폴더에 이미 있는 영상의 파일을 현재 폴더에 링크(메타데이터는 복사)로 채웁니다.
+    현재 폴더에 같은 이름의 파일이 있으면 건드리지 않습니다.
+
+    Returns:
+        dict: {"linked": 링크한 파일 수, "copied": 복사한 파일 수, "bytes": 링크로 아낀 바이트}
+    """
+    stats = {"linked": 0, "copied": 0, "bytes": 0}
+    src_manifest = (load_manifest(src_folder) or {}).get("files", {})
+    adopted = {}
+    for name in video_files(src_folder, video_id):
+        src, dst = os.path.join(src_folder, name), os.path.join(dst_folder, name)
+        if os.path.exists(dst):
+            continue
+        st = os.stat(src)
+        if _is_mutable(name):
+            shutil.copy2(src, dst)
+            stats["copied"] += 1
+        else:
+            try:
+                link_file(src, dst)
+            except OSError:
+                shutil.copy2(src, dst)
+                stats["copied"] += 1
+            else:
+                stats["linked"] += 1
+                stats["bytes"] += st.st_size
+        entry = src_manifest.get(name)
+        if entry and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+            adopted[name] = entry
+    if adopted:
+        _adopt_manifest_entries(dst_folder, adopted)
+    return stats
+
+class ContentStore:
+    """내용 해시 -> 파일 경로 기록 (settings/content_store.db)"""
+
+    def __init__(self, path: str = CONTENT_STORE_FILE):
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS blobs ("
+            " path TEXT PRIMARY KEY,"
+            " hash TEXT NOT NULL,"
+            " size INTEGER NOT NULL)"
+        )
+        self.conn.execute("CREATE INDEX IF NOT EXISTS blobs_hash ON blobs (hash, size)")
+        self.conn.commit()
+
+    def add(self, path: str, digest: str, size: int):
+        self.conn.execute(
+            "INSERT INTO blobs (path, hash, size) VALUES (?, ?, ?) "
+            "ON CONFLICT (path) DO UPDATE SET hash = excluded.hash, size = excluded.size",
+            (path, digest, size)
+        )
+
+    def find(self, digest: str, size: int, exclude: str) -> Optional[str]:
+        """같은 내용의 다른 파일 경로를 찾습니다. 더 이상 맞지 않는 기록은 지웁니다."""
+        for (path,) in self.conn.execute("SELECT path FROM blobs WHERE hash = ? AND size = ?", (digest, size)).fetchall():
+            if os.path.abspath(path) == os.path.abspath(exclude):
+                continue
+            try:
+                if os.path.getsize(path) == size:
+                    return path
+            except OSError:
+                pass
+            self.conn.execute("DELETE FROM blobs WHERE path = ?", (path,))
+        return None
+
+    def commit(self):
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+def dedupe_folder(folder: str, manifest: dict, store: ContentStore) -> Dict[str, int]:
+    """
+    방금 매니페스트를 만든 폴더의 파일을 내용 저장소와 대조해, 이미 있는 내용이면 링크로 바꿉니다.
+    폴더의 파일은 모두 내용 저장소에 기록됩니다.
+
+    Returns:
+        dict: {"linked": 링크로 바꾼 파일 수, "bytes": 아낀 바이트}
+    """
+    stats = {"linked": 0, "bytes": 0}
+    touched = False
+    for name, entry in manifest["files"].items():
+        if entry["size"] < MIN_DEDUPE_SIZE or _is_mutable(name):
+            continue
+        path = os.path.join(folder, name)
+        existing = store.find(entry["hash"], entry["size"], path)
+        if existing:
+            try:
+                if not _same_inode(os.stat(existing), os.stat(path)):
+                    link_file(existing, path)
+                    stats["linked"] += 1
+                    stats["bytes"] += entry["size"]
+                    # 하드링크는 원본의 수정 시각을 따르므로 매니페스트도 맞춰 둡니다
+                    entry["mtime_ns"] = os.stat(path).st_mtime_ns
+                    touched = True
+            except OSError:
+                pass
+        store.add(path, entry["hash"], entry["size"])
+    store.commit()
+    if touched:
+        write_json_atomic(os.path.join(folder, MANIFEST_NAME), manifest, indent=None)
+    return stats
+
+def dedupe_tree(folders: List[str], workers: int = DEFAULT_WORKERS, dry_run: bool = False,
+                store: Optional[ContentStore] = None, log: Optional[Callable[[str], None]] = None) -> Dict[str, int]:
+    """
+    여러 아카이브 폴더에서 내용이 같은 파일을 찾아 가장 오래된 파일 하나로 링크합니다.
+
+    크기가 같은 파일이 둘 이상인 경우에만 해시하며, 매니페스트의 해시가 최신이면 그대로 씁니다.
+
+    Returns:
+        dict: {"files": 검사한 파일 수, "hashed": 새로 해시한 수, "linked": 링크한 수, "bytes": 아낀 바이트, "failed": 링크 실패 수}
+    """
+    stats = {"files": 0, "hashed": 0, "linked": 0, "bytes": 0, "failed": 0}
+
+    # 1. 크기별로 묶기 (이미 같은 inode인 파일은 한 번만)
+    by_size: Dict[int, Dict[tuple, tuple]] = {}
+    manifests = {}
+    for folder in folders:
+        try:
+            files = list_files(folder)
+        except OSError:
+            continue
+        manifests[folder] = load_manifest(folder)
+        for name, st in files.items():
+            if st.st_size < MIN_DEDUPE_SIZE or _is_mutable(name):
+                continue
+            stats["files"] += 1
+            by_size.setdefault(st.st_size, {}).setdefault((st.st_dev, st.st_ino), (folder, name, st))
+    candidates = [f for group in by_size.values() if len(group) > 1 for f in group.values()]
+
+    # 2. 후보만 해시 (매니페스트에 최신 해시가 있으면 재사용, 없으면 병렬 계산)
+    digests, to_hash = {}, []
+    for folder, name, st in candidates:
+        entry = ((manifests.get(folder) or {}).get("files") or {}).get(name)
+        if entry and entry["size"] == st.st_size and entry["mtime_ns"] == st.st_mtime_ns:
+            digests[(folder, name)] = entry["hash"]
+        else:
+            to_hash.append((folder, name))
+
+    def run(item):
+        try:
+            return hash_file(os.path.join(*item))
+        except OSError:
+            return None
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="sleekes-hash") as pool:
+        for item, digest in zip(to_hash, pool.map(run, to_hash)):
+            if digest:
+                digests[item] = digest
+    stats["hashed"] = len(to_hash)
+
+    # 3. 같은 내용끼리 묶어 가장 오래된 파일을 원본으로 링크
+    groups: Dict[tuple, list] = {}
+    for folder, name, st in candidates:
+        digest = digests.get((folder, name))
+        if digest:
+            groups.setdefault((digest, st.st_size), []).append((st.st_mtime_ns, folder, name))
+
+    touched = set()
+    for (digest, size), members in groups.items():
+        members.sort()
+        _, keep_folder, keep_name = members[0]
+        keep = os.path.join(keep_folder, keep_name)
+        if store:
+            store.add(keep, digest, size)
+        for _, folder, name in members[1:]:
+            path = os.path.join(folder, name)
+            if dry_run:
+                stats["linked"] += 1
+                stats["bytes"] += size
+                continue
+            try:
+                mode = link_file(keep, path)
+            except OSError as e:
+                stats["failed"] += 1
+                if log:
+                    reason = "different filesystem" if e.errno == errno.EXDEV else str(e)
+                    log(f"DEDUPE ERROR: {os.path.basename(folder)}/{name}: {reason}")
+                continue
+            stats["linked"] += 1
+            stats["bytes"] += size
+            touched.add(folder)
+            if log:
+                log(f"DEDUPE: {os.path.basename(folder)}/{name} -> {os.path.basename(keep_folder)} ({mode})")
+            if store:
+                store.add(path, digest, size)
+
+    # 4. 링크로 수정 시각이 바뀐 파일의 매니페스트 기록을 맞춥니다 (내용은 같으므로 해시는 그대로)
+    for folder in touched:
+        manifest = manifests.get(folder)
+        if not manifest:
+            continue
+        for name, entry in manifest["files"].items():
+            try:
+                st = os.stat(os.path.join(folder, name))
+            except OSError:
+                continue
+            if st.st_size == entry["size"] and (folder, name) in digests and digests[(folder, name)] == entry["hash"]:
+                entry["mtime_ns"] = st.st_mtime_ns
+        write_json_atomic(os.path.join(folder, MANIFEST_NAME), manifest, indent=None)
+
+    if store:
+        store.commit()
+    return stats
@@ -1,85 +1,431 @@
 import os
-import yt_dlp
+import threading
 from typing import Callable, Optional
 from sleekes.core.uastream import get_random_ua
+from sleekes.core.progress import ProgressThrottle, DEFAULT_INTERVAL
+from sleekes.core.postproc import PostProcessPool, create_enqueue_pp, cpu_report, load_cpu_ratio, record_transcode_cost
+from sleekes.core.subtitles import DEFAULT_SUB_LANGS, parse_sub_langs, select_tracks, fetch_tracks
+from sleekes.core.comments import CommentSidecar, CommentStream, find_sidecar
+from sleekes.core import storage
+from sleekes.core.journal import SessionJournal, session_interrupted, STAGE_EXTRACTED, STAGE_DOWNLOADED, STAGE_POSTPROCESSED, STAGE_FINISHED, STAGE_BROKEN
 
 # =============================================================================
 # [Sleekes Core Downloader]
 # 
 # 이 모듈은 Sleekes의 핵심 엔진으로, yt-dlp 라이브러리를 래핑(Wrapping)하여
 # 실질적인 다운로드 및 아카이빙 작업을 수행합니다.
+#
+# yt_dlp는 import 비용이 크므로 모듈 상단이 아닌 실제 추출 시점에 로드합니다.
+# (CLI의 --info/help 등 다운로드가 없는 경로의 기동 시간을 보호)
 # =============================================================================
 
+# 네이티브 컨테이너 모드의 영상 포맷: 같은 계열의 영상/오디오만 짝지어 스트림 복사로 병합합니다
+NATIVE_FORMAT = 'bestvideo*[ext=mp4]+bestaudio[ext=m4a]/bestvideo*[ext=webm]+bestaudio[ext=webm]/best'
+
 class SleekesDownloader:
-    def __init__(self, progress_callback: Optional[Callable] = None, log_callback: Optional[Callable] = None):
+    def __init__(self, progress_callback: Optional[Callable] = None, log_callback: Optional[Callable] = None,
+                 progress_interval: float = DEFAULT_INTERVAL):
+        """
+        Args:
+            progress_callback: 진행률 레코드(sleekes.core.progress 참고)를 받는 콜백
+            log_callback: 로그 문자열을 받는 콜백
+            progress_interval: 'downloading' 레코드 전달 최소 간격(초)
+        """
         self.progress_callback = progress_callback
         self.log_callback = log_callback
+        self.throttle = ProgressThrottle(progress_interval)
 
-    def _progress_hook(self, d):
-        if self.progress_callback:
-            self.progress_callback(d)
-        
-        if d['status'] == 'finished':
+        # 협조적 취소/일시정지 제어
+        # 진행률 훅과 재생목록 항목 사이(match_filter)에서 상태를 확인합니다.
+        self._cancel_event = threading.Event()
+        self._resume_event = threading.Event()
+        self._resume_event.set()
+
+        # 현재 세션의 진행 저널 (폴더가 결정된 뒤 연결됨)
+        self._journal = None
+        # 현재 세션의 아카이브 인덱스와 변환 풀 상태
+        # _converting: 변환이 끝나지 않았거나(None) 실패한(False) 영상 ID
+        # _awaiting: yt-dlp가 처리를 마쳤지만 변환을 기다리는 영상 ID -> 추출기 (변환 성공 시 완료 기록)
+        self._index = None
+        self._pp_lock = threading.Lock()
+        self._converting = {}
+        self._awaiting = {}
+        self._finish_on_move = False
+        # 자막 트랙 선택/동시 수집 설정 (download() 중에만 유효)
+        self._ydl = None
+        self._sub_langs = []
+        self._sub_workers = 4
+        # 댓글 갱신 모드 여부 (download() 중에만 유효)
+        self._refresh_comments = False
+        # info.json / 댓글 사이드카 압축 형식 (None이면 평문)
+        self._compress = None
+        # 오디오 추출 모드의 변환 결과 확장자 (None이면 추출하지 않음)
+        self._audio_ext = None
+        # 이번 세션에서 받은 미디어 파일 (세션 후 검증 대상) / 검증에서 손상으로 확인된 항목
+        self._media = []
+        self._broken = []
+        # 이번 세션에서 다른 폴더로부터 링크한 영상 ID (중복 조회 시 한 번만 링크)
+        self._linked = set()
+        # 직전 download() 호출이 인덱스에 의해 건너뛰어졌는지 여부 (일괄 처리 통계용)
+        self.skipped = False
+        # 이번 세션에서 파일 이동(MoveFiles)까지 마친 항목 수
+        self._moved = 0
+
+    # --- 취소 / 일시정지 / 재개 ---
+
+    def cancel(self):
+        """실행 중인 작업을 다음 확인 지점에서 중단합니다. 받던 .part 파일은 이어받기를 위해 남겨둡니다."""
+        self._cancel_event.set()
+        self._resume_event.set()
+
+    def pause(self):
+        """다음 확인 지점에서 작업을 멈추고 resume() 또는 cancel()까지 대기합니다."""
+        self._resume_event.clear()
+
+    def resume(self):
+        self._resume_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel_event.is_set()
+
+    @property
+    def paused(self) -> bool:
+        return not self._resume_event.is_set()
+
+    def _checkpoint(self):
+        # 일시정지 중이면 재개/취소될 때까지 대기
+        self._resume_event.wait()
+        if self._cancel_event.is_set():
+            # DownloadCancelled는 ignoreerrors 설정과 무관하게 yt-dlp 밖으로 전파됩니다
+            from yt_dlp.utils import DownloadCancelled
+            raise DownloadCancelled('Cancelled by user')
+
+    def _entry_filter(self, info_dict, incomplete=False):
+        """
+        yt-dlp match_filter: 재생목록 항목을 처리하기 직전마다 호출되는 확인 지점입니다.
+        incomplete=True는 상세 추출 전(평면 정보), False는 상세 추출 직후 호출을 뜻합니다.
+        """
+        self._checkpoint()
+
+        journal = self._journal
+        video_id = info_dict.get('id')
+        if journal and video_id:
+            if incomplete:
+                # 저널에 완료로 기록된 항목은 상세 추출 없이 건너뜁니다 (중단 지점으로 빨리 감기)
+                if journal.is_finished(video_id):
+                    return f"{video_id}: already finished in this session (journal)"
+            elif info_dict.get('_type', 'video') == 'video':
+                journal.record(STAGE_EXTRACTED, video_id)
+
+        # 댓글 수집(post_extract) 직전: 댓글 스트림을 이 영상의 사이드카에 연결합니다
+        comments = info_dict.get('__post_extractor')
+        if isinstance(comments, CommentStream) and self._ydl:
+            base = os.path.splitext(self._ydl.prepare_filename(info_dict))[0]
+            if self._refresh_comments:
+                # 아카이빙 이후 제목이 바뀌었을 수 있으므로 기존 사이드카를 ID로 찾습니다
+                base = find_sidecar(os.path.dirname(base), video_id) or base
+                comments.refresh = True
+            comments.sidecar = CommentSidecar(base, codec=self._compress)
+
+        # 상세 추출 직후, 자막 파일을 기록하기 전에 받을 트랙을 고르고 동시에 내려받습니다
+        if not incomplete and info_dict.get('requested_subtitles') is not None:
+            self._select_subtitles(info_dict)
+        return None
+
+    def _wrap_comment_extraction(self, ie):
+        """
+        추출기의 댓글 수집을 CommentStream으로 바꿉니다.
+        yt-dlp는 댓글 전체를 리스트로 모으지만, CommentStream은 받는 즉시 사이드카에 기록합니다.
+        """
+        from yt_dlp.utils import DownloadCancelled
+
+        def checked(comments):
+            # 댓글 수집은 오래 걸릴 수 있으므로 댓글마다 취소/일시정지를 확인합니다
+            for comment in comments:
+                self._checkpoint()
+                yield comment
+
+        def extract_comments(*args, **kwargs):
+            if not ie.get_param('getcomments'):
+                return None
+            return CommentStream(
+                checked(ie._get_comments(*args, **kwargs)),
+                disabled_errors=(ie.CommentsDisabled,),
+                fatal_errors=(DownloadCancelled,),
+                log=self.log_callback
+            )
+        ie.extract_comments = extract_comments
+
+    def _create_ydl(self, ydl_opts: dict):
+        """추출기가 생성될 때마다 댓글 수집을 스트리밍 방식으로 바꾸는 YoutubeDL을 만듭니다."""
+        import yt_dlp
+        downloader = self
+
+        class SleekesYoutubeDL(yt_dlp.YoutubeDL):
+            def add_info_extractor(self, ie):
+                super().add_info_extractor(ie)
+                if not isinstance(ie, type):
+                    downloader._wrap_comment_extraction(ie)
+
+        return SleekesYoutubeDL(ydl_opts)
+
+    def _fetch_subtitle(self, track: dict) -> str:
+        from yt_dlp.networking import Request
+        with self._ydl.urlopen(Request(track['url'], headers=track.get('http_headers') or {})) as resp:
+            return resp.read().decode('utf-8', 'replace')
+
+    def _select_subtitles(self, info_dict):
+        """언어 우선순위 목록으로 requested_subtitles를 다시 고르고, 트랙 내용을 병렬로 미리 받아둡니다."""
+        if not self._sub_langs or not self._ydl:
+            return
+        tracks = select_tracks(info_dict.get('subtitles'), info_dict.get('automatic_captions'), self._sub_langs)
+
+        # 이어받기: 이미 디스크에 있는 트랙은 다시 받지 않습니다.
+        # 변환된 SRT가 있으면 요청에서 빼고(원본 VTT는 변환 후 지워짐), 원본이 있으면 yt-dlp가 그 파일을 재사용합니다
+        base = os.path.splitext(self._ydl.prepare_filename(info_dict))[0]
+        to_fetch, present = {}, 0
+        for lang, track in list(tracks.items()):
+            if os.path.exists(f"{base}.{lang}.srt"):
+                del tracks[lang]
+                present += 1
+            elif os.path.exists(f"{base}.{lang}.{track.get('ext')}"):
+                present += 1
+            else:
+                track.setdefault('http_headers', info_dict.get('http_headers'))
+                to_fetch[lang] = track
+        failed = fetch_tracks(to_fetch, self._fetch_subtitle, self._sub_workers)
+        info_dict['requested_subtitles'] = tracks
+
+        if to_fetch and self.log_callback:
+            self.log_callback(f"SUBS: {len(to_fetch) - len(failed)}/{len(to_fetch)} track(s) fetched in parallel ({', '.join(to_fetch)})")
+        if present and self.log_callback:
+            self.log_callback(f"SUBS: {present} track(s) already on disk. Skipping.")
+
+    def _postprocessor_hook(self, d):
+        name = d.get('postprocessor')
+        info = d.get('info_dict') or {}
+        video_id = info.get('id')
+
+        # 변환 작업을 풀에 넘기기 직전: 변환이 끝날 때까지 인덱스에 완료로 기록하지 않도록 표시합니다
+        if name == 'SleekesEnqueue' and d.get('status') == 'started' and video_id:
+            with self._pp_lock:
+                self._converting[video_id] = None
+        if d.get('status') != 'finished':
+            return
+
+        if name == 'MoveFiles':
+            self._moved += 1
+        # 파일 이동이 끝나면 info.json을 compact 형식으로 압축합니다 (메타데이터 전용 모드 포함)
+        if name == 'MoveFiles' and self._compress:
+            self._compress_info_json(info)
+        # 미디어를 실제로 받은 경우에만 세션 후 검증 대상으로 기록합니다
+        if name == 'MoveFiles' and self._ydl and not self._ydl.params.get('skip_download'):
+            self._collect_media(info)
+
+        if not self._journal or name == 'SleekesEnqueue':
+            return
+        # 메타데이터 전용 모드에서는 변환 풀을 거치지 않으므로 MoveFiles가 항목의 마지막 단계입니다
+        if name == 'MoveFiles' and self._finish_on_move:
+            self._journal.record(STAGE_FINISHED, video_id)
+        else:
+            self._journal.record(STAGE_POSTPROCESSED, video_id, pp=name)
+
+    def _collect_media(self, info: dict):
+        path = info.get('filepath')
+        if not path or not info.get('id'):
+            return
+        audio_only = info.get('vcodec') in (None, 'none') or self._audio_ext is not None
+        self._media.append({
+            "id": info['id'],
+            "extractor": info.get('extractor_key') or info.get('extractor'),
+            "url": info.get('webpage_url') or info.get('original_url'),
+            "path": path,
+            "duration": info.get('duration'),
+            "video": not audio_only,
+            "audio": info.get('acodec') not in (None, 'none'),
+        })
+
+    def _validate_media(self, options: dict, index) -> list:
+        """
+        세션에서 받은 미디어 파일을 검증하고, 손상된 항목은 다시 받을 수 있도록 되돌립니다.
+        (손상된 파일 삭제, 저널에 broken 기록, 인덱스를 pending으로)
+
+        Returns:
+            list: 손상된 항목 목록
+        """
+        from sleekes.core.validate import MediaValidator
+
+        items = {}
+        for item in self._media:
+            # 오디오 추출 모드에서는 변환 풀이 원본을 지우고 변환본을 남깁니다
+            if self._audio_ext and not os.path.exists(item["path"]):
+                item["path"] = os.path.splitext(item["path"])[0] + '.' + self._audio_ext
+            items[item["path"]] = item
+        self._media = []
+
+        validator = MediaValidator(workers=options.get('validate_workers', 2), log_callback=self.log_callback)
+        broken = validator.validate(list(items.values()))
+        if validator.available and self.log_callback:
+            self.log_callback(f"VALIDATE: {len(items)} media file(s) checked, {len(broken)} broken.")
+
+        for item in broken:
             if self.log_callback:
-                self.log_callback("DONE: Asset secured. Processing...")
+                self.log_callback(f"VALIDATE: {os.path.basename(item['path'])} is broken ({item['problem']}).")
+            try:
+                if os.path.exists(item["path"]):
+                    os.remove(item["path"])
+            except OSError:
+                pass
+            if self._journal:
+                self._journal.record(STAGE_BROKEN, item["id"], problem=item["problem"])
+            if index and item["extractor"]:
+                index.reopen(item["extractor"], item["id"])
+        return broken
 
-    def download(self, url: str, output_path: str, options: dict):
-        from datetime import datetime
-        from sleekes.core.config import get_next_counter
-        
-        # 1. 메타데이터 먼저 추출하여 폴더명 결정
+    def _compress_info_json(self, info: dict):
+        path = info.get('infojson_filename')
+        if not path or not os.path.exists(path):
+            return
+        try:
+            storage.compress_file(path, self._compress, compact_json=True)
+        except (OSError, ValueError) as e:
+            if self.log_callback:
+                self.log_callback(f"WARNING: Could not compress {os.path.basename(path)}: {str(e)}")
+
+    def _write_manifest(self, folder: str):
+        from sleekes.core.manifest import write_manifest
+
+        try:
+            manifest = write_manifest(folder)
+        except OSError as e:
+            if self.log_callback:
+                self.log_callback(f"WARNING: Could not write the checksum manifest: {str(e)}")
+            return None
+        files = manifest["files"]
         if self.log_callback:
-            self.log_callback("ENGINE: Extracting metadata to determine folder structure...")
-        
-        info = self.get_info(url)
-        if not info:
+            self.log_callback(f"MANIFEST: {len(files)} file(s) recorded in {os.path.basename(folder)}")
+        return manifest
+
+    def _link_duplicate(self, video_id: str, src_folder: str, dst_folder: str):
+        """다른 폴더에 이미 완료된 영상을 다시 받지 않고 현재 폴더에 링크합니다. (인덱스 조회 중 호출)"""
+        from sleekes.core.dedupe import materialize_video
+
+        if video_id in self._linked or not os.path.isdir(src_folder):
+            return
+        self._linked.add(video_id)
+        try:
+            stats = materialize_video(video_id, src_folder, dst_folder)
+        except OSError as e:
             if self.log_callback:
-                self.log_callback("ERROR: Failed to extract metadata. Aborting.")
-            return False
+                self.log_callback(f"DEDUPE ERROR: Could not link {video_id} from {os.path.basename(src_folder)}: {str(e)}")
+            return
+        if (stats["linked"] or stats["copied"]) and self.log_callback:
+            self.log_callback(f"DEDUPE: {video_id} linked from {os.path.basename(src_folder)} "
+                              f"({stats['linked']} linked, {stats['copied']} copied, {stats['bytes'] / 1048576:.1f} MiB saved)")
 
-        # 채널명 및 동영상명 추출
-        uploader = info.get('uploader') or info.get('channel') or 'UnknownChannel'
-        title = info.get('title') or 'UnknownTitle'
-        
-        # 재생목록/채널인 경우
-        is_playlist = 'entries' in info
-        if is_playlist:
-            # 채널 다운로드 시: 채널명_채널명
-            folder_suffix = f"{uploader}_{uploader}"
-        else:
-            # 일반 동영상: 채널명_동영상명
-            folder_suffix = f"{uploader}_{title}"
+    def _dedupe_content(self, folder: str, manifest: dict):
+        import sqlite3
+        from sleekes.core.dedupe import ContentStore, dedupe_folder
 
-        # 특수문자 제거 (파일명 안전하게)
-        import re
-        folder_suffix = re.sub(r'[\\/*?:"<>|]', "", folder_suffix)
-        
-        today = datetime.now().strftime("%Y%m%d")
-        xxxx = get_next_counter()
-        
-        # 최종 폴더명: YYYYMMDD_XXXX_채널명_동영상명
-        final_folder_name = f"{today}_{xxxx}_{folder_suffix}"
-        full_output_dir = os.path.join(output_path, final_folder_name)
-        
-        if not os.path.exists(full_output_dir):
-            os.makedirs(full_output_dir)
+        try:
+            store = ContentStore()
+            try:
+                stats = dedupe_folder(folder, manifest, store)
+            finally:
+                store.close()
+        except (OSError, sqlite3.Error) as e:
+            if self.log_callback:
+                self.log_callback(f"WARNING: Could not update the content store: {str(e)}")
+            return
+        if stats["linked"] and self.log_callback:
+            self.log_callback(f"DEDUPE: {stats['linked']} file(s) already archived elsewhere were linked "
+                              f"({stats['bytes'] / 1048576:.1f} MiB saved)")
+
+    def _update_catalog(self, folder: str):
+        import sqlite3
+        from sleekes.core.catalog import ArchiveCatalog
+
+        try:
+            catalog = ArchiveCatalog()
+            try:
+                catalog.update_folder(folder)
+                catalog.commit()
+            finally:
+                catalog.close()
+        except (OSError, sqlite3.Error) as e:
+            if self.log_callback:
+                self.log_callback(f"WARNING: Could not update the archive catalog: {str(e)}")
+
+    def _defer_complete(self, extractor: str, video_id: str) -> bool:
+        """yt-dlp가 항목을 아카이브에 기록할 때 호출됩니다. 변환이 남았거나 실패했으면 True."""
+        with self._pp_lock:
+            if video_id not in self._converting:
+                return False
+            self._awaiting[video_id] = extractor
+            return True
 
-        # 템플릿 설정: 모든 파일을 이 하나의 폴더 안에 때려박음
-        out_tmpl = os.path.join(full_output_dir, '%(title)s.%(ext)s')
+    def _on_conversions_done(self, video_id, ok):
+        """변환 풀에서 항목의 모든 변환이 끝났을 때 호출됩니다. (풀 스레드에서 실행)"""
+        if self._journal:
+            self._journal.record(STAGE_FINISHED if ok else STAGE_POSTPROCESSED, video_id, converted=ok)
+
+        # 변환까지 모두 성공해야 인덱스에 완료로 기록합니다 (실패하면 미완료로 남아 다음 실행에서 다시 처리)
+        with self._pp_lock:
+            if ok:
+                self._converting.pop(video_id, None)
+                extractor = self._awaiting.pop(video_id, None)
+            else:
+                self._converting[video_id] = False
+                extractor = None
+        if extractor and self._index:
+            self._index.complete(extractor, video_id)
+
+    def _progress_hook(self, d):
+        self._checkpoint()
 
+        if d['status'] == 'finished' and self._journal:
+            self._journal.record(
+                STAGE_DOWNLOADED,
+                (d.get('info_dict') or {}).get('id'),
+                file=os.path.basename(d.get('filename') or '')
+            )
+
+        # 원본 훅 데이터 대신 간격이 조절된 숫자 레코드만 전달합니다
+        if self.progress_callback:
+            record = self.throttle.feed(d)
+            if record:
+                self.progress_callback(record)
+        
+        if d['status'] == 'finished':
+            if self.log_callback:
+                self.log_callback("DONE: Asset secured. Processing...")
+
+    def _build_ydl_opts(self, options: dict) -> dict:
+        """
+        사용자 옵션을 yt-dlp 옵션 딕셔너리로 변환합니다.
+        출력 폴더는 메타데이터 추출 이후에 결정되므로 여기서는 파일명 템플릿만 지정하고,
+        실제 저장 위치는 download()에서 'paths'로 주입합니다.
+        """
         # yt-dlp 옵션 구성
         ydl_opts = {
             'progress_hooks': [self._progress_hook],
-            'outtmpl': out_tmpl,
+            'match_filter': self._entry_filter,
+            'postprocessor_hooks': [self._postprocessor_hook],
+            # 중단 후 재실행 시 같은 폴더의 .part 파일에서 이어받습니다
+            'continuedl': True,
+            'outtmpl': '%(title)s.%(ext)s',
             
             # --- [강력한 아카이빙 지원: 모든 기능 활성화] ---
             'writedescription': True,
             'writeinfojson': True,
             'writesubtitles': True,
             'getcomments': True,
-            'writeautomaticcaption': True,
+            'writeautomaticsub': True,
             'writethumbnail': True,
-            'allsubtitles': True, # 모든 언어 자막
+            'allsubtitles': True, # 모든 언어 자막 (실제로 받을 트랙은 _select_subtitles에서 다시 고름)
+            # 자막은 VTT로 받아 내장 변환기로 SRT를 만듭니다 (트랙마다 ffmpeg를 띄우지 않음)
+            'subtitlesformat': 'vtt/best',
             
             'postprocessors': [],
             
@@ -124,13 +470,17 @@ class SleekesDownloader:
             ydl_opts['concurrent_fragment_downloads'] = 1
 
         # 포맷 설정
-        if options.get('only_audio', False):
+        # (MP3 변환은 yt-dlp 후처리가 아닌 별도 변환 풀에서 수행합니다 - download() 참고)
+        if options.get('native_container', False):
+            # 네이티브 컨테이너 모드: 재인코딩 없이 스트림 복사만으로 합칠 수 있는 조합을 고릅니다.
+            # (H.264+AAC -> mp4, VP9/AV1+Opus -> webm) 오디오는 원본 코덱(opus/m4a) 그대로 저장합니다.
+            if options.get('only_audio', False):
+                ydl_opts['format'] = 'bestaudio[acodec=opus]/bestaudio[ext=m4a]/bestaudio/best'
+            else:
+                ydl_opts['format'] = options.get('format', NATIVE_FORMAT)
+                ydl_opts['merge_output_format'] = 'mp4/webm/mkv'
+        elif options.get('only_audio', False):
             ydl_opts['format'] = 'bestaudio/best'
-            ydl_opts['postprocessors'].append({
-                'key': 'FFmpegExtractAudio',
-                'preferredcodec': 'mp3',
-                'preferredquality': '192',
-            })
         else:
             ydl_opts['format'] = options.get('format', 'bestvideo+bestaudio/best')
             ydl_opts['merge_output_format'] = 'mp4'
@@ -141,33 +491,356 @@ class SleekesDownloader:
         if not options.get('use_playlist', True):
             ydl_opts['noplaylist'] = True
 
-        # 자막 변환기
-        ydl_opts['postprocessors'].append({
-            'key': 'FFmpegSubtitlesConvertor',
-            'format': 'srt',
-        })
-
         if options.get('cookies_from_browser'):
             ydl_opts['cookiesfrombrowser'] = (options.get('cookies_from_browser'),)
 
         if options.get('skip_download', False):
             ydl_opts['skip_download'] = True
 
-        if self.log_callback:
-            self.log_callback(f"ENGINE START: Targeting {final_folder_name}")
+        # 댓글 갱신 모드: 댓글만 최신순으로 받고, 아카이브의 다른 파일은 건드리지 않습니다
+        if options.get('refresh_comments', False):
+            ydl_opts.update({
+                'skip_download': True,
+                'writedescription': False,
+                'writeinfojson': False,
+                'writesubtitles': False,
+                'writeautomaticsub': False,
+                'writethumbnail': False,
+                'getcomments': True,
+            })
+            ydl_opts['extractor_args']['youtube']['comment_sort'] = ['new']
+
+        return ydl_opts
+
+    def _resolve_folder_name(self, info: dict) -> str:
+        """
+        추출된 메타데이터로 YYYYMMDD_XXXX_채널명_동영상명 형식의 폴더명을 생성합니다.
+        """
+        from datetime import datetime
+        from sleekes.core.config import get_next_counter
+
+        # 채널명 및 동영상명 추출
+        uploader = info.get('uploader') or info.get('channel') or 'UnknownChannel'
+        title = info.get('title') or 'UnknownTitle'
+        
+        # 재생목록/채널인 경우
+        is_playlist = 'entries' in info
+        if is_playlist:
+            # 채널 다운로드 시: 채널명_채널명
+            folder_suffix = f"{uploader}_{uploader}"
+        else:
+            # 일반 동영상: 채널명_동영상명
+            folder_suffix = f"{uploader}_{title}"
+
+        # 특수문자 제거 (파일명 안전하게)
+        import re
+        folder_suffix = re.sub(r'[\\/*?:"<>|]', "", folder_suffix)
+        
+        today = datetime.now().strftime("%Y%m%d")
+        xxxx = get_next_counter()
+        
+        # 최종 폴더명: YYYYMMDD_XXXX_채널명_동영상명
+        return f"{today}_{xxxx}_{folder_suffix}"
+
+    def _probe(self, ydl, url: str):
+        """
+        URL의 최상위 메타데이터만 조회합니다 (process=False).
+        재생목록/채널의 경우 항목(entries)이 지연 평가 상태로 남아 있으므로,
+        수천 개 영상의 상세 정보를 미리 해석하지 않고도 채널명을 얻을 수 있습니다.
+
+        예약된 방송/프리미어처럼 아직 포맷이 없는 영상은 'wait_for_video' 설정에 따라 기다린 뒤 다시 조회합니다.
+        (process=False 조회와 process_ie_result()는 대기를 하지 않으므로 yt-dlp가 extract_info에서 하는 것과 같이 직접 호출합니다.
+         재생목록의 개별 항목은 process_ie_result()가 extract_info로 추출하므로 그쪽에서 기다립니다)
+
+        Returns:
+            dict: process_ie_result()에 그대로 넘길 수 있는 미처리 결과 (실패 시 None)
+        """
+        from yt_dlp.utils import ReExtractInfo
+
+        while True:
+            info = self._resolve(ydl, url)
+            if not info or self.cancelled:
+                return info
+            try:
+                ydl._wait_for_video(info)
+            except ReExtractInfo as e:
+                if self.log_callback:
+                    self.log_callback(f"WAIT: {e}. Re-extracting metadata...")
+                continue
+            return info
+
+    def _resolve(self, ydl, url: str):
+        """URL을 process=False로 조회하고, 단축 URL 등 리다이렉트 결과는 실제 대상이 나올 때까지 따라갑니다 (최대 5회)."""
+        info = ydl.extract_info(url, download=False, process=False)
+
+        for _ in range(5):
+            if not info or info.get('_type') not in ('url', 'url_transparent'):
+                break
+            resolved = ydl.extract_info(info['url'], ie_key=info.get('ie_key'), download=False, process=False)
+            if resolved and info.get('_type') == 'url_transparent':
+                # url_transparent는 원본 결과의 필드가 대상 결과를 덮어씁니다 (yt-dlp 규칙과 동일)
+                for key, value in info.items():
+                    if value is not None and key not in ('_type', 'url', 'id', 'extractor', 'extractor_key', 'ie_key'):
+                        resolved[key] = value
+            info = resolved
+        return info
+
+    def _match_url(self, url: str):
+        """
+        네트워크 요청 없이 URL만으로 (추출기 키, 임시 영상 ID)를 판별합니다.
+        yt-dlp가 download_archive를 사전 조회할 때 쓰는 방식과 동일합니다.
+        """
+        from yt_dlp.extractor import gen_extractor_classes
+
+        for ie in gen_extractor_classes():
+            if ie.suitable(url):
+                temp_id = ie.get_temp_id(url)
+                return (ie.ie_key(), temp_id) if temp_id else None
+        return None
+
+    @staticmethod
+    def _resumable(folder: str, use_index: bool) -> bool:
+        """
+        인덱스에 기록된 폴더를 이어받을지 결정합니다.
+        --force에서는 새 폴더에 다시 아카이빙하되, 저널상 중간에 끊긴 세션의 폴더는 이어받습니다.
+        """
+        if not os.path.isdir(folder):
+            return False
+        return use_index or session_interrupted(folder)
+
+    def download(self, url: str, output_path: str, options: dict) -> bool:
+        """
+        URL을 아카이빙합니다. 세션이 끝난 뒤 받은 미디어 파일을 검증하고,
+        손상된 항목만 원래 폴더에 한 번 더 받습니다. 그래도 손상된 항목이 남으면 실패로 보고합니다.
+        """
+        success = self._download(url, output_path, options)
+        skipped = self.skipped
+        broken, self._broken = self._broken, []
+
+        if broken and options.get('refetch_broken', True) and not self.cancelled:
+            retry_options = dict(options, refetch_broken=False, use_playlist=False, playlist_items=None)
+            still_broken = []
+            for item in broken:
+                if not item.get("url"):
+                    still_broken.append(item)
+                    continue
+                if self.log_callback:
+                    self.log_callback(f"REFETCH: Re-downloading {os.path.basename(item['path'])} into its folder")
+                retry_options['resume_dir'] = os.path.dirname(item["path"])
+                self._download(item["url"], output_path, retry_options)
+                still_broken.extend(self._broken)
+                self._broken = []
+            broken = still_broken
+
+        self.skipped = skipped
+        if broken:
+            if self.log_callback:
+                self.log_callback(f"VALIDATE: {len(broken)} item(s) are still broken. Run the same URL again to retry.")
+            return False
+        return success
+
+    def _download(self, url: str, output_path: str, options: dict) -> bool:
+        from sleekes.core.index import ArchiveIndex, STATUS_COMPLETE
+
+        self.skipped = False
+        self._moved = 0
+        ydl_opts = self._build_ydl_opts(options)
+        use_index = options.get('use_index', True)
+        index = None
+        full_output_dir = None
+        completed = False
+        self._finish_on_move = options.get('skip_download', False)
+        self._refresh_comments = refresh = options.get('refresh_comments', False)
+        self._compress = options.get('compress_metadata') or None
+        if self._compress and self._compress not in storage.available_codecs():
+            if self.log_callback:
+                self.log_callback(f"WARNING: '{self._compress}' compression is not available here. Storing metadata uncompressed.")
+            self._compress = None
+        if refresh:
+            # 갱신할 아카이브 폴더를 찾으려면 인덱스가 필요합니다
+            use_index = True
+        native = options.get('native_container', False)
+        self._audio_ext = 'mp3' if options.get('only_audio', False) and not native else None
+        self._sub_langs = parse_sub_langs(options.get('sub_langs', DEFAULT_SUB_LANGS))
+        # 스텔스 모드에서는 자막 요청도 적게 겹치도록 동시 요청 수를 줄입니다
+        self._sub_workers = options.get('sub_workers', 4)
+        if options.get('stealth_mode', False):
+            self._sub_workers = min(self._sub_workers, 2)
+
+        # ffmpeg 변환(오디오 추출, 자막 변환)은 별도 풀에서 다운로드와 겹쳐 실행합니다
+        pp_pool = PostProcessPool(
+            workers=options.get('pp_workers', 2),
+            ffmpeg_threads=options.get('ffmpeg_threads', 2),
+            log_callback=self.log_callback
+        )
 
         try:
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([url])
+            import yt_dlp
+
+            # 0. 네트워크 작업 전에 영구 인덱스 조회
+            # 완료된 항목은 즉시 건너뛰고, 미완료 항목은 원래 폴더를 재사용합니다.
+            # 손상 파일 재수신 등, 호출자가 폴더를 지정한 경우 그 폴더를 그대로 사용합니다
+            resume_dir = options.get('resume_dir')
+            # --force(인덱스 미사용)에서도 폴더는 인덱스에 기록하며, 중간에 끊긴 세션의 폴더만 이어받습니다
+            index = self._index = ArchiveIndex()
+            url_key = self._match_url(url)
+            record = index.lookup(*url_key) if url_key else None
+            if use_index:
+                if record and record[1] == STATUS_COMPLETE and os.path.isdir(record[0]) and not refresh and not resume_dir:
+                    if self.log_callback:
+                        self.log_callback(f"SKIP: Already archived in {os.path.basename(record[0])}")
+                    self.skipped = True
+                    return True
+                # 재생목록 항목 중 완료된 영상은 yt-dlp가 상세 추출 전에 건너뜁니다
+                # (댓글 갱신은 완료된 영상이 대상이므로 건너뛰지 않음)
+                if not refresh:
+                    ydl_opts['download_archive'] = index
+                    index.defer_complete = self._defer_complete
+                    # 이 폴더의 저널에 끝나지 않은 것으로 남은 항목은 인덱스와 관계없이 다시 처리합니다
+                    index.unfinished = lambda video_id: bool(self._journal and self._journal.is_unfinished(video_id))
+                    # 다른 폴더에 이미 있는 영상은 다시 받지 않고 이 폴더에 링크합니다
+                    if options.get('dedupe', True):
+                        index.on_duplicate = lambda video_id, folder: self._link_duplicate(video_id, folder, index.folder)
+            if record and not resume_dir and self._resumable(record[0], use_index):
+                resume_dir = record[0]
+
+            self._checkpoint()
+            with self._create_ydl(ydl_opts) as ydl:
+                self._ydl = ydl
+                ydl.add_post_processor(create_enqueue_pp(
+                    pp_pool,
+                    audio_codec='mp3' if options.get('only_audio', False) else None,
+                    audio_quality='192',
+                    sub_format='srt',
+                    on_done=self._on_conversions_done,
+                    native_audio=native and options.get('only_audio', False)
+                ), when='after_move')
+
+                # 1. 최상위 메타데이터만 가볍게 조회(probe)하여 폴더명 결정
+                # 같은 YoutubeDL 인스턴스에서 추출한 결과를 그대로 다운로드 단계에 넘기므로
+                # URL을 두 번 해석(extract)하지 않습니다.
+                if self.log_callback:
+                    self.log_callback("ENGINE: Extracting metadata to determine folder structure...")
+
+                info = self._probe(ydl, url)
+                if not info:
+                    if self.log_callback:
+                        self.log_callback("ERROR: Failed to extract metadata. Aborting.")
+                    return False
+
+                # URL과 실제 ID가 다른 경우(채널 핸들 등)를 위해 실제 ID로도 조회합니다
+                info_key = (info.get('extractor_key') or info.get('ie_key'), info.get('id'))
+                if not resume_dir and all(info_key):
+                    record = index.lookup(*info_key)
+                    if record and self._resumable(record[0], use_index):
+                        resume_dir = record[0]
+
+                if refresh and not resume_dir:
+                    if self.log_callback:
+                        self.log_callback("ERROR: Comment refresh needs an existing archive of this URL. Archive it first.")
+                    return False
+
+                if resume_dir:
+                    full_output_dir = resume_dir
+                    final_folder_name = os.path.basename(resume_dir)
+                    if self.log_callback:
+                        label = "REFRESH: Merging new comments into" if refresh else "RESUME: Continuing in existing folder"
+                        self.log_callback(f"{label} {final_folder_name}")
+                else:
+                    final_folder_name = self._resolve_folder_name(info)
+                    full_output_dir = os.path.join(output_path, final_folder_name)
+                
+                if not os.path.exists(full_output_dir):
+                    os.makedirs(full_output_dir)
+
+                # 폴더가 정해지는 즉시 미완료(pending) 상태로 기록하여 중단 후 재실행 시 같은 폴더를 쓰도록 합니다
+                if index:
+                    index.folder = full_output_dir
+                    for key in (url_key, info_key):
+                        if key and all(key):
+                            index.mark(key[0], key[1], full_output_dir)
+
+                # 세션 저널 연결: 이전에 중단된 세션이면 완료된 항목을 건너뜁니다
+                # (댓글 갱신은 완료된 항목이 대상이므로 저널을 연결하지 않음)
+                if not refresh:
+                    self._journal = SessionJournal(full_output_dir)
+                    finished = len(self._journal.finished_ids())
+                    if finished and self.log_callback:
+                        self.log_callback(f"RESUME: Journal shows {finished} finished entries. Fast-forwarding past them.")
+
+                # 모든 파일을 이 하나의 폴더 안에 저장 (outtmpl은 파일명만 담당)
+                ydl.params['paths'] = {'home': full_output_dir}
+
+                if self.log_callback:
+                    self.log_callback(f"ENGINE START: Targeting {final_folder_name}")
+
+                # 2. 이미 해석된 info를 재사용하여 실제 다운로드 수행
+                # (재생목록/채널의 개별 항목은 이 단계에서 하나씩 상세 추출됩니다)
+                ydl.process_ie_result(info, download=True)
+
+                # URL만으로는 몰랐지만 상세 추출 후 모든 항목이 아카이브 기록으로 건너뛰어진 경우도 건너뜀입니다
+                if index and index.hits and not self._moved:
+                    self.skipped = True
+                    if self.log_callback:
+                        self.log_callback(f"SKIP: {len(index.hits)} item(s) already archived. Nothing new to download.")
+
+                # 변환이 모두 끝난 뒤 받은 미디어 파일을 검증합니다 (손상된 항목은 download()가 다시 받음)
+                if self._media and options.get('validate_media', True) and not self.cancelled:
+                    pp_pool.join()
+                    self._broken = self._validate_media(options, index if use_index else None)
+
+            if self._journal and not self.cancelled:
+                self._journal.end_session()
             if self.log_callback:
                 self.log_callback(f"SUCCESS: Archiving session completed in {final_folder_name}")
+            completed = True
             return True
         except Exception as e:
             if self.log_callback:
-                self.log_callback(f"ERROR: {str(e)}")
+                if self.cancelled:
+                    self.log_callback("CANCELLED: Stopped by user. Partial files were kept for resume.")
+                else:
+                    self.log_callback(f"ERROR: {str(e)}")
             return False
+        finally:
+            # 남은 변환 작업이 모두 끝난 뒤에 세션을 닫습니다
+            pp_pool.join()
+            if pp_pool.stats["tasks"] and self.log_callback:
+                self.log_callback(f"PP: {pp_pool.stats['tasks']} conversion(s) finished, {pp_pool.stats['failed']} failed.")
+            # 실제 변환 비용을 누적하고, 네이티브 모드라면 생략한 변환의 CPU 절감량을 보고합니다
+            record_transcode_cost(pp_pool.stats["audio_cpu_seconds"], pp_pool.stats["media_seconds"])
+            report = cpu_report(pp_pool.stats, load_cpu_ratio() if pp_pool.stats["native_items"] else None)
+            if report and self.log_callback:
+                self.log_callback(report)
+            # 변환까지 모두 끝난 폴더의 파일 목록과 해시를 매니페스트로 남깁니다
+            # 다른 폴더에 같은 내용이 이미 있는 파일은 그 파일의 링크로 바꿉니다
+            if completed and full_output_dir:
+                manifest = self._write_manifest(full_output_dir)
+                if manifest and options.get('dedupe', True):
+                    self._dedupe_content(full_output_dir, manifest)
+            # 이번 작업이 기록한 아카이브 폴더만 검색 카탈로그에 반영합니다
+            if full_output_dir and os.path.isdir(full_output_dir):
+                self._update_catalog(full_output_dir)
+            self._journal = None
+            self._ydl = None
+            self._refresh_comments = False
+            self._compress = None
+            self._media = []
+            self._linked = set()
+            self._index = None
+            self._converting = {}
+            self._awaiting = {}
+            if index:
+                index.close()
+
+    def get_info(self, url: str, flat: bool = False):
+        """
+        URL의 메타데이터를 조회합니다.
 
-    def get_info(self, url: str):
+        Args:
+            url (str): 대상 URL
+            flat (bool): True이면 재생목록/채널의 항목을 해석하지 않고 최상위 정보만 조회
+        """
         random_ua = get_random_ua()
         ydl_opts = {
             'user_agent': random_ua,
@@ -180,7 +853,10 @@ class SleekesDownloader:
             'geo_bypass': True,
             'extractor_args': {'youtube': {'player_client': ['android']}}
         }
+        if flat:
+            ydl_opts['extract_flat'] = 'in_playlist'
         try:
+            import yt_dlp
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 return ydl.extract_info(url, download=False)
         except Exception as e:
@@ -0,0 +1,145 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+from sleekes.core.config import SETTINGS_DIR
+
+# =============================================================================
+# [Sleekes Archive Index]
+#
+# 이미 아카이빙한 영상을 기억하는 영구 인덱스입니다. (settings/archive_index.db)
+# (추출기 + 영상 ID) -> (아카이브 폴더, 완료 상태)를 SQLite에 기록하여,
+# 같은 URL이나 일부만 받아둔 채널을 다시 실행해도 새 폴더를 만들지 않고
+# 완료된 항목은 건너뛰고, 미완료 항목은 원래 폴더 안에서 이어받습니다.
+#
+# ArchiveIndex 객체는 yt-dlp의 'download_archive' 옵션에 그대로 전달할 수 있도록
+# 집합(set)과 같은 인터페이스(__contains__, add)를 제공합니다.
+# yt-dlp는 재생목록 항목을 상세 추출하기 전에 이 인덱스를 조회하므로,
+# 완료된 항목에 대해서는 네트워크 요청이 전혀 발생하지 않습니다.
+#
+# 변환 풀에 작업이 남은 항목은 add()가 불려도 미완료로 두고(defer_complete),
+# 변환이 모두 성공한 뒤 엔진이 complete()로 완료 처리합니다. 변환 도중 중단되면 다음 실행에서 다시 처리됩니다.
+# 변환 풀 스레드에서도 호출되므로 연결은 잠금으로 보호합니다.
+#
+# 현재 폴더의 세션 저널에 끝나지 않은 것으로 기록된 항목은 완료 기록이 있어도 다시 처리합니다. (unfinished)
+#
+# 완료된 항목이 현재 폴더가 아닌 다른 폴더에 있으면 on_duplicate(video_id, 원래 폴더)를 호출해
+# 엔진이 파일을 현재 폴더로 링크할 수 있게 합니다. (sleekes.core.dedupe)
+# =============================================================================
+
+INDEX_FILE = os.path.join(SETTINGS_DIR, "archive_index.db")
+
+STATUS_PENDING = "pending"
+STATUS_COMPLETE = "complete"
+
+class ArchiveIndex:
+    def __init__(self, path: str = INDEX_FILE, folder: Optional[str] = None):
+        """
+        Args:
+            path (str): 인덱스 DB 경로
+            folder (str): add()로 기록되는 항목이 저장된 아카이브 폴더
+        """
+        self.folder = folder
+        self.on_duplicate: Optional[Callable[[str, str], None]] = None
+        # defer_complete(extractor, video_id)가 True이면 add()가 항목을 완료로 기록하지 않습니다
+        self.defer_complete: Optional[Callable[[str, str], bool]] = None
+        # unfinished(video_id)가 True이면 완료 기록이 있어도 건너뛰지 않습니다 (세션 저널이 우선)
+        self.unfinished: Optional[Callable[[str], bool]] = None
+        # 이번 세션에서 완료 기록 때문에 건너뛴 아카이브 ID (일괄 처리 통계용)
+        self.hits = set()
+
+        directory = os.path.dirname(path)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory, exist_ok=True)
+
+        # 여러 프로세스/스레드가 동시에 기록할 수 있으므로 WAL 모드와 넉넉한 대기 시간을 사용합니다.
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS items ("
+            " extractor TEXT NOT NULL,"
+            " video_id TEXT NOT NULL,"
+            " folder TEXT NOT NULL,"
+            " status TEXT NOT NULL,"
+            " updated REAL NOT NULL,"
+            " PRIMARY KEY (extractor, video_id))"
+        )
+        self.conn.commit()
+
+    # --- yt-dlp download_archive 인터페이스 ---
+
+    def __bool__(self):
+        # yt-dlp는 'if not self.archive'로 아카이브 사용 여부를 판단합니다
+        return True
+
+    def __contains__(self, archive_id: str) -> bool:
+        """yt-dlp 아카이브 ID('extractor video_id')가 완료 상태로 기록되어 있는지 확인합니다."""
+        extractor, _, video_id = archive_id.partition(" ")
+        record = self.lookup(extractor, video_id)
+        if record is None or record[1] != STATUS_COMPLETE:
+            return False
+        if self.unfinished and self.unfinished(video_id):
+            return False
+        self.hits.add(archive_id)
+        if self.on_duplicate and self.folder and record[0] and os.path.abspath(record[0]) != os.path.abspath(self.folder):
+            self.on_duplicate(video_id, record[0])
+        return True
+
+    def add(self, archive_id: str):
+        """yt-dlp가 항목 처리를 모두 마쳤을 때 호출합니다. 변환이 남아 있지 않으면 완료 상태로 기록합니다."""
+        extractor, _, video_id = archive_id.partition(" ")
+        if self.defer_complete and self.defer_complete(extractor, video_id):
+            self.mark(extractor, video_id, self.folder or "", STATUS_PENDING)
+        else:
+            self.complete(extractor, video_id)
+
+    # --- Sleekes 엔진용 인터페이스 ---
+
+    def lookup(self, extractor: str, video_id: str) -> Optional[Tuple[str, str]]:
+        """
+        (추출기, 영상 ID)의 기록을 조회합니다.
+
+        Returns:
+            tuple: (folder, status) 또는 기록이 없으면 None
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT folder, status FROM items WHERE extractor = ? AND video_id = ?",
+                (extractor.lower(), str(video_id))
+            ).fetchone()
+        return tuple(row) if row else None
+
+    def mark(self, extractor: str, video_id: str, folder: str, status: str = STATUS_PENDING):
+        """
+        항목을 기록합니다. 이미 완료된 항목은 pending으로 되돌리지 않습니다.
+        """
+        with self._lock:
+            self.conn.execute(
+                "INSERT INTO items (extractor, video_id, folder, status, updated) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (extractor, video_id) DO UPDATE SET "
+                " folder = excluded.folder,"
+                " status = CASE WHEN items.status = ? THEN items.status ELSE excluded.status END,"
+                " updated = excluded.updated",
+                (extractor.lower(), str(video_id), folder, status, time.time(), STATUS_COMPLETE)
+            )
+            self.conn.commit()
+
+    def complete(self, extractor: str, video_id: str):
+        """항목을 현재 폴더에 완료 상태로 기록합니다."""
+        self.mark(extractor, video_id, self.folder or "", STATUS_COMPLETE)
+
+    def reopen(self, extractor: str, video_id: str):
+        """완료된 항목을 미완료(pending)로 되돌립니다. 폴더는 그대로 두어 같은 폴더에서 다시 받게 합니다."""
+        with self._lock:
+            self.conn.execute(
+                "UPDATE items SET status = ?, updated = ? WHERE extractor = ? AND video_id = ?",
+                (STATUS_PENDING, time.time(), extractor.lower(), str(video_id))
+            )
+            self.conn.commit()
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
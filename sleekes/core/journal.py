@@ -0,0 +1,111 @@
+import json
+import os
+import threading
+import time
+from typing import Dict, Set
+
+# =============================================================================
+# [Sleekes Session Journal]
+#
+# 재생목록/채널 아카이빙 세션의 진행 상황을 기록하는 추가 전용(append-only) 저널입니다.
+# 아카이브 폴더 안의 .sleekes_journal.jsonl에 항목별 단계를 한 줄씩 기록합니다.
+#
+#   extracted     : 상세 메타데이터 추출 완료
+#   downloaded    : 미디어 파일 다운로드 완료 (포맷별로 여러 번 기록될 수 있음)
+#   postprocessed : 병합/변환 등 후처리 완료
+#   finished      : 항목의 모든 작업 완료
+#   broken        : 완료 후 검증에서 미디어 파일이 손상된 것으로 확인됨 (다시 받아야 함)
+#
+# 각 줄은 기록 즉시 fsync되므로 크래시나 재부팅 후에도 유실되지 않으며,
+# 마지막 줄이 잘린 경우(기록 도중 중단)에는 해당 줄만 무시합니다.
+# 재실행 시 finished로 기록된 항목은 상세 추출 전에 건너뛰어, 중단된 지점부터 바로 이어갑니다.
+# 세션 단위 재개의 기준은 저널입니다. 아카이브 인덱스가 완료로 알고 있어도 저널에 기록이 있고
+# 끝나지 않은 항목은 다시 처리하며, 세션이 끝까지 돌면 마지막에 세션 종료 줄을 남깁니다.
+# =============================================================================
+
+JOURNAL_NAME = ".sleekes_journal.jsonl"
+
+STAGE_EXTRACTED = "extracted"
+STAGE_DOWNLOADED = "downloaded"
+STAGE_POSTPROCESSED = "postprocessed"
+STAGE_FINISHED = "finished"
+STAGE_BROKEN = "broken"
+
+class SessionJournal:
+    def __init__(self, folder: str):
+        self.path = os.path.join(folder, JOURNAL_NAME)
+        self._lock = threading.Lock()
+        self._needs_newline = False
+        # 마지막 기록이 세션 종료 줄인지 (이후 항목 기록이 있으면 다시 False)
+        self.ended = False
+        self.stages: Dict[str, str] = self._load()
+
+    def _load(self) -> Dict[str, str]:
+        """저널을 읽어 항목 ID별 마지막 단계를 반환합니다."""
+        stages = {}
+        if not os.path.exists(self.path):
+            return stages
+        with open(self.path, "r", encoding="utf-8") as f:
+            line = ""
+            for line in f:
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    # 기록 도중 중단되어 잘린 줄
+                    continue
+                if event.get("session") == "end":
+                    self.ended = True
+                elif event.get("id"):
+                    stages[event["id"]] = event.get("stage")
+                    self.ended = False
+            # 잘린 마지막 줄 뒤에 이어 쓰지 않도록 다음 기록 전에 줄바꿈을 넣습니다
+            self._needs_newline = bool(line) and not line.endswith("\n")
+        return stages
+
+    def _append(self, event: dict):
+        line = json.dumps(event, ensure_ascii=False) + "\n"
+        if self._needs_newline:
+            line = "\n" + line
+            self._needs_newline = False
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def record(self, stage: str, video_id: str, **extra):
+        """단계를 한 줄 추가하고 디스크에 즉시 반영합니다."""
+        if not video_id:
+            return
+        event = {"ts": round(time.time(), 3), "stage": stage, "id": video_id}
+        event.update(extra)
+
+        with self._lock:
+            self._append(event)
+            self.stages[video_id] = stage
+            self.ended = False
+
+    def end_session(self):
+        """세션이 중단 없이 끝까지 실행되었음을 기록합니다."""
+        with self._lock:
+            self._append({"ts": round(time.time(), 3), "session": "end"})
+            self.ended = True
+
+    def finished_ids(self) -> Set[str]:
+        return {vid for vid, stage in self.stages.items() if stage == STAGE_FINISHED}
+
+    def is_finished(self, video_id: str) -> bool:
+        return self.stages.get(video_id) == STAGE_FINISHED
+
+    def is_unfinished(self, video_id: str) -> bool:
+        """이 세션에서 처리를 시작했지만 끝나지 않은 항목인지 확인합니다."""
+        return video_id in self.stages and self.stages[video_id] != STAGE_FINISHED
+
+def session_interrupted(folder: str) -> bool:
+    """
+    폴더의 세션이 중간에 끊겼는지 확인합니다.
+    (세션 종료 기록이 없고, 시작했지만 끝나지 않은 항목이 있는 경우)
+    """
+    if not os.path.exists(os.path.join(folder, JOURNAL_NAME)):
+        return False
+    journal = SessionJournal(folder)
+    return not journal.ended and any(stage != STAGE_FINISHED for stage in journal.stages.values())
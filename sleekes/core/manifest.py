@@ -0,0 +1,210 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sleekes.core.config import write_json_atomic
+from sleekes.core.journal import JOURNAL_NAME
+from sleekes.core.comments import CHECKPOINT_SUFFIX
+
+# =============================================================================
+# [Sleekes Checksum Manifest]
+#
+# 아카이브 폴더마다 '이 폴더에 무엇이 있어야 하는지'를 기록하는 매니페스트(.sleekes_manifest.json)입니다.
+# 파일 목록, 크기, 수정 시각, 해시(BLAKE2b)를 담으며, 다운로드가 성공적으로 끝난 직후에 만들어집니다.
+#
+# 검증(verify):
+#   - 기본(증분) 검사: 크기가 다르면 곧바로 손상(잘림 등)으로 보고하고, 수정 시각만 바뀐 파일은
+#     다시 해시해 내용이 같은지 확인합니다. 크기/시각이 그대로인 파일은 읽지 않습니다.
+#   - 전체 검사(full): 모든 파일을 다시 해시합니다. (크기/시각이 그대로인 비트 손상은 이것으로만 발견)
+#
+# 해시 계산은 큰 버퍼(readinto)로 읽어 복사를 줄이고, hashlib이 해시 도중 GIL을 놓으므로
+# 스레드 풀 하나로 여러 코어에서 동시에 진행됩니다. 여러 폴더를 검사할 때도 풀을 공유합니다.
+# =============================================================================
+
+MANIFEST_NAME = ".sleekes_manifest.json"
+MANIFEST_VERSION = 1
+HASH_ALGORITHM = "blake2b"
+READ_BUFFER = 8 * 1024 * 1024
+DEFAULT_WORKERS = min(8, os.cpu_count() or 2)
+
+# 매니페스트에 넣지 않는 파일 (엔진의 작업 파일과 미완성 다운로드)
+_EXCLUDED_NAMES = (MANIFEST_NAME, JOURNAL_NAME)
+_EXCLUDED_SUFFIXES = (".part", ".ytdl", ".tmp", CHECKPOINT_SUFFIX)
+
+# 작업 스레드마다 읽기 버퍼를 하나씩 두고 재사용합니다 (작은 파일이 많을 때 8MB 할당 반복 방지)
+_buffers = threading.local()
+
+PROBLEM_MISSING = "missing"
+PROBLEM_SIZE = "size"
+PROBLEM_HASH = "hash"
+
+def hash_file(path: str) -> str:
+    """파일 전체의 BLAKE2b 해시(hex)를 계산합니다."""
+    digest = hashlib.blake2b(digest_size=32)
+    buffer = getattr(_buffers, "buffer", None)
+    if buffer is None:
+        buffer = _buffers.buffer = bytearray(READ_BUFFER)
+    view = memoryview(buffer)
+    with open(path, "rb", buffering=0) as f:
+        while True:
+            n = f.readinto(buffer)
+            if not n:
+                break
+            digest.update(view[:n])
+    return digest.hexdigest()
+
+def _is_tracked(name: str) -> bool:
+    return name not in _EXCLUDED_NAMES and not name.endswith(_EXCLUDED_SUFFIXES) and ".part-Frag" not in name
+
+def list_files(folder: str) -> Dict[str, os.stat_result]:
+    """폴더 안의 추적 대상 파일 -> stat 결과. (하위 폴더는 yt-dlp가 만들지 않으므로 보지 않습니다)"""
+    files = {}
+    with os.scandir(folder) as it:
+        for entry in it:
+            if entry.is_file() and _is_tracked(entry.name):
+                files[entry.name] = entry.stat()
+    return files
+
+def load_manifest(folder: str) -> Optional[dict]:
+    try:
+        with open(os.path.join(folder, MANIFEST_NAME), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if manifest.get("algorithm") == HASH_ALGORITHM else None
+
+def _hash_many(paths: Iterable[str], pool: ThreadPoolExecutor) -> Dict[str, Optional[str]]:
+    """경로별 해시를 병렬로 계산합니다. 읽을 수 없는 파일은 None."""
+    def run(path):
+        try:
+            return hash_file(path)
+        except OSError:
+            return None
+    paths = list(paths)
+    return dict(zip(paths, pool.map(run, paths)))
+
+def write_manifest(folder: str, workers: int = DEFAULT_WORKERS) -> dict:
+    """
+    폴더의 매니페스트를 만들거나 갱신합니다.
+    이전 매니페스트에서 크기/수정 시각이 그대로인 파일은 해시를 다시 계산하지 않습니다.
+
+    Returns:
+        dict: 기록한 매니페스트
+    """
+    previous = (load_manifest(folder) or {}).get("files", {})
+    current = list_files(folder)
+    entries, to_hash = {}, []
+    for name, st in current.items():
+        old = previous.get(name)
+        if old and old["size"] == st.st_size and old["mtime_ns"] == st.st_mtime_ns:
+            entries[name] = old
+        else:
+            to_hash.append(name)
+
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="sleekes-hash") as pool:
+        hashes = _hash_many((os.path.join(folder, name) for name in to_hash), pool)
+    for name in to_hash:
+        digest = hashes[os.path.join(folder, name)]
+        if digest is not None:
+            st = current[name]
+            entries[name] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": digest}
+
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "algorithm": HASH_ALGORITHM,
+        "updated": round(time.time(), 3),
+        "files": dict(sorted(entries.items())),
+    }
+    write_json_atomic(os.path.join(folder, MANIFEST_NAME), manifest, indent=None)
+    return manifest
+
+def _plan(folder: str, manifest: dict, full: bool) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]], List[str]]:
+    """
+    검사 계획을 세웁니다.
+
+    Returns:
+        tuple: (해시할 (이름, 경로) 목록, 해시 없이 확정된 (이름, 문제) 목록, 매니페스트에 없는 파일 목록)
+    """
+    current = list_files(folder)
+    to_hash, problems = [], []
+    for name, entry in manifest["files"].items():
+        st = current.get(name)
+        if st is None:
+            problems.append((name, PROBLEM_MISSING))
+        elif st.st_size != entry["size"]:
+            problems.append((name, PROBLEM_SIZE))
+        elif full or st.st_mtime_ns != entry["mtime_ns"]:
+            to_hash.append((name, os.path.join(folder, name)))
+    untracked = sorted(set(current) - set(manifest["files"]))
+    return to_hash, problems, untracked
+
+def verify_folders(folders: Iterable[str], full: bool = False, workers: int = DEFAULT_WORKERS,
+                   build_missing: bool = False, log=None) -> Dict[str, dict]:
+    """
+    여러 아카이브 폴더를 검사합니다. 모든 폴더의 해시 작업은 하나의 스레드 풀에서 처리됩니다.
+
+    Args:
+        folders: 검사할 폴더 목록
+        full (bool): True이면 모든 파일을 다시 해시 (전체 스크럽)
+        workers (int): 동시에 해시할 파일 수
+        build_missing (bool): 매니페스트가 없는 폴더에 새로 만들지 여부
+        log: 진행 상황을 받을 콜백 (선택)
+
+    Returns:
+        dict: 폴더 -> {"checked": 해시한 파일 수, "problems": [(이름, 문제)], "untracked": [...],
+                       "manifest": 매니페스트 유무, "built": 이번에 만들었는지}
+    """
+    results, plans = {}, {}
+    for folder in folders:
+        manifest = load_manifest(folder)
+        if manifest is None:
+            built = False
+            if build_missing:
+                write_manifest(folder, workers)
+                built = True
+                if log:
+                    log(f"MANIFEST: Created for {os.path.basename(folder)}")
+            results[folder] = {"checked": 0, "problems": [], "untracked": [], "manifest": built, "built": built}
+        else:
+            plans[folder] = (manifest,) + _plan(folder, manifest, full)
+
+    # 모든 폴더의 해시 작업을 한 풀에 넣어, 작은 폴더가 이어져도 모든 코어가 쉬지 않게 합니다
+    with ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="sleekes-hash") as pool:
+        hashes = _hash_many((path for plan in plans.values() for _, path in plan[1]), pool)
+
+    for folder, (manifest, to_hash, problems, untracked) in plans.items():
+        touched = False
+        for name, path in to_hash:
+            entry = manifest["files"][name]
+            if hashes[path] != entry["hash"]:
+                problems.append((name, PROBLEM_HASH))
+                continue
+            # 내용은 같고 수정 시각만 바뀐 파일은 다음 증분 검사에서 다시 읽지 않도록 시각을 갱신합니다
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            if mtime_ns != entry["mtime_ns"]:
+                entry["mtime_ns"] = mtime_ns
+                touched = True
+        if touched:
+            write_json_atomic(os.path.join(folder, MANIFEST_NAME), manifest, indent=None)
+
+        results[folder] = {"checked": len(to_hash), "problems": sorted(problems), "untracked": untracked,
+                           "manifest": True, "built": False}
+        if log:
+            for name, problem in sorted(problems):
+                log(f"CORRUPT: {os.path.basename(folder)}/{name} ({problem})")
+    return results
+
+def archive_folders(root: str) -> List[str]:
+    """아카이브 루트 바로 아래의 폴더 목록을 반환합니다."""
+    try:
+        with os.scandir(root) as it:
+            return sorted(os.path.join(root, e.name) for e in it if e.is_dir() and not e.name.startswith("."))
+    except OSError:
+        return []
@@ -0,0 +1,269 @@
+import os
+import json
+import shutil
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+from sleekes.core.config import SETTINGS_DIR, write_json_atomic
+from sleekes.core.subtitles import convert_tracks
+
+# =============================================================================
+# [Sleekes Post-Processing Pool]
+#
+# yt-dlp의 기본 후처리(FFmpegExtractAudio, FFmpegSubtitlesConvertor)는 다운로드 스레드 안에서
+# 순차적으로 실행되므로, ffmpeg가 이전 파일을 변환하는 동안 네트워크가 쉬게 됩니다.
+#
+# 이 모듈은 변환 작업을 별도의 ffmpeg 프로세스 풀로 넘겨, N+1번째 항목을 다운로드하는 동안
+# N번째 항목의 변환이 동시에 진행되도록 합니다.
+#
+# - 동시에 실행되는 ffmpeg 프로세스 수는 workers로 제한됩니다.
+# - 대기 중인 작업 수도 제한되어(backpressure), 변환이 밀리면 다운로드가 잠시 기다립니다.
+# - ffmpeg 한 프로세스당 스레드 수(-threads)와 우선순위(nice)를 제한하여 CPU를 독점하지 않습니다.
+#
+# VTT -> SRT 자막 변환은 ffmpeg 대신 순수 파이썬 변환기(subtitles.py)로 한 영상의 트랙을 한 번에 처리합니다.
+# 스트림 복사로 끝나는 병합(merge)은 I/O 위주의 짧은 작업이므로 yt-dlp 안에서 그대로 수행합니다.
+#
+# 각 ffmpeg 프로세스의 CPU 사용 시간을 측정하여(POSIX wait4), 네이티브 컨테이너 모드에서
+# 변환을 생략했을 때 절약된 CPU 시간을 추정하는 데 사용합니다.
+# =============================================================================
+
+TRANSCODE_STATS_FILE = os.path.join(SETTINGS_DIR, "transcode_stats.json")
+_stats_lock = threading.Lock()
+
+AUDIO_CODECS = {
+    # codec -> (확장자, ffmpeg 인코더)
+    'mp3': ('mp3', 'libmp3lame'),
+    'm4a': ('m4a', 'aac'),
+    'opus': ('opus', 'libopus'),
+}
+
+# POSIX의 nice 명령 (없으면 기본 우선순위로 실행)
+NICE = shutil.which('nice') if os.name == 'posix' else None
+
+def low_priority(cmd: List[str]) -> List[str]:
+    """명령을 낮은 우선순위(nice 10)로 실행하도록 감쌉니다."""
+    return [NICE, '-n', '10'] + cmd if NICE else cmd
+
+class PostProcessPool:
+    def __init__(self, workers: int = 2, ffmpeg_threads: int = 2, log_callback: Optional[Callable] = None):
+        """
+        Args:
+            workers (int): 동시에 실행할 ffmpeg 프로세스 수
+            ffmpeg_threads (int): ffmpeg 프로세스당 스레드 수 (-threads)
+            log_callback: 로그 문자열을 받는 콜백
+        """
+        self.workers = max(1, workers)
+        self.ffmpeg_threads = max(1, ffmpeg_threads)
+        self.log_callback = log_callback
+        self.ffmpeg = shutil.which('ffmpeg')
+
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="sleekes-pp")
+        # 실행 중 + 대기 중인 작업 그룹 수 상한
+        self._slots = threading.BoundedSemaphore(self.workers * 2)
+        self._lock = threading.Lock()
+        # cpu_seconds: ffmpeg가 실제로 사용한 CPU 시간 (user + sys, 자막 변환 포함)
+        # audio_cpu_seconds / media_seconds: 오디오 변환에 쓴 CPU 시간 / 변환한 미디어의 재생 시간
+        # native_items / native_media_seconds: 네이티브 모드로 변환을 생략한 항목 수 / 재생 시간
+        self.stats = {"tasks": 0, "failed": 0, "cpu_seconds": 0.0, "audio_cpu_seconds": 0.0,
+                      "media_seconds": 0.0, "native_items": 0, "native_media_seconds": 0.0}
+
+    def _log(self, message: str):
+        if self.log_callback:
+            self.log_callback(message)
+
+    def _run_ffmpeg(self, args: List[str], media_seconds: float = 0.0) -> bool:
+        """args는 입력/출력 옵션 뒤에 출력 경로가 마지막에 오는 ffmpeg 인자 목록입니다."""
+        if not self.ffmpeg:
+            self._log("PP WARNING: ffmpeg not found. Keeping original files without conversion.")
+            return False
+        # -threads는 위치에 따라 적용 대상이 다릅니다. -i 앞에 두면 입력(디코더) 옵션이 되어 인코더는 기본 스레드 수를 쓰므로,
+        # 출력 옵션으로 출력 경로 바로 앞에 넣어 인코더 스레드 수를 제한합니다
+        cmd = [self.ffmpeg, '-y', '-nostdin', '-loglevel', 'error'] + args[:-1] + ['-threads', str(self.ffmpeg_threads), args[-1]]
+        # POSIX에서는 다운로드보다 낮은 우선순위로 실행합니다.
+        # 여러 스레드에서 동시에 실행하므로 preexec_fn 대신 nice 명령을 씁니다 (nice는 ffmpeg로 exec되어 PID가 같음)
+        proc = subprocess.Popen(low_priority(cmd), stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        stderr = proc.stderr.read().decode('utf-8', 'replace').strip()
+        proc.stderr.close()
+
+        cpu_seconds = 0.0
+        if hasattr(os, 'wait4'):
+            # wait4는 해당 ffmpeg 프로세스 하나의 CPU 사용량을 돌려주므로 동시 실행 중에도 정확합니다
+            _, status, usage = os.wait4(proc.pid, 0)
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            cpu_seconds = usage.ru_utime + usage.ru_stime
+        else:
+            proc.wait()
+
+        with self._lock:
+            self.stats["cpu_seconds"] += cpu_seconds
+            if media_seconds and proc.returncode == 0:
+                self.stats["audio_cpu_seconds"] += cpu_seconds
+                self.stats["media_seconds"] += media_seconds
+
+        if proc.returncode != 0:
+            self._log(f"PP ERROR: {stderr.splitlines()[-1] if stderr else 'ffmpeg failed'}")
+        return proc.returncode == 0
+
+    def extract_audio(self, src: str, codec: str = 'mp3', quality: str = '192', duration: float = 0.0) -> bool:
+        """미디어 파일에서 오디오를 추출/변환하고 성공 시 원본을 삭제합니다."""
+        ext, encoder = AUDIO_CODECS[codec]
+        dst = os.path.splitext(src)[0] + '.' + ext
+        if os.path.abspath(dst) == os.path.abspath(src):
+            return True
+        ok = self._run_ffmpeg(['-i', src, '-vn', '-c:a', encoder, '-b:a', f'{quality}k', dst], duration)
+        if ok:
+            os.remove(src)
+        return ok
+
+    def note_native(self, duration: float = 0.0):
+        """네이티브 모드에서 변환을 생략한 항목을 기록합니다. (CPU 절감량 리포트용)"""
+        with self._lock:
+            self.stats["native_items"] += 1
+            self.stats["native_media_seconds"] += duration
+
+    def convert_subtitle(self, src: str, fmt: str = 'srt') -> bool:
+        """자막 파일을 지정한 형식으로 변환하고 성공 시 원본을 삭제합니다."""
+        dst = os.path.splitext(src)[0] + '.' + fmt
+        if os.path.abspath(dst) == os.path.abspath(src):
+            return True
+        ok = self._run_ffmpeg(['-i', src, dst])
+        if ok:
+            os.remove(src)
+        return ok
+
+    def convert_vtt_tracks(self, paths: List[str]) -> bool:
+        """한 영상의 VTT 자막 트랙을 프로세스 생성 없이 한 번에 SRT로 변환합니다."""
+        _, failed = convert_tracks(paths)
+        for path in failed:
+            self._log(f"PP ERROR: Subtitle conversion failed ({os.path.basename(path)})")
+        return not failed
+
+    def submit(self, tasks: List[Callable[[], bool]], on_done: Optional[Callable[[bool], None]] = None):
+        """
+        한 항목(영상)에 속한 변환 작업 묶음을 제출합니다.
+        묶음의 모든 작업이 끝나면 on_done(전체 성공 여부)이 호출됩니다.
+        """
+        if not tasks:
+            if on_done:
+                on_done(True)
+            return
+
+        self._slots.acquire()
+
+        def run_group():
+            ok = True
+            try:
+                for task in tasks:
+                    try:
+                        task_ok = task()
+                    except OSError as e:
+                        self._log(f"PP ERROR: {str(e)}")
+                        task_ok = False
+                    with self._lock:
+                        self.stats["tasks"] += 1
+                        self.stats["failed"] += 0 if task_ok else 1
+                    ok = ok and task_ok
+                if on_done:
+                    on_done(ok)
+            finally:
+                self._slots.release()
+
+        self._executor.submit(run_group)
+
+    def join(self):
+        """제출된 모든 작업이 끝날 때까지 기다리고 풀을 닫습니다."""
+        self._executor.shutdown(wait=True)
+
+def _read_transcode_stats() -> dict:
+    try:
+        with open(TRANSCODE_STATS_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {"cpu_seconds": 0.0, "media_seconds": 0.0}
+
+def load_cpu_ratio() -> Optional[float]:
+    """지금까지 측정한 오디오 변환 비용(미디어 1초당 CPU 초)을 반환합니다. 기록이 없으면 None."""
+    with _stats_lock:
+        data = _read_transcode_stats()
+    if data.get("media_seconds"):
+        return data["cpu_seconds"] / data["media_seconds"]
+    return None
+
+def record_transcode_cost(cpu_seconds: float, media_seconds: float):
+    """측정한 변환 비용을 누적 기록합니다. (네이티브 모드의 절감량 추정에 사용)"""
+    if not cpu_seconds or not media_seconds:
+        return
+    with _stats_lock:
+        data = _read_transcode_stats()
+        data["cpu_seconds"] = data.get("cpu_seconds", 0.0) + cpu_seconds
+        data["media_seconds"] = data.get("media_seconds", 0.0) + media_seconds
+        try:
+            write_json_atomic(TRANSCODE_STATS_FILE, data)
+        except OSError:
+            pass
+
+def cpu_report(stats: dict, ratio: Optional[float]) -> Optional[str]:
+    """
+    작업 하나의 변환 CPU 사용량 리포트를 만듭니다.
+
+    Args:
+        stats (dict): PostProcessPool.stats
+        ratio (float): 이전 변환에서 측정한 '미디어 1초당 CPU 초' (없으면 None)
+    """
+    if stats["native_items"]:
+        line = (f"NATIVE: Kept {stats['native_items']} audio file(s) in their original codec "
+                f"({stats['native_media_seconds'] / 60:.1f} min of media, no transcode).")
+        if ratio:
+            line += f" Estimated CPU saved: {stats['native_media_seconds'] * ratio:.1f}s."
+        return line
+    if stats["cpu_seconds"]:
+        return f"PP: ffmpeg used {stats['cpu_seconds']:.1f}s of CPU time for this job."
+    return None
+
+def create_enqueue_pp(pool: PostProcessPool, audio_codec: Optional[str] = None, audio_quality: str = '192',
+                      sub_format: Optional[str] = None, on_done: Optional[Callable] = None,
+                      native_audio: bool = False):
+    """
+    yt-dlp 후처리 단계(after_move)에 등록할 PostProcessor를 생성합니다.
+    실제 변환은 하지 않고 필요한 작업을 풀에 넘긴 뒤 즉시 반환하므로 다운로드가 바로 이어집니다.
+
+    Args:
+        pool: 작업을 넘길 PostProcessPool
+        audio_codec: 오디오 추출 코덱 (None이면 추출하지 않음)
+        audio_quality: 오디오 비트레이트 (kbps)
+        sub_format: 자막 변환 형식 (None이면 변환하지 않음)
+        on_done: on_done(video_id, ok) - 항목의 변환이 모두 끝났을 때 호출
+        native_audio: True이면 오디오를 원본 코덱(opus/m4a) 그대로 두고 생략 통계만 기록
+    """
+    from yt_dlp.postprocessor.common import PostProcessor
+
+    class SleekesEnqueuePP(PostProcessor):
+        def run(self, info):
+            tasks = []
+            media = info.get('filepath')
+            duration = info.get('duration') or 0.0
+            if native_audio:
+                pool.note_native(duration)
+            elif audio_codec and media and os.path.exists(media):
+                tasks.append(lambda: pool.extract_audio(media, audio_codec, audio_quality, duration))
+
+            if sub_format:
+                vtt_tracks = []
+                for sub in (info.get('requested_subtitles') or {}).values():
+                    path = sub.get('filepath')
+                    if not path or not os.path.exists(path) or sub.get('ext') == sub_format:
+                        continue
+                    if sub_format == 'srt' and sub.get('ext') == 'vtt':
+                        vtt_tracks.append(path)
+                    else:
+                        tasks.append(lambda p=path: pool.convert_subtitle(p, sub_format))
+                # VTT 트랙은 모두 묶어 하나의 작업으로 처리합니다 (ffmpeg 프로세스 없음)
+                if vtt_tracks:
+                    tasks.append(lambda: pool.convert_vtt_tracks(vtt_tracks))
+
+            video_id = info.get('id')
+            pool.submit(tasks, (lambda ok: on_done(video_id, ok)) if on_done else None)
+            return [], info
+
+    return SleekesEnqueuePP()
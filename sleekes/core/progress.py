@@ -0,0 +1,90 @@
+import time
+from typing import Optional
+
+# =============================================================================
+# [Sleekes Progress Events]
+#
+# yt-dlp의 진행률 훅(progress hook)은 다운로드 중 초당 수백~수천 번 호출되며,
+# 매번 큰 딕셔너리(info_dict 포함)를 전달합니다. 이를 그대로 GUI 시그널로 보내면
+# 스레드 간 복사가 폭증하여 이벤트 루프가 느려집니다.
+#
+# 이 모듈은 원본 훅 데이터를 숫자 위주의 작은 레코드로 변환하고,
+# 'downloading' 이벤트는 지정된 간격(interval)마다 한 번만 내보냅니다.
+# 상태 변화(finished, error)는 즉시 전달됩니다.
+#
+# 레코드 필드:
+#   status      : 'downloading' | 'finished' | 'error'
+#   downloaded  : 받은 바이트 수
+#   total       : 전체 바이트 수 (모르면 None)
+#   percent     : 0~100 진행률 (모르면 None)
+#   speed       : 초당 바이트 (모르면 None)
+#   eta         : 남은 시간(초) (모르면 None)
+#   index/count : 재생목록 내 항목 번호 / 전체 항목 수 (단일 영상이면 None)
+# =============================================================================
+
+DEFAULT_INTERVAL = 0.25
+
+def make_record(d: dict) -> dict:
+    """yt-dlp 훅 딕셔너리를 Sleekes 진행률 레코드로 변환합니다."""
+    info = d.get('info_dict') or {}
+    downloaded = d.get('downloaded_bytes') or 0
+    total = d.get('total_bytes') or d.get('total_bytes_estimate')
+
+    percent = None
+    if total:
+        percent = min(100.0, downloaded * 100.0 / total)
+    elif d.get('status') == 'finished':
+        percent = 100.0
+
+    return {
+        'status': d.get('status'),
+        'downloaded': downloaded,
+        'total': total,
+        'percent': percent,
+        'speed': d.get('speed'),
+        'eta': d.get('eta'),
+        'index': info.get('playlist_index'),
+        'count': info.get('n_entries') or info.get('playlist_count'),
+    }
+
+class ProgressThrottle:
+    def __init__(self, interval: float = DEFAULT_INTERVAL):
+        """
+        Args:
+            interval (float): 'downloading' 레코드를 내보내는 최소 간격(초). 0이면 제한 없음.
+        """
+        self.interval = interval
+        self._last_emit = 0.0
+
+    def feed(self, d: dict) -> Optional[dict]:
+        """
+        원본 훅 데이터를 받아, 내보낼 시점이면 레코드를, 아니면 None을 반환합니다.
+        """
+        now = time.monotonic()
+        if d.get('status') == 'downloading' and now - self._last_emit < self.interval:
+            return None
+        self._last_emit = now
+        return make_record(d)
+
+def format_bytes(value) -> str:
+    """바이트 수를 B/KB/MB/GB/TB 단위 문자열로 변환합니다."""
+    size = float(value or 0)
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if size < 1024 or unit == "TB":
+            break
+        size /= 1024
+    return f"{size:.1f}{unit}"
+
+def format_record(record: dict) -> str:
+    """CLI 출력용 한 줄 진행률 문자열을 만듭니다."""
+    percent = f"{record['percent']:5.1f}%" if record['percent'] is not None else "  ?.?%"
+    total = format_bytes(record['total']) if record['total'] else "?"
+    line = f"[{percent}] {format_bytes(record['downloaded'])}/{total}"
+    if record['speed']:
+        line += f" {format_bytes(record['speed'])}/s"
+    if record['eta'] is not None:
+        eta = int(record['eta'])
+        line += f" ETA {eta // 60:02d}:{eta % 60:02d}"
+    if record['index'] and record['count']:
+        line += f" ({record['index']}/{record['count']})"
+    return line
@@ -0,0 +1,125 @@
+import gzip
+import io
+import json
+import lzma
+import os
+import shutil
+from typing import IO, Any, Dict, List, Optional
+
+# =============================================================================
+# [Sleekes Compact Storage]
+#
+# info.json과 댓글 사이드카처럼 영상마다 생기는 텍스트 메타데이터를 압축해 저장하고,
+# 압축 여부와 관계없이 같은 방식으로 읽을 수 있게 해주는 모듈입니다.
+#
+# - 지원 형식: gzip(.gz), xz(.xz), zstd(.zst - 파이썬 3.14의 compression.zstd 또는 zstandard 패키지가 있을 때)
+# - JSON은 공백 없는 compact 형식으로 다시 직렬화한 뒤 압축합니다.
+# - 읽을 때는 원래 경로(예: Title.info.json)만 넘기면 압축된 파일(Title.info.json.gz 등)을 자동으로 찾습니다.
+# - 압축은 임시 파일에 쓴 뒤 교체하므로 중간에 중단되어도 원본이 손상되지 않습니다.
+# =============================================================================
+
+def _zstd_module():
+    """사용 가능한 zstd 구현을 반환합니다. 없으면 None."""
+    try:
+        from compression import zstd
+        return zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard
+        return zstandard
+    except ImportError:
+        return None
+
+CODECS = {
+    # 이름 -> 확장자
+    "gzip": ".gz",
+    "xz": ".xz",
+    "zstd": ".zst",
+}
+
+def available_codecs() -> List[str]:
+    """현재 환경에서 사용할 수 있는 압축 형식 목록을 반환합니다."""
+    return [name for name in CODECS if name != "zstd" or _zstd_module() is not None]
+
+def _codec_of(path: str) -> Optional[str]:
+    for name, ext in CODECS.items():
+        if path.endswith(ext):
+            return name
+    return None
+
+def _open_codec(path: str, codec: Optional[str], mode: str) -> IO:
+    if codec == "gzip":
+        opener = gzip.open
+    elif codec == "xz":
+        opener = lzma.open
+    elif codec == "zstd":
+        opener = getattr(_zstd_module(), "open", None)
+        if opener is None:
+            raise OSError("zstd support is not available (install 'zstandard' or use Python 3.14+)")
+    else:
+        opener = open
+    # 압축 모듈의 open()은 기본이 바이너리 모드이므로 텍스트 모드는 명시적으로 지정합니다
+    if "b" in mode:
+        return opener(path, mode)
+    return opener(path, mode if "t" in mode else mode + "t", encoding="utf-8")
+
+def open_file(path: str, mode: str = "rt") -> IO:
+    """확장자에 맞는 방식으로 파일을 엽니다. (압축 여부를 호출자가 신경 쓰지 않아도 됨)"""
+    return _open_codec(path, _codec_of(path), mode)
+
+def resolve(path: str) -> Optional[str]:
+    """원래 경로 또는 그 압축본 중 실제로 있는 파일 경로를 반환합니다. 없으면 None."""
+    for candidate in [path] + [path + ext for ext in CODECS.values()]:
+        if os.path.exists(candidate):
+            return candidate
+    return None
+
+def strip_codec(path: str) -> str:
+    """압축 확장자를 떼어낸 원래 경로를 반환합니다."""
+    codec = _codec_of(path)
+    return path[:-len(CODECS[codec])] if codec else path
+
+def read_json(path: str) -> Dict[str, Any]:
+    """JSON 파일(압축본 포함)을 읽습니다. 파일이 없으면 FileNotFoundError."""
+    actual = resolve(path)
+    if actual is None:
+        raise FileNotFoundError(path)
+    with open_file(actual, "rt") as f:
+        return json.load(f)
+
+def compress_file(path: str, codec: str, compact_json: bool = False) -> str:
+    """
+    파일을 지정한 형식으로 압축하고 원본을 삭제합니다.
+
+    Args:
+        path (str): 압축할 평문 파일
+        codec (str): 'gzip' | 'xz' | 'zstd'
+        compact_json (bool): True이면 JSON을 공백 없이 다시 직렬화한 뒤 압축
+
+    Returns:
+        str: 압축된 파일 경로
+    """
+    dst = path + CODECS[codec]
+    tmp = dst + ".tmp"
+    with open(path, "rb") as src, _open_codec(tmp, codec, "wb") as out:
+        if compact_json:
+            data = json.load(io.TextIOWrapper(src, encoding="utf-8"))
+            out.write(json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+        else:
+            shutil.copyfileobj(src, out, 1024 * 1024)
+    os.replace(tmp, dst)
+    os.remove(path)
+    return dst
+
+def decompress_file(path: str) -> str:
+    """압축된 파일을 평문으로 풀고 압축본을 삭제합니다. 평문 경로를 반환합니다."""
+    dst = strip_codec(path)
+    if dst == path:
+        return path
+    tmp = dst + ".tmp"
+    with open_file(path, "rb") as src, open(tmp, "wb") as out:
+        shutil.copyfileobj(src, out, 1024 * 1024)
+    os.replace(tmp, dst)
+    os.remove(path)
+    return dst
@@ -0,0 +1,210 @@
+import html
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# =============================================================================
+# [Sleekes Subtitle Converter]
+#
+# WebVTT 자막을 SRT로 변환하는 순수 파이썬 스트리밍 변환기입니다.
+# 아카이빙 모드에서는 자동 번역 자막까지 모두 받기 때문에 영상 하나에 수십~백여 개의
+# 자막 트랙이 생길 수 있는데, 트랙마다 ffmpeg 프로세스를 띄우면 변환보다 프로세스 생성 비용이
+# 훨씬 큽니다. 이 모듈은 프로세스를 만들지 않고 한 번에 모든 트랙을 변환합니다.
+#
+# - 입력을 한 줄씩 읽고 큐(cue) 단위로 바로 기록하므로 메모리 사용량이 파일 크기와 무관합니다.
+# - 헤더, STYLE/NOTE/REGION 블록, 큐 식별자와 배치 설정(align, position 등)은 버립니다.
+# - 서식 태그 중 <b>, <i>, <u>만 남기고 나머지(<c>, <v>, 단어별 타임스탬프 등)는 제거하며,
+#   HTML 엔티티(&amp; 등)는 일반 문자로 되돌립니다. (ffmpeg의 출력과 같은 규칙)
+#
+# 자막 트랙 선택:
+#   언어 우선순위 목록(예: "orig,ko,en")에 따라 받을 트랙만 고르고, 고른 트랙을 동시에 내려받습니다.
+#   - all  : 원본 + 자동 번역을 포함한 모든 트랙
+#   - orig : 업로더가 올린 모든 자막 + 원어 자동 생성 자막(-orig), 자동 번역 제외
+#   - 언어 코드 : 업로더 자막이 있으면 그것을, 없으면 자동 자막(자동 번역 포함)을 사용
+# =============================================================================
+
+SUB_TIER_ALL = "all"
+SUB_TIER_ORIGINALS = "orig"
+DEFAULT_SUB_LANGS = SUB_TIER_ORIGINALS
+
+_TIMING = re.compile(r"^\s*((?:\d+:)?\d{1,2}:\d{2}[.,]\d{1,3})\s+-->\s+((?:\d+:)?\d{1,2}:\d{2}[.,]\d{1,3})")
+_TAG = re.compile(r"<(/?)([a-zA-Z]*)[^>]*>")
+_KEPT_TAGS = ("b", "i", "u")
+_SKIPPED_BLOCKS = ("NOTE", "STYLE", "REGION")
+
+def _parse_timestamp(value: str) -> int:
+    """'hh:mm:ss.ttt' 또는 'mm:ss.ttt'를 밀리초로 변환합니다."""
+    clock, _, fraction = value.replace(",", ".").partition(".")
+    seconds = 0
+    for part in clock.split(":"):
+        seconds = seconds * 60 + int(part)
+    return seconds * 1000 + int(fraction.ljust(3, "0")[:3])
+
+def _format_timestamp(ms: int) -> str:
+    hours, ms = divmod(ms, 3600000)
+    minutes, ms = divmod(ms, 60000)
+    seconds, ms = divmod(ms, 1000)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d},{ms:03d}"
+
+def _clean_text(line: str) -> str:
+    line = _TAG.sub(lambda m: m.group(0) if m.group(2).lower() in _KEPT_TAGS else "", line)
+    return html.unescape(line).replace("\u200e", "").replace("\u200f", "")
+
+def iter_vtt_cues(lines: Iterable[str]) -> Iterator[Tuple[int, int, List[str]]]:
+    """
+    WebVTT 입력에서 (시작 ms, 끝 ms, 텍스트 줄 목록)을 하나씩 꺼냅니다.
+
+    Args:
+        lines (Iterable[str]): 파일 객체 등 줄 단위 입력
+    """
+    cue = None
+    skipping = False
+    for raw in lines:
+        line = raw.rstrip("\r\n").lstrip("\ufeff")
+        if not line.strip():
+            if cue and cue[2]:
+                yield cue
+            cue = None
+            skipping = False
+            continue
+        if skipping:
+            continue
+        if cue is not None:
+            cue[2].append(_clean_text(line))
+            continue
+
+        match = _TIMING.match(line)
+        if match:
+            cue = (_parse_timestamp(match.group(1)), _parse_timestamp(match.group(2)), [])
+        elif line.split(" ", 1)[0] in _SKIPPED_BLOCKS:
+            skipping = True
+        # 그 외(WEBVTT 헤더, Kind:/Language: 메타데이터, 큐 식별자)는 무시합니다
+    if cue and cue[2]:
+        yield cue
+
+def vtt_to_srt(src: str, dst: str) -> int:
+    """
+    VTT 파일 하나를 SRT로 변환합니다.
+
+    Returns:
+        int: 기록한 큐 개수
+    """
+    count = 0
+    with open(src, "r", encoding="utf-8", errors="replace") as fin, \
+         open(dst, "w", encoding="utf-8", newline="\n") as fout:
+        for start, end, text in iter_vtt_cues(fin):
+            count += 1
+            fout.write(f"{count}\n{_format_timestamp(start)} --> {_format_timestamp(end)}\n")
+            fout.write("\n".join(text))
+            fout.write("\n\n")
+    return count
+
+def convert_tracks(paths: Iterable[str]) -> Tuple[int, List[str]]:
+    """
+    한 영상의 VTT 자막 트랙을 모두 SRT로 변환하고, 성공한 원본은 삭제합니다.
+
+    Args:
+        paths (Iterable[str]): .vtt 파일 경로 목록
+
+    Returns:
+        tuple: (변환한 트랙 수, 실패한 파일 경로 목록)
+    """
+    converted = 0
+    failed = []
+    for src in paths:
+        dst = os.path.splitext(src)[0] + ".srt"
+        try:
+            vtt_to_srt(src, dst)
+        except (OSError, ValueError):
+            failed.append(src)
+            continue
+        os.remove(src)
+        converted += 1
+    return converted, failed
+
+def parse_sub_langs(spec) -> List[str]:
+    """'orig,ko,en' 형태의 문자열(또는 목록)을 중복 없는 우선순위 목록으로 변환합니다."""
+    if isinstance(spec, str):
+        spec = spec.split(",")
+    langs = []
+    for lang in spec or []:
+        lang = lang.strip()
+        if lang == "originals":
+            lang = SUB_TIER_ORIGINALS
+        if lang and lang not in langs:
+            langs.append(lang)
+    return langs
+
+def _pick_format(formats: List[dict], preferred_ext: str) -> dict:
+    matches = [f for f in formats if f.get("ext") == preferred_ext]
+    return dict((matches or formats)[-1])
+
+def select_tracks(subtitles: Optional[dict], automatic_captions: Optional[dict], langs: List[str],
+                  preferred_ext: str = "vtt") -> Dict[str, dict]:
+    """
+    우선순위 목록에 따라 받을 자막 트랙을 고릅니다.
+
+    Args:
+        subtitles (dict): info['subtitles'] (업로더 자막)
+        automatic_captions (dict): info['automatic_captions'] (자동 생성/자동 번역 자막)
+        langs (list): parse_sub_langs()의 결과
+        preferred_ext (str): 여러 형식이 있을 때 우선할 확장자
+
+    Returns:
+        dict: 언어 코드 -> 선택한 형식 딕셔너리 (원본 info를 건드리지 않도록 사본)
+    """
+    normal = {lang: formats for lang, formats in (subtitles or {}).items() if formats}
+    auto = {lang: formats for lang, formats in (automatic_captions or {}).items() if formats}
+
+    selected = {}
+    def add(lang, formats):
+        if lang not in selected:
+            selected[lang] = _pick_format(formats, preferred_ext)
+
+    for token in langs:
+        if token == SUB_TIER_ALL:
+            for lang, formats in list(normal.items()) + list(auto.items()):
+                add(lang, formats)
+        elif token == SUB_TIER_ORIGINALS:
+            for lang, formats in normal.items():
+                add(lang, formats)
+            for lang, formats in auto.items():
+                if lang.endswith("-orig"):
+                    add(lang, formats)
+        else:
+            # 업로더 자막은 지역 변형(en -> en-US)까지 포함합니다
+            variants = [lang for lang in normal if lang == token or lang.startswith(token + "-")]
+            for lang in variants:
+                add(lang, normal[lang])
+            if not variants and token in auto:
+                add(token, auto[token])
+    return selected
+
+def fetch_tracks(tracks: Dict[str, dict], fetch: Callable[[dict], str], workers: int = 4) -> List[str]:
+    """
+    선택한 트랙을 동시에 내려받아 각 트랙의 'data'에 채웁니다.
+    yt-dlp는 'data'가 있는 트랙을 네트워크 요청 없이 그대로 기록합니다.
+
+    Args:
+        tracks (dict): select_tracks()의 결과 (제자리에서 수정됨)
+        fetch: fetch(track) -> 자막 텍스트
+        workers (int): 동시 요청 수
+
+    Returns:
+        list: 받지 못한 언어 코드 목록 (해당 트랙은 yt-dlp의 기본 경로로 다시 시도됩니다)
+    """
+    pending = {lang: track for lang, track in tracks.items() if track.get("data") is None and track.get("url")}
+    if not pending:
+        return []
+
+    def run(item):
+        lang, track = item
+        try:
+            track["data"] = fetch(track)
+            return None
+        except Exception:
+            return lang
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(pending))), thread_name_prefix="sleekes-subs") as pool:
+        return [lang for lang in pool.map(run, pending.items()) if lang]
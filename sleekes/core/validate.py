@@ -0,0 +1,143 @@
+import json
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Optional
+
+from sleekes.core.postproc import low_priority
+
+# =============================================================================
+# [Sleekes Media Validator]
+#
+# 다운로드가 '성공'으로 끝나도(ignoreerrors) 병합 실패 등으로 손상되었거나 오디오가 빠진 파일이
+# 남을 수 있습니다. 이 모듈은 세션이 끝난 뒤 받은 미디어 파일을 워커 풀에서 동시에 검사합니다.
+#
+#   1. ffprobe : 컨테이너를 읽을 수 있는지, 영상/오디오 스트림이 기대한 대로 있는지,
+#                재생 시간이 메타데이터의 길이보다 눈에 띄게 짧지 않은지 (잘린 파일)
+#   2. ffmpeg  : 앞부분과 끝부분 몇 초를 실제로 디코딩해 오류가 없는지 (-xerror)
+#
+# 전체를 디코딩하지 않으므로 영상 길이와 관계없이 파일당 수백 ms 안에 끝납니다.
+# ffprobe/ffmpeg가 없으면 검사를 건너뜁니다.
+# =============================================================================
+
+DECODE_SECONDS = 3
+# 메타데이터 길이보다 이만큼(초 또는 비율 중 큰 값) 이상 짧으면 잘린 것으로 봅니다
+DURATION_SLACK_SECONDS = 3.0
+DURATION_SLACK_RATIO = 0.05
+PROBE_TIMEOUT = 120
+
+class MediaValidator:
+    def __init__(self, workers: int = 2, log_callback: Optional[Callable] = None):
+        """
+        Args:
+            workers (int): 동시에 검사할 파일 수
+            log_callback: 로그 문자열을 받는 콜백
+        """
+        self.workers = max(1, workers)
+        self.log_callback = log_callback
+        self.ffprobe = shutil.which('ffprobe')
+        self.ffmpeg = shutil.which('ffmpeg')
+
+    @property
+    def available(self) -> bool:
+        return bool(self.ffprobe and self.ffmpeg)
+
+    def _log(self, message: str):
+        if self.log_callback:
+            self.log_callback(message)
+
+    def _run(self, cmd: List[str]) -> subprocess.CompletedProcess:
+        # 다운로드/변환보다 낮은 우선순위로 실행합니다 (워커 스레드에서 실행되므로 preexec_fn은 쓰지 않음)
+        return subprocess.run(low_priority(cmd), stdin=subprocess.DEVNULL, capture_output=True, timeout=PROBE_TIMEOUT)
+
+    def probe(self, path: str) -> dict:
+        """
+        ffprobe로 컨테이너 정보를 읽습니다.
+
+        Returns:
+            dict: {"duration": 초 또는 None, "video": 영상 스트림 수, "audio": 오디오 스트림 수}
+
+        Raises:
+            ValueError: 컨테이너를 읽을 수 없는 경우
+        """
+        result = self._run([self.ffprobe, '-v', 'error', '-show_entries', 'format=duration:stream=codec_type',
+                            '-of', 'json', path])
+        if result.returncode != 0:
+            lines = result.stderr.decode('utf-8', 'replace').strip().splitlines()
+            raise ValueError(lines[-1] if lines else 'ffprobe failed')
+        data = json.loads(result.stdout or b'{}')
+        types = [s.get('codec_type') for s in data.get('streams', [])]
+        try:
+            duration = float(data.get('format', {}).get('duration'))
+        except (TypeError, ValueError):
+            duration = None
+        return {"duration": duration, "video": types.count('video'), "audio": types.count('audio')}
+
+    def _decode_error(self, path: str, seek: List[str]) -> Optional[str]:
+        result = self._run([self.ffmpeg, '-nostdin', '-v', 'error', '-xerror'] + seek +
+                           ['-i', path, '-t', str(DECODE_SECONDS), '-f', 'null', '-'])
+        if result.returncode == 0:
+            return None
+        lines = result.stderr.decode('utf-8', 'replace').strip().splitlines()
+        return lines[-1] if lines else 'decode failed'
+
+    def check(self, item: dict) -> Optional[str]:
+        """
+        파일 하나를 검사합니다.
+
+        Args:
+            item (dict): {"path", "duration"(기대 길이), "video"/"audio"(스트림이 있어야 하면 True)}
+
+        Returns:
+            str: 발견한 문제 (정상이면 None)
+        """
+        path = item["path"]
+        if not path or not os.path.exists(path):
+            return "file missing"
+        if os.path.getsize(path) == 0:
+            return "empty file"
+        try:
+            info = self.probe(path)
+        except (OSError, ValueError, subprocess.TimeoutExpired) as e:
+            return f"unreadable container ({str(e)})"
+
+        if item.get("video") and not info["video"]:
+            return "no video stream"
+        if item.get("audio") and not info["audio"]:
+            return "no audio stream"
+
+        expected = item.get("duration")
+        actual = info["duration"]
+        if expected and actual is not None:
+            slack = max(DURATION_SLACK_SECONDS, expected * DURATION_SLACK_RATIO)
+            if actual < expected - slack:
+                return f"truncated ({actual:.0f}s of {expected:.0f}s)"
+
+        try:
+            error = self._decode_error(path, [])
+            # 끝부분은 파일이 디코딩 구간의 두 배보다 길 때만 따로 확인합니다
+            if not error and (actual or 0) > DECODE_SECONDS * 2:
+                error = self._decode_error(path, ['-sseof', f'-{DECODE_SECONDS}'])
+        except (OSError, subprocess.TimeoutExpired) as e:
+            error = str(e)
+        return f"decode error ({error})" if error else None
+
+    def validate(self, items: List[dict]) -> List[dict]:
+        """
+        여러 파일을 동시에 검사하고 문제가 있는 항목만 반환합니다. (각 항목에 "problem" 추가)
+        """
+        if not items:
+            return []
+        if not self.available:
+            self._log("VALIDATE WARNING: ffprobe/ffmpeg not found. Skipping media validation.")
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(items)), thread_name_prefix="sleekes-validate") as pool:
+            problems = list(pool.map(self.check, items))
+
+        broken = []
+        for item, problem in zip(items, problems):
+            if problem:
+                broken.append(dict(item, problem=problem))
+        return broken
@@ -0,0 +1,355 @@
+import os
+from collections import OrderedDict
+from typing import Optional
+
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLineEdit, QLabel, QPushButton,
+                             QTableView, QHeaderView, QAbstractItemView)
+from PySide6.QtCore import (Qt, QAbstractTableModel, QModelIndex, QObject, QRunnable, QThread, QThreadPool,
+                            QTimer, QSize, QUrl, Signal, Slot)
+from PySide6.QtGui import QImage, QImageReader, QPixmap, QDesktopServices
+from sleekes.core.catalog import ArchiveCatalog
+from sleekes.core import storage
+from sleekes.ui import i18n
+
+# =============================================================================
+# [Sleekes Archive Browser]
+#
+# 아카이빙한 영상을 검색/탐색하는 탭입니다. 폴더를 직접 훑지 않고 아카이브 카탈로그
+# (sleekes.core.catalog)에서 한 페이지씩 가져오므로, 폴더가 수만 개여도 탭을 여는 비용이 일정합니다.
+#
+# - ArchiveModel: 스크롤이 끝에 닿을 때마다 Qt의 fetchMore()로 다음 페이지만 조회하는 지연 모델
+# - ThumbnailLoader: 화면에 그려지는 행의 썸네일만 스레드 풀에서 축소 디코딩하고,
+#   메모리 상한(바이트)을 넘으면 가장 오래 안 쓴 것부터 버리는 LRU 캐시에 보관
+#   (QPixmap은 GUI 스레드 전용이므로 작업 스레드는 QImage까지만 만들고 변환은 GUI 스레드에서 합니다)
+# =============================================================================
+
+PAGE_SIZE = 200
+THUMB_SIZE = QSize(96, 54)
+THUMB_WORKERS = 4
+# 썸네일 캐시 상한 (96x54 RGBA 기준 약 1,200장)
+THUMB_CACHE_BYTES = 24 * 1024 * 1024
+THUMB_EXTENSIONS = (".jpg", ".webp", ".png", ".jpeg")
+
+COL_DATE, COL_TITLE, COL_CHANNEL, COL_DURATION = range(4)
+
+def _thumbnail_key(info_path: str) -> str:
+    """info.json 경로에서 확장자를 뺀 영상 파일 기준 경로를 구합니다. (썸네일 캐시 키)"""
+    return storage.strip_codec(info_path)[:-len(".info.json")]
+
+class _ThumbnailJob(QRunnable):
+    def __init__(self, loader, key: str):
+        super().__init__()
+        self.loader = loader
+        self.key = key
+
+    def run(self):
+        image = QImage()
+        for ext in THUMB_EXTENSIONS:
+            path = self.key + ext
+            if not os.path.exists(path):
+                continue
+            reader = QImageReader(path)
+            # 원본 크기로 풀지 않고 디코딩 단계에서 바로 축소합니다 (JPEG는 디코더 자체가 빨라짐)
+            size = reader.size()
+            if size.isValid():
+                reader.setScaledSize(size.scaled(THUMB_SIZE, Qt.KeepAspectRatio))
+            image = reader.read()
+            if not image.isNull():
+                break
+        self.loader._decoded.emit(self.key, image)
+
+class ThumbnailLoader(QObject):
+    loaded = Signal(str)
+    _decoded = Signal(str, QImage)
+
+    def __init__(self, limit_bytes: int = THUMB_CACHE_BYTES, parent=None):
+        super().__init__(parent)
+        self.limit_bytes = limit_bytes
+        self._cache = OrderedDict()  # key -> (QPixmap 또는 None, 바이트)
+        self._bytes = 0
+        self._pending = set()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(THUMB_WORKERS)
+        self._decoded.connect(self._on_decoded)
+
+    def get(self, key: str) -> Optional[QPixmap]:
+        """캐시된 썸네일을 반환합니다. 없으면 백그라운드 디코딩을 요청하고 None을 반환합니다."""
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key][0]
+        if key not in self._pending:
+            self._pending.add(key)
+            self.pool.start(_ThumbnailJob(self, key))
+        return None
+
+    def cancel_pending(self):
+        """아직 시작하지 않은 디코딩 요청을 버립니다. (검색어가 바뀌어 화면 목록이 달라진 경우)"""
+        self.pool.clear()
+        self._pending.clear()
+
+    def shutdown(self):
+        self.cancel_pending()
+        self.pool.waitForDone()
+
+    @Slot(str, QImage)
+    def _on_decoded(self, key, image):
+        self._pending.discard(key)
+        if image.isNull():
+            # 썸네일이 없는 영상도 기록해 두어 스크롤할 때마다 파일을 다시 찾지 않게 합니다
+            entry = (None, 64)
+        else:
+            entry = (QPixmap.fromImage(image), image.sizeInBytes())
+        if key in self._cache:
+            self._bytes -= self._cache.pop(key)[1]
+        self._cache[key] = entry
+        self._bytes += entry[1]
+        while self._bytes > self.limit_bytes and len(self._cache) > 1:
+            _, (_, cost) = self._cache.popitem(last=False)
+            self._bytes -= cost
+        self.loaded.emit(key)
+
+class ArchiveModel(QAbstractTableModel):
+    def __init__(self, catalog: ArchiveCatalog, thumbnails: ThumbnailLoader, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog
+        self.thumbnails = thumbnails
+        self.query = ""
+        self.total = 0
+        self._rows = []
+        self._row_of = {}   # 썸네일 키 -> 행 번호
+        self._headers = ["", "", "", ""]
+        self.thumbnails.loaded.connect(self._on_thumbnail)
+
+    def set_headers(self, labels):
+        self._headers = list(labels)
+        self.headerDataChanged.emit(Qt.Horizontal, 0, len(self._headers) - 1)
+
+    def set_query(self, text: str):
+        """검색어를 바꾸고 첫 페이지부터 다시 불러옵니다. (나머지는 스크롤할 때 fetchMore로)"""
+        self.thumbnails.cancel_pending()
+        self.beginResetModel()
+        self.query = text
+        self._rows = []
+        self._row_of = {}
+        self.total = self.catalog.count(text)
+        self.endResetModel()
+        if self.canFetchMore():
+            self.fetchMore()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and len(self._rows) < self.total
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        page = self.catalog.search(self.query, limit=PAGE_SIZE, offset=len(self._rows))
+        if not page:
+            # 조회 사이에 카탈로그가 줄어든 경우
+            self.total = len(self._rows)
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(page) - 1)
+        for offset, item in enumerate(page):
+            item["thumb_key"] = _thumbnail_key(item["info_path"])
+            self._row_of[item["thumb_key"]] = first + offset
+        self._rows.extend(page)
+        self.endInsertRows()
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole and 0 <= section < len(self._headers):
+            return self._headers[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self._rows):
+            return None
+        item = self._rows[index.row()]
+        col = index.column()
+
+        if role == Qt.DisplayRole:
+            if col == COL_DATE:
+                date = item["upload_date"] or ""
+                return f"{date[:4]}-{date[4:6]}-{date[6:8]}" if len(date) == 8 else ""
+            if col == COL_TITLE:
+                return item["title"] or item["video_id"]
+            if col == COL_CHANNEL:
+                return item["channel"] or ""
+            if col == COL_DURATION and item["duration"]:
+                minutes, seconds = divmod(int(item["duration"]), 60)
+                return f"{minutes // 60}:{minutes % 60:02d}:{seconds:02d}" if minutes >= 60 else f"{minutes:02d}:{seconds:02d}"
+        elif role == Qt.DecorationRole and col == COL_TITLE:
+            return self.thumbnails.get(item["thumb_key"])
+        elif role == Qt.ToolTipRole:
+            return os.path.basename(item["folder"])
+        elif role == Qt.UserRole:
+            return item
+        return None
+
+    @Slot(str)
+    def _on_thumbnail(self, key):
+        row = self._row_of.get(key)
+        if row is not None:
+            index = self.index(row, COL_TITLE)
+            self.dataChanged.emit(index, index, [Qt.DecorationRole])
+
+class ScanThread(QThread):
+    """카탈로그 증분 스캔을 백그라운드에서 실행합니다. (SQLite 연결은 스레드마다 따로 엽니다)"""
+    scanned = Signal(dict)
+
+    def __init__(self, root):
+        super().__init__()
+        self.root = root
+
+    def run(self):
+        catalog = ArchiveCatalog()
+        try:
+            stats = catalog.scan(self.root)
+        finally:
+            catalog.close()
+        self.scanned.emit(stats)
+
+class ArchiveBrowserWidget(QWidget):
+    """아카이브 카탈로그를 검색하고 썸네일과 함께 보여주는 탭입니다."""
+
+    def __init__(self):
+        super().__init__()
+        self.current_lang = "EN"
+        self.current_theme = "Dark"
+        self.root = None
+        self.catalog = None
+        self.model = None
+        self._scan_thread = None
+        self.thumbnails = ThumbnailLoader(parent=self)
+
+        # 입력할 때마다 조회하지 않도록 잠시 멈췄을 때만 검색합니다
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(250)
+        self._search_timer.timeout.connect(self.reload)
+        self.init_ui()
+
+    def init_ui(self):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(15, 25, 15, 15)
+
+        top = QHBoxLayout()
+        self.search_input = QLineEdit()
+        self.search_input.textChanged.connect(lambda _: self._search_timer.start())
+        top.addWidget(self.search_input)
+        self.count_label = QLabel()
+        self.count_label.setStyleSheet("font-size: 11px; font-weight: bold; color: #888;")
+        top.addWidget(self.count_label)
+        self.rescan_btn = QPushButton()
+        self.rescan_btn.setObjectName("SecondaryButton")
+        self.rescan_btn.clicked.connect(self.rescan)
+        top.addWidget(self.rescan_btn)
+        layout.addLayout(top)
+
+        self.view = QTableView()
+        self.view.setObjectName("ArchiveTable")
+        self.view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.view.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.view.setIconSize(THUMB_SIZE)
+        self.view.setWordWrap(False)
+        # 행 높이를 고정하면 뷰가 행마다 크기를 계산하지 않아 긴 목록에서도 스크롤이 가볍습니다
+        vheader = self.view.verticalHeader()
+        vheader.setVisible(False)
+        vheader.setSectionResizeMode(QHeaderView.Fixed)
+        vheader.setDefaultSectionSize(THUMB_SIZE.height() + 8)
+        self.view.doubleClicked.connect(self.open_folder)
+        layout.addWidget(self.view)
+
+    def _ensure_catalog(self):
+        if self.catalog is None:
+            self.catalog = ArchiveCatalog()
+            self.model = ArchiveModel(self.catalog, self.thumbnails, self)
+            self.model.set_headers(self._headers())
+            self.view.setModel(self.model)
+            header = self.view.horizontalHeader()
+            header.setSectionResizeMode(COL_DATE, QHeaderView.ResizeToContents)
+            header.setSectionResizeMode(COL_TITLE, QHeaderView.Stretch)
+            header.setSectionResizeMode(COL_CHANNEL, QHeaderView.Interactive)
+            header.setSectionResizeMode(COL_DURATION, QHeaderView.ResizeToContents)
+            self.view.setColumnWidth(COL_CHANNEL, 180)
+
+    def set_root(self, root):
+        """스캔 대상 아카이브 루트를 지정합니다. (다운로더 탭의 저장 경로)"""
+        self.root = root
+
+    def activate(self):
+        """탭이 보일 때 호출합니다. 처음이면 카탈로그를 열고, 아직 스캔하지 않은 루트면 스캔부터 시작합니다."""
+        first = self.catalog is None
+        self._ensure_catalog()
+        if self.root and not self.catalog.has_root(self.root):
+            self.rescan()
+        elif first:
+            self.reload()
+
+    @Slot()
+    def reload(self):
+        if self.model is None:
+            return
+        self.model.set_query(self.search_input.text().strip())
+        self._update_count()
+
+    @Slot()
+    def rescan(self):
+        if not self.root or self._scan_thread is not None:
+            return
+        self._ensure_catalog()
+        self.rescan_btn.setEnabled(False)
+        self.count_label.setText(i18n.TRANSLATIONS[self.current_lang]["archive_scanning"])
+        self._scan_thread = ScanThread(self.root)
+        self._scan_thread.scanned.connect(self._on_scanned)
+        self._scan_thread.finished.connect(self._on_scan_finished)
+        self._scan_thread.start()
+
+    @Slot(dict)
+    def _on_scanned(self, stats):
+        self.reload()
+
+    @Slot()
+    def _on_scan_finished(self):
+        self._scan_thread = None
+        self.rescan_btn.setEnabled(True)
+        self._update_count()
+
+    def _update_count(self):
+        if self.model is not None and self._scan_thread is None:
+            self.count_label.setText(i18n.TRANSLATIONS[self.current_lang]["archive_count"].format(count=self.model.total))
+
+    @Slot(QModelIndex)
+    def open_folder(self, index):
+        item = index.data(Qt.UserRole)
+        if item and os.path.isdir(item["folder"]):
+            QDesktopServices.openUrl(QUrl.fromLocalFile(os.path.abspath(item["folder"])))
+
+    def _headers(self):
+        t = i18n.TRANSLATIONS[self.current_lang]
+        return [t["archive_col_date"], t["archive_col_title"], t["archive_col_channel"], t["archive_col_duration"]]
+
+    def update_language(self, lang_code):
+        self.current_lang = lang_code
+        t = i18n.TRANSLATIONS[lang_code]
+        self.search_input.setPlaceholderText(t["archive_search_placeholder"])
+        self.rescan_btn.setText(t["archive_rescan"])
+        if self.model is not None:
+            self.model.set_headers(self._headers())
+        self._update_count()
+
+    def update_theme(self, theme_name):
+        self.current_theme = theme_name
+        self.view.viewport().update()
+
+    def shutdown(self):
+        self.thumbnails.shutdown()
+        if self._scan_thread is not None:
+            self._scan_thread.wait()
+        if self.catalog is not None:
+            self.catalog.close()
@@ -99,6 +99,7 @@ KO_CONTENT = """
 TRANSLATIONS = {
     "EN": {
         "nav_downloader": "Downloader",
+        "nav_archive": "Archive",
         "nav_guide": "Reference",
         "design_mode": "DESIGN MODE:",
         "lang_mode": "LANGUAGE:",
@@ -110,12 +111,16 @@ TRANSLATIONS = {
         "opt_audio_only": "Extraction Only (MP3)",
         "opt_metadata_only": "Metadata Only",
         "opt_stealth": "Anti-Ban Stealth",
+        "opt_native": "Native Container",
         "btn_rec": " Load Recommended",
         "detail_desc": "Desc",
         "detail_json": "JSON",
         "detail_subs": "Subs",
         "detail_thumb": "Thumb",
         "detail_comments": "Comments",
+        "sub_langs": "Subtitle Langs:",
+        "sub_langs_placeholder": "orig,ko,en (all = every track)",
+        "compress": "Compress:",
         "min_sleep": "MIN SLEEP(m):",
         "max_sleep": "MAX SLEEP(m):",
         "auth_cookies": "AUTH COOKIES:",
@@ -128,10 +133,34 @@ TRANSLATIONS = {
         "success": "SYSTEM: All assets secured and archived successfully.",
         "fail": "SYSTEM: Task interrupted or failed. Check logs above.",
         "btn_guide": " Guide",
+        "jobs_parallel": "PARALLEL JOBS:",
+        "jobs_col_url": "URL",
+        "jobs_col_status": "STATUS",
+        "jobs_col_progress": "PROGRESS",
+        "job_queued": "Queued",
+        "job_running": "Running",
+        "job_done": "Done",
+        "job_failed": "Failed",
+        "job_paused": "Paused",
+        "job_cancelled": "Cancelled",
+        "btn_pause": "Pause",
+        "btn_resume": "Resume",
+        "btn_cancel": "Cancel",
+        "btn_retry": "Retry",
+        "log_jobs_restored": "QUEUE: Restored {count} unfinished job(s) from the previous session.",
+        "archive_search_placeholder": "Search title, channel, description...",
+        "archive_rescan": "Rescan",
+        "archive_scanning": "SCANNING...",
+        "archive_count": "{count} VIDEOS",
+        "archive_col_date": "UPLOADED",
+        "archive_col_title": "TITLE",
+        "archive_col_channel": "CHANNEL",
+        "archive_col_duration": "LENGTH",
         "content_html": EN_CONTENT
     },
     "KO": {
         "nav_downloader": "다운로더",
+        "nav_archive": "아카이브",
         "nav_guide": "레퍼런스",
         "design_mode": "디자인 모드:",
         "lang_mode": "언어 설정:",
@@ -143,12 +172,16 @@ TRANSLATIONS = {
         "opt_audio_only": "오디오 추출 (MP3)",
         "opt_metadata_only": "데이터만 수집",
         "opt_stealth": "차단방지 스텔스",
+        "opt_native": "원본 코덱 유지",
         "btn_rec": " 권장 설정 로드",
         "detail_desc": "설명",
         "detail_json": "정보",
         "detail_subs": "자막",
         "detail_thumb": "썸네일",
         "detail_comments": "댓글",
+        "sub_langs": "자막 언어:",
+        "sub_langs_placeholder": "orig,ko,en (all = 모든 트랙)",
+        "compress": "압축:",
         "min_sleep": "최소 휴식(분):",
         "max_sleep": "최대 휴식(분):",
         "auth_cookies": "인증 쿠키:",
@@ -161,6 +194,29 @@ TRANSLATIONS = {
         "success": "시스템: 모든 에셋이 안전하게 아카이빙되었습니다.",
         "fail": "시스템: 작업이 중단되었거나 실패했습니다. 로그를 확인하세요.",
         "btn_guide": " 가이드",
+        "jobs_parallel": "동시 작업 수:",
+        "jobs_col_url": "URL",
+        "jobs_col_status": "상태",
+        "jobs_col_progress": "진행률",
+        "job_queued": "대기",
+        "job_running": "진행 중",
+        "job_done": "완료",
+        "job_failed": "실패",
+        "job_paused": "일시정지",
+        "job_cancelled": "취소됨",
+        "btn_pause": "일시정지",
+        "btn_resume": "재개",
+        "btn_cancel": "취소",
+        "btn_retry": "재시도",
+        "log_jobs_restored": "대기열: 이전 세션에서 끝나지 않은 작업 {count}개를 복원했습니다.",
+        "archive_search_placeholder": "제목, 채널, 설명 검색...",
+        "archive_rescan": "다시 스캔",
+        "archive_scanning": "스캔 중...",
+        "archive_count": "영상 {count}개",
+        "archive_col_date": "업로드",
+        "archive_col_title": "제목",
+        "archive_col_channel": "채널",
+        "archive_col_duration": "길이",
         "content_html": KO_CONTENT
     }
 }
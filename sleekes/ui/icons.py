@@ -1,14 +1,27 @@
-from PySide6.QtGui import QIcon, QPixmap, QPainter
+from PySide6.QtGui import QIcon, QPixmap, QPainter, QGuiApplication
 from PySide6.QtSvg import QSvgRenderer
 from PySide6.QtCore import QByteArray, QSize, Qt
 
-def svg_to_icon(svg_str, color="#ffffff", size=QSize(24, 24)):
-    """SVG 문자열을 QIcon으로 변환합니다."""
+# 렌더링된 아이콘 캐시: (svg, 색상, 너비, 높이, 배율) -> QIcon
+# 테마 전환 시 SVG를 다시 그리지 않고 조회만 하도록 합니다.
+_ICON_CACHE = {}
+
+# 무채색 팔레트의 아이콘 색상 (Dark 테마: 흰색, Light 테마: 검은색)
+ACHROMATIC_COLORS = ("#ffffff", "#000000")
+
+def _device_pixel_ratio():
+    """현재 화면 배율(HiDPI)을 반환합니다. QApplication 생성 전이면 1.0입니다."""
+    app = QGuiApplication.instance()
+    return app.devicePixelRatio() if app else 1.0
+
+def _render(svg_str, color, size, dpr):
     # 색상 적용 (단순 문자열 치환)
     svg_colored = svg_str.replace('currentColor', color)
     
     renderer = QSvgRenderer(QByteArray(svg_colored.encode('utf-8')))
-    pixmap = QPixmap(size)
+    # 실제 픽셀 크기로 그린 뒤 배율을 지정하여 HiDPI 화면에서도 선명하게 표시합니다
+    pixmap = QPixmap(QSize(round(size.width() * dpr), round(size.height() * dpr)))
+    pixmap.setDevicePixelRatio(dpr)
     pixmap.fill(Qt.transparent)
     
     painter = QPainter(pixmap)
@@ -17,6 +30,25 @@ def svg_to_icon(svg_str, color="#ffffff", size=QSize(24, 24)):
     
     return QIcon(pixmap)
 
+def svg_to_icon(svg_str, color="#ffffff", size=QSize(24, 24), dpr=None):
+    """SVG 문자열을 QIcon으로 변환합니다. 같은 조합은 배율별로 한 번만 렌더링됩니다."""
+    if dpr is None:
+        dpr = _device_pixel_ratio()
+
+    key = (svg_str, color, size.width(), size.height(), dpr)
+    icon = _ICON_CACHE.get(key)
+    if icon is None:
+        icon = _render(svg_str, color, size, dpr)
+        _ICON_CACHE[key] = icon
+    return icon
+
+def prerender(svg_list, colors=ACHROMATIC_COLORS, size=QSize(24, 24)):
+    """주어진 아이콘들을 두 무채색 팔레트로 미리 렌더링하여 캐시에 채웁니다."""
+    dpr = _device_pixel_ratio()
+    for svg_str in svg_list:
+        for color in colors:
+            svg_to_icon(svg_str, color, size, dpr)
+
 # --- SVG Icon Definitions (Achromatic Design) ---
 
 # 📂 다운로드 센터 (Folder)
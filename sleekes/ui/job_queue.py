@@ -0,0 +1,282 @@
+import os
+import json
+import time
+import uuid
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSpinBox, QPushButton,
+                             QTableWidget, QTableWidgetItem, QProgressBar, QHeaderView, QAbstractItemView)
+from PySide6.QtCore import QThread, Signal, Slot
+from sleekes.core.downloader import SleekesDownloader
+from sleekes.core.config import SETTINGS_DIR, write_json_atomic
+from sleekes.ui import i18n
+
+# =============================================================================
+# [Sleekes Job Queue]
+#
+# 여러 URL을 대기열에 넣고 지정한 개수만큼 병렬로 실행하는 작업 관리 패널입니다.
+# 각 작업은 자체 DownloadThread와 진행률 행(row)을 가지며,
+# 대기 중/실행 중인 작업은 settings/jobs.json에 기록되어 앱을 다시 켜도 이어서 실행됩니다.
+#
+# 행마다 일시정지/재개, 취소/재시도 버튼을 제공합니다. 취소된 작업을 재시도하면
+# 아카이브 인덱스가 원래 폴더를 찾아 남아 있는 .part 파일에서 이어받습니다.
+# =============================================================================
+
+JOBS_FILE = os.path.join(SETTINGS_DIR, "jobs.json")
+
+STATUS_QUEUED = "queued"
+STATUS_RUNNING = "running"
+STATUS_PAUSED = "paused"
+STATUS_DONE = "done"
+STATUS_FAILED = "failed"
+STATUS_CANCELLED = "cancelled"
+
+# 앱을 다시 켰을 때 이어서 실행할 상태
+RESUMABLE_STATUSES = (STATUS_QUEUED, STATUS_RUNNING, STATUS_PAUSED)
+
+class DownloadThread(QThread):
+    progress = Signal(dict)
+    log = Signal(str)
+    finished_signal = Signal(bool)
+
+    def __init__(self, url, output_path, options):
+        super().__init__()
+        self.url = url
+        self.output_path = output_path
+        self.options = options
+        # 실행 전에도 취소/일시정지를 요청할 수 있도록 엔진을 미리 생성합니다
+        self.downloader = SleekesDownloader(
+            progress_callback=self.progress.emit,
+            log_callback=self.log.emit
+        )
+
+    def run(self):
+        success = self.downloader.download(self.url, self.output_path, self.options)
+        self.finished_signal.emit(success)
+
+class JobQueueWidget(QWidget):
+    log = Signal(str)
+    job_finished = Signal(bool)
+
+    def __init__(self, max_workers=2):
+        super().__init__()
+        self.current_lang = "EN"
+        self.jobs = []       # 작업 딕셔너리 목록 (표시 순서와 동일)
+        self.threads = {}    # job id -> DownloadThread
+        self._shutting_down = False
+        self.init_ui(max_workers)
+
+    def init_ui(self, max_workers):
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+
+        top = QHBoxLayout()
+        self.workers_label = QLabel()
+        self.workers_label.setStyleSheet("font-size: 11px; font-weight: bold; color: #888;")
+        self.workers_spin = QSpinBox()
+        self.workers_spin.setRange(1, 8)
+        self.workers_spin.setValue(max_workers)
+        self.workers_spin.valueChanged.connect(self.pump)
+        top.addWidget(self.workers_label)
+        top.addWidget(self.workers_spin)
+        top.addStretch()
+        layout.addLayout(top)
+
+        self.table = QTableWidget(0, 4)
+        self.table.setObjectName("JobTable")
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionMode(QAbstractItemView.NoSelection)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.Stretch)
+        header.setSectionResizeMode(1, QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(2, QHeaderView.Fixed)
+        self.table.setColumnWidth(2, 220)
+        header.setSectionResizeMode(3, QHeaderView.ResizeToContents)
+        layout.addWidget(self.table)
+
+    def update_language(self, lang_code):
+        self.current_lang = lang_code
+        t = i18n.TRANSLATIONS[lang_code]
+        self.workers_label.setText(t["jobs_parallel"])
+        self.table.setHorizontalHeaderLabels([t["jobs_col_url"], t["jobs_col_status"], t["jobs_col_progress"], ""])
+        for job in self.jobs:
+            self._set_status(job, job["status"])
+
+    # --- 작업 관리 ---
+
+    def enqueue(self, url, output_path, options, job_id=None):
+        """작업을 대기열에 추가하고 여유 워커가 있으면 바로 실행합니다."""
+        job = {
+            "id": job_id or uuid.uuid4().hex,
+            "url": url,
+            "output_path": output_path,
+            "options": options,
+            "status": STATUS_QUEUED,
+        }
+        self.jobs.append(job)
+
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        self.table.setItem(row, 0, QTableWidgetItem(url))
+        self.table.setItem(row, 1, QTableWidgetItem(i18n.TRANSLATIONS[self.current_lang]["job_queued"]))
+        pbar = QProgressBar()
+        pbar.setValue(0)
+        pbar.setTextVisible(False)
+        self.table.setCellWidget(row, 2, pbar)
+        self.table.setCellWidget(row, 3, self._create_actions(job))
+        self._set_status(job, STATUS_QUEUED)
+
+        self.persist()
+        self.pump()
+
+    def _create_actions(self, job):
+        actions = QWidget()
+        box = QHBoxLayout(actions)
+        box.setContentsMargins(4, 0, 4, 0)
+        job["pause_btn"] = QPushButton()
+        job["pause_btn"].setObjectName("SecondaryButton")
+        job["pause_btn"].clicked.connect(lambda: self.toggle_pause(job))
+        job["stop_btn"] = QPushButton()
+        job["stop_btn"].setObjectName("SecondaryButton")
+        job["stop_btn"].clicked.connect(lambda: self.cancel_or_retry(job))
+        box.addWidget(job["pause_btn"])
+        box.addWidget(job["stop_btn"])
+        return actions
+
+    def _set_status(self, job, status):
+        """작업 상태를 바꾸고 상태 문구와 버튼 표시를 갱신합니다."""
+        t = i18n.TRANSLATIONS[self.current_lang]
+        job["status"] = status
+        row = self.jobs.index(job)
+        self.table.item(row, 1).setText(t[f"job_{status}"])
+
+        job["pause_btn"].setText(t["btn_resume"] if status == STATUS_PAUSED else t["btn_pause"])
+        job["pause_btn"].setEnabled(status in (STATUS_RUNNING, STATUS_PAUSED))
+        job["stop_btn"].setText(t["btn_retry"] if status in (STATUS_FAILED, STATUS_CANCELLED) else t["btn_cancel"])
+        job["stop_btn"].setEnabled(status != STATUS_DONE)
+
+    def toggle_pause(self, job):
+        thread = self.threads.get(job["id"])
+        if not thread:
+            return
+        if job["status"] == STATUS_PAUSED:
+            thread.downloader.resume()
+            self._set_status(job, STATUS_RUNNING)
+        else:
+            thread.downloader.pause()
+            self._set_status(job, STATUS_PAUSED)
+        self.persist()
+
+    def cancel_or_retry(self, job):
+        """실행/대기 중이면 취소하고, 실패/취소된 작업이면 다시 대기열에 넣습니다."""
+        if job["status"] in (STATUS_FAILED, STATUS_CANCELLED):
+            self.table.cellWidget(self.jobs.index(job), 2).setValue(0)
+            self._set_status(job, STATUS_QUEUED)
+            self.persist()
+            self.pump()
+            return
+
+        thread = self.threads.get(job["id"])
+        if thread:
+            # 실제 중단은 엔진의 다음 확인 지점에서 일어나며, 완료 처리는 _on_finished에서 합니다
+            thread.downloader.cancel()
+        else:
+            self._set_status(job, STATUS_CANCELLED)
+            self.persist()
+
+    @Slot()
+    def pump(self):
+        """실행 중인 작업 수가 설정된 병렬 수보다 적으면 대기 중인 작업을 시작합니다."""
+        for job in self.jobs:
+            if len(self.threads) >= self.workers_spin.value():
+                break
+            if job["status"] != STATUS_QUEUED:
+                continue
+
+            thread = DownloadThread(job["url"], job["output_path"], job["options"])
+            pbar = self.table.cellWidget(self.jobs.index(job), 2)
+            thread.progress.connect(lambda d, bar=pbar: self._on_progress(bar, d))
+            thread.log.connect(self.log)
+            thread.finished_signal.connect(lambda ok, j=job: self._on_finished(j, ok))
+            self.threads[job["id"]] = thread
+
+            self._set_status(job, STATUS_RUNNING)
+            thread.start()
+
+    def _on_progress(self, pbar, d):
+        if d['status'] == 'downloading' and d['percent'] is not None:
+            pbar.setValue(int(d['percent']))
+
+    def _on_finished(self, job, success):
+        thread = self.threads.pop(job["id"], None)
+        if thread:
+            thread.wait()
+            thread.deleteLater()
+        if self._shutting_down:
+            return
+
+        if thread and thread.downloader.cancelled:
+            self._set_status(job, STATUS_CANCELLED)
+        else:
+            self._set_status(job, STATUS_DONE if success else STATUS_FAILED)
+        if success:
+            self.table.cellWidget(self.jobs.index(job), 2).setValue(100)
+
+        self.persist()
+        self.job_finished.emit(success)
+        self.pump()
+
+    def running_count(self):
+        return len(self.threads)
+
+    def shutdown(self, timeout_ms=10000):
+        """
+        앱 종료 시 호출합니다. 남은 작업을 먼저 기록한 뒤 실행 중인 작업을 취소하고 스레드 종료를 기다립니다.
+        취소된 작업은 다음 실행 때 같은 폴더에서 이어받습니다.
+
+        네트워크 호출이나 ffmpeg에 묶인 작업은 취소 확인 지점에 늦게 도달할 수 있으므로,
+        모든 스레드를 합쳐 timeout_ms까지만 기다리고 창 닫기를 막지 않습니다.
+
+        Returns:
+            int: 제한 시간 안에 끝나지 않은 작업 수
+        """
+        self.persist()
+        self._shutting_down = True
+        for thread in self.threads.values():
+            thread.downloader.cancel()
+
+        deadline = time.monotonic() + timeout_ms / 1000.0
+        stuck = 0
+        for thread in self.threads.values():
+            remaining_ms = max(0, int((deadline - time.monotonic()) * 1000))
+            if not thread.wait(remaining_ms):
+                stuck += 1
+        if stuck:
+            self.log.emit(f"WARNING: {stuck} job(s) did not stop within {timeout_ms / 1000:.0f}s. They will resume on the next start.")
+        return stuck
+
+    # --- 영속화 ---
+
+    def persist(self):
+        """대기 중/실행 중인 작업만 jobs.json에 기록합니다. (완료된 작업은 저장하지 않음)"""
+        pending = [
+            {k: job[k] for k in ("id", "url", "output_path", "options")}
+            for job in self.jobs if job["status"] in RESUMABLE_STATUSES
+        ]
+        try:
+            write_json_atomic(JOBS_FILE, pending)
+        except OSError:
+            pass
+
+    def restore(self):
+        """이전 실행에서 끝나지 않은 작업을 다시 대기열에 넣습니다. 복원된 작업 수를 반환합니다."""
+        if not os.path.exists(JOBS_FILE):
+            return 0
+        try:
+            with open(JOBS_FILE, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError):
+            return 0
+
+        for job in saved:
+            self.enqueue(job["url"], job["output_path"], job["options"], job_id=job.get("id"))
+        return len(saved)
@@ -0,0 +1,79 @@
+import os
+import logging
+from logging.handlers import RotatingFileHandler
+from PySide6.QtWidgets import QPlainTextEdit
+from PySide6.QtCore import QTimer, Slot
+from sleekes.core.config import SETTINGS_DIR
+
+# =============================================================================
+# [Sleekes Log View]
+#
+# 장시간 채널 아카이빙에서도 느려지지 않는 로그 위젯입니다.
+# 1. 고정 용량 링 버퍼: 최대 줄 수를 넘으면 오래된 줄부터 자동 삭제 (setMaximumBlockCount)
+# 2. 일괄 추가: 메시지를 모아 두었다가 타이머 주기마다 한 번에 화면에 반영
+# 3. 디스크 보존: 전체 로그를 회전(rotating) 파일에 기록하여 화면에서 밀려난 줄도 보존
+# =============================================================================
+
+LOG_DIR = os.path.join(SETTINGS_DIR, "logs")
+LOG_FILE = os.path.join(LOG_DIR, "sleekes.log")
+
+class LogViewWidget(QPlainTextEdit):
+    def __init__(self, capacity=5000, flush_interval_ms=100, spill_to_file=True):
+        """
+        Args:
+            capacity (int): 화면에 유지할 최대 줄 수
+            flush_interval_ms (int): 대기 중인 메시지를 화면에 반영하는 주기
+            spill_to_file (bool): 전체 로그를 회전 파일(settings/logs/sleekes.log)에 기록할지 여부
+        """
+        super().__init__()
+        self.setObjectName("LogArea")
+        self.setReadOnly(True)
+        self.setMaximumBlockCount(capacity)
+
+        self._pending = []
+        self._timer = QTimer(self)
+        self._timer.setInterval(flush_interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+        self._file_logger = self._create_file_logger() if spill_to_file else None
+
+    def _create_file_logger(self):
+        try:
+            os.makedirs(LOG_DIR, exist_ok=True)
+            logger = logging.getLogger("sleekes.gui")
+            logger.propagate = False
+            if not logger.handlers:
+                # 5MB x 5개 파일로 회전
+                handler = RotatingFileHandler(LOG_FILE, maxBytes=5 * 1024 * 1024, backupCount=5, encoding="utf-8")
+                handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+                logger.addHandler(handler)
+                logger.setLevel(logging.INFO)
+            return logger
+        except OSError:
+            # 로그 폴더를 만들 수 없으면 화면 표시만 수행합니다
+            return None
+
+    @Slot(str)
+    def append_message(self, message):
+        """메시지를 대기열에 넣습니다. 실제 화면 반영은 타이머가 일괄 처리합니다."""
+        self._pending.append(message)
+        if self._file_logger:
+            self._file_logger.info(message)
+        if not self._timer.isActive():
+            self._timer.start()
+
+    @Slot()
+    def flush(self):
+        """대기 중인 메시지를 한 번에 추가하고, 사용자가 맨 아래를 보고 있을 때만 자동 스크롤합니다."""
+        self._timer.stop()
+        if not self._pending:
+            return
+
+        bar = self.verticalScrollBar()
+        at_bottom = bar.value() >= bar.maximum() - 4
+
+        self.appendPlainText("\n".join(self._pending))
+        self._pending.clear()
+
+        if at_bottom:
+            bar.setValue(bar.maximum())
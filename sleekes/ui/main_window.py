@@ -1,39 +1,23 @@
 from PySide6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QLineEdit, QPushButton, QLabel, QCheckBox, 
-                             QTextEdit, QProgressBar, QFileDialog, QGroupBox, QTabWidget, QMessageBox, QComboBox)
-from PySide6.QtCore import Qt, QThread, Signal, Slot, QSize
+                             QFileDialog, QGroupBox, QTabWidget, QMessageBox, QComboBox)
+from PySide6.QtCore import Qt, Signal, Slot, QSize
 from PySide6.QtGui import QIcon, QFont, QAction
-from sleekes.core.downloader import SleekesDownloader
-from sleekes.core.config import load_settings, save_settings
+from sleekes.core.config import load_settings, save_settings, flush_settings, set_settings_log_callback
 from sleekes.ui import styles, icons, i18n
 from sleekes.ui.guide_view import GuideViewWidget
+from sleekes.ui.log_view import LogViewWidget
+from sleekes.ui.job_queue import JobQueueWidget, DownloadThread
+from sleekes.ui.archive_view import ArchiveBrowserWidget
+from sleekes.core.subtitles import DEFAULT_SUB_LANGS
+from sleekes.core.storage import available_codecs
 import os
 
-# =============================================================================
-# [Sleekes Download Management]
-# =============================================================================
-
-class DownloadThread(QThread):
-    progress = Signal(dict)
-    log = Signal(str)
-    finished_signal = Signal(bool)
-
-    def __init__(self, url, output_path, options):
-        super().__init__()
-        self.url = url
-        self.output_path = output_path
-        self.options = options
-
-    def run(self):
-        downloader = SleekesDownloader(
-            progress_callback=self.progress.emit,
-            log_callback=self.log.emit
-        )
-        success = downloader.download(self.url, self.output_path, self.options)
-        self.finished_signal.emit(success)
-
 class SleekesMainWindow(QMainWindow):
     """Sleekes 메인 윈도우 - 다국어(KO/EN) 및 무채색 디자인 지원"""
+    # 설정 저장 타이머 스레드의 메시지를 UI 스레드의 로그로 넘깁니다
+    settings_log = Signal(str)
+
     def __init__(self):
         super().__init__()
         self.settings = load_settings()
@@ -44,6 +28,13 @@ class SleekesMainWindow(QMainWindow):
         
         self.init_ui()
         self.load_settings_to_ui()
+        self.settings_log.connect(self.add_log)
+        # 창을 닫을 때 제한 시간 안에 끝나지 않은 작업 수 (main.py가 종료 방식을 정하는 데 사용)
+        self.stuck_jobs = 0
+        set_settings_log_callback(self.settings_log.emit)
+
+        # 두 테마의 아이콘을 미리 렌더링하여 테마 전환을 캐시 조회로 만듭니다
+        icons.prerender([icons.ICON_DOWNLOAD_CENTER, icons.ICON_METADATA_VIEWER, icons.ICON_GUIDE, icons.ICON_RECOMMENDED])
         
         # 디자인 및 언어 초기화
         initial_theme = self.settings.get("theme", "Dark")
@@ -53,6 +44,11 @@ class SleekesMainWindow(QMainWindow):
         self.apply_theme(initial_theme)
         self.apply_language(self.current_lang)
 
+        # 이전 실행에서 끝나지 않은 작업 복원
+        restored = self.jobs.restore()
+        if restored:
+            self.add_log(i18n.TRANSLATIONS[self.current_lang]["log_jobs_restored"].format(count=restored))
+
     def init_ui(self):
         central_widget = QWidget()
         central_widget.setObjectName("MainFrame")
@@ -111,10 +107,13 @@ class SleekesMainWindow(QMainWindow):
         # --- [Tab System] ---
         self.tabs = QTabWidget()
         self.tab_downloader = self.create_downloader_tab()
+        self.tab_metadata = ArchiveBrowserWidget()
         self.tab_guide = GuideViewWidget()
         
         self.tabs.addTab(self.tab_downloader, "Downloader")
+        self.tabs.addTab(self.tab_metadata, "Archive")
         self.tabs.addTab(self.tab_guide, "Reference")
+        self.tabs.currentChanged.connect(self.on_tab_changed)
         
         main_layout.addWidget(self.tabs)
 
@@ -141,7 +140,8 @@ class SleekesMainWindow(QMainWindow):
         
         # Nav & Header
         self.tabs.setTabText(0, t["nav_downloader"])
-        self.tabs.setTabText(1, t["nav_guide"])
+        self.tabs.setTabText(1, t["nav_archive"])
+        self.tabs.setTabText(2, t["nav_guide"])
         self.mode_label.setText(t["design_mode"])
         self.lang_label.setText(t["lang_mode"])
         self.guide_nav_btn.setText(t["btn_guide"])
@@ -155,6 +155,7 @@ class SleekesMainWindow(QMainWindow):
         self.audio_mode_cb.setText(t["opt_audio_only"])
         self.skip_download_cb.setText(t["opt_metadata_only"])
         self.stealth_mode_cb.setText(t["opt_stealth"])
+        self.native_cb.setText(t["opt_native"])
         self.rec_btn.setText(t["btn_rec"])
         
         self.desc_cb.setText(t["detail_desc"])
@@ -162,6 +163,9 @@ class SleekesMainWindow(QMainWindow):
         self.subs_cb.setText(t["detail_subs"])
         self.thumb_cb.setText(t["detail_thumb"])
         self.comments_cb.setText(t["detail_comments"])
+        self.sub_langs_label.setText(t["sub_langs"])
+        self.sub_langs_input.setPlaceholderText(t["sub_langs_placeholder"])
+        self.compress_label.setText(t["compress"])
         
         self.min_sleep_label.setText(t["min_sleep"])
         self.max_sleep_label.setText(t["max_sleep"])
@@ -169,7 +173,11 @@ class SleekesMainWindow(QMainWindow):
         self.flat_output_cb.setText(t["opt_flat"])
         self.default_path_cb.setText(t["opt_default_path"])
         self.run_btn.setText(t["btn_execute"])
+        self.jobs.update_language(lang_code)
         
+        # Archive Tab
+        self.tab_metadata.update_language(lang_code)
+
         # Reference Tab (Guide)
         if hasattr(self, "tab_guide"):
             self.tab_guide.update_language(lang_code)
@@ -180,7 +188,8 @@ class SleekesMainWindow(QMainWindow):
 
     def update_icons(self, color):
         self.tabs.setTabIcon(0, icons.svg_to_icon(icons.ICON_DOWNLOAD_CENTER, color))
-        self.tabs.setTabIcon(1, icons.svg_to_icon(icons.ICON_GUIDE, color))
+        self.tabs.setTabIcon(1, icons.svg_to_icon(icons.ICON_METADATA_VIEWER, color))
+        self.tabs.setTabIcon(2, icons.svg_to_icon(icons.ICON_GUIDE, color))
         self.tabs.setIconSize(QSize(22, 22))
         self.rec_btn.setIcon(icons.svg_to_icon(icons.ICON_RECOMMENDED, color))
         self.guide_nav_btn.setIcon(icons.svg_to_icon(icons.ICON_GUIDE, color))
@@ -217,6 +226,7 @@ class SleekesMainWindow(QMainWindow):
         self.audio_mode_cb = QCheckBox()
         self.skip_download_cb = QCheckBox()
         self.stealth_mode_cb = QCheckBox()
+        self.native_cb = QCheckBox()
         
         self.rec_btn = QPushButton()
         self.rec_btn.setObjectName("SecondaryButton")
@@ -226,6 +236,7 @@ class SleekesMainWindow(QMainWindow):
         top_opts.addWidget(self.audio_mode_cb)
         top_opts.addWidget(self.skip_download_cb)
         top_opts.addWidget(self.stealth_mode_cb)
+        top_opts.addWidget(self.native_cb)
         top_opts.addStretch()
         top_opts.addWidget(self.rec_btn)
         opt_layout.addLayout(top_opts)
@@ -239,6 +250,17 @@ class SleekesMainWindow(QMainWindow):
         for cb in [self.desc_cb, self.json_cb, self.subs_cb, self.thumb_cb, self.comments_cb]:
             detail_opts.addWidget(cb)
             cb.setEnabled(False)
+        detail_opts.addStretch()
+        self.sub_langs_label = QLabel()
+        detail_opts.addWidget(self.sub_langs_label)
+        self.sub_langs_input = QLineEdit()
+        self.sub_langs_input.setMaximumWidth(160)
+        detail_opts.addWidget(self.sub_langs_input)
+        self.compress_label = QLabel()
+        detail_opts.addWidget(self.compress_label)
+        self.compress_combo = QComboBox()
+        self.compress_combo.addItems(["None"] + available_codecs())
+        detail_opts.addWidget(self.compress_combo)
         self.archive_mode_cb.toggled.connect(self.toggle_archive_options)
         opt_layout.addLayout(detail_opts)
         
@@ -276,14 +298,13 @@ class SleekesMainWindow(QMainWindow):
         self.run_btn.clicked.connect(self.start_download)
         layout.addWidget(self.run_btn)
 
-        self.pbar = QProgressBar()
-        self.pbar.setValue(0)
-        self.pbar.setTextVisible(False)
-        layout.addWidget(self.pbar)
+        # 작업 대기열: 여러 URL을 병렬로 실행하며 작업별 진행률을 표시합니다
+        self.jobs = JobQueueWidget(max_workers=self.settings.get("job_workers", 2))
+        self.jobs.log.connect(self.add_log)
+        self.jobs.job_finished.connect(self.on_finished)
+        layout.addWidget(self.jobs)
 
-        self.log_widget = QTextEdit()
-        self.log_widget.setObjectName("LogArea")
-        self.log_widget.setReadOnly(True)
+        self.log_widget = LogViewWidget()
         layout.addWidget(self.log_widget)
 
         return tab
@@ -326,11 +347,15 @@ class SleekesMainWindow(QMainWindow):
         self.audio_mode_cb.setChecked(s.get("only_audio", False))
         self.skip_download_cb.setChecked(s.get("skip_download", False))
         self.stealth_mode_cb.setChecked(s.get("stealth_mode", True))
+        self.native_cb.setChecked(s.get("native_container", False))
         self.sleep_input.setText(str(s.get("sleep_interval_min", "1.0")))
         self.max_sleep_input.setText(str(s.get("max_sleep_interval_min", "30.0")))
         idx = self.cookie_browser.findText(s.get("cookie_browser", "None"))
         if idx >= 0: self.cookie_browser.setCurrentIndex(idx)
         self.flat_output_cb.setChecked(s.get("flat_output", False))
+        self.sub_langs_input.setText(s.get("sub_langs", DEFAULT_SUB_LANGS))
+        idx = self.compress_combo.findText(s.get("compress_metadata") or "None")
+        if idx >= 0: self.compress_combo.setCurrentIndex(idx)
         
         default_archive = os.path.join("Archives")
         if not os.path.exists(default_archive):
@@ -352,13 +377,17 @@ class SleekesMainWindow(QMainWindow):
             "only_audio": self.audio_mode_cb.isChecked(),
             "skip_download": self.skip_download_cb.isChecked(),
             "stealth_mode": self.stealth_mode_cb.isChecked(),
+            "native_container": self.native_cb.isChecked(),
             "sleep_interval_min": sleep_min,
             "max_sleep_interval_min": max_sleep,
             "cookie_browser": self.cookie_browser.currentText(),
             "flat_output": self.flat_output_cb.isChecked(),
+            "sub_langs": self.sub_langs_input.text().strip() or DEFAULT_SUB_LANGS,
+            "compress_metadata": None if self.compress_combo.currentText() == "None" else self.compress_combo.currentText(),
             "last_path": self.path_input.text(),
             "use_default_path": self.default_path_cb.isChecked(),
-            "language": self.current_lang
+            "language": self.current_lang,
+            "job_workers": self.jobs.workers_spin.value()
         })
         save_settings(self.settings)
 
@@ -385,48 +414,49 @@ class SleekesMainWindow(QMainWindow):
             'get_comments': self.comments_cb.isChecked() or self.archive_mode_cb.isChecked(),
             'only_audio': self.audio_mode_cb.isChecked(),
             'skip_download': self.skip_download_cb.isChecked(),
+            'native_container': self.native_cb.isChecked(),
             'sleep_interval': sleep_sec,
             'max_sleep_interval': max_sleep_sec if self.stealth_mode_cb.isChecked() else sleep_sec * 2,
             'sleep_requests': min(sleep_sec / 2.0, 300.0) if self.stealth_mode_cb.isChecked() else 0,
             'stealth_mode': self.stealth_mode_cb.isChecked(),
             'cookies_from_browser': None if self.cookie_browser.currentText() == "None" else self.cookie_browser.currentText(),
             'flat_output': self.flat_output_cb.isChecked(),
+            'sub_langs': self.sub_langs_input.text().strip() or DEFAULT_SUB_LANGS,
+            'compress_metadata': None if self.compress_combo.currentText() == "None" else self.compress_combo.currentText(),
             'ignore_errors': True
         }
 
-        self.run_btn.setEnabled(False)
-        self.pbar.setValue(0)
         self.add_log(i18n.TRANSLATIONS[self.current_lang]["engine_start"].format(url=url))
 
-        self.thread = DownloadThread(url, self.path_input.text(), options)
-        self.thread.progress.connect(self.update_progress)
-        self.thread.log.connect(self.add_log)
-        self.thread.finished_signal.connect(self.on_finished)
-        self.thread.start()
-
-    @Slot(dict)
-    def update_progress(self, d):
-        if d['status'] == 'downloading':
-            try:
-                p = float(d.get('_percent_str', '0%').replace('%', ''))
-                self.pbar.setValue(int(p))
-            except: pass
+        # 실행 버튼을 잠그지 않고 대기열에 추가하므로 여러 URL을 연속으로 넣을 수 있습니다
+        self.jobs.enqueue(url, self.path_input.text(), options)
+        self.url_input.clear()
 
     @Slot(str)
     def add_log(self, message):
-        self.log_widget.append(message)
-        self.log_widget.verticalScrollBar().setValue(self.log_widget.verticalScrollBar().maximum())
+        self.log_widget.append_message(message)
 
     @Slot(bool)
     def on_finished(self, success):
-        self.run_btn.setEnabled(True)
         t = i18n.TRANSLATIONS[self.current_lang]
         if success:
-            self.pbar.setValue(100)
             self.add_log(t["success"])
         else:
             self.add_log(t["fail"])
+        # download()가 카탈로그를 갱신했으므로 열려 있는 아카이브 목록도 다시 불러옵니다
+        self.tab_metadata.reload()
+
+    @Slot(int)
+    def on_tab_changed(self, index):
+        if self.tabs.widget(index) is self.tab_metadata:
+            self.tab_metadata.set_root(self.path_input.text())
+            self.tab_metadata.activate()
 
     def closeEvent(self, event):
+        # 작업 종료를 기다리기 전에 설정과 대기열을 먼저 디스크에 기록합니다
         self.save_current_settings()
+        flush_settings()
+        set_settings_log_callback(None)
+        self.stuck_jobs = self.jobs.shutdown()
+        self.tab_metadata.shutdown()
         event.accept()
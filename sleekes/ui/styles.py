@@ -93,7 +93,7 @@ QTabBar::tab:selected {
     font-weight: bold;
 }
 
-QTextEdit#LogArea, QTextBrowser#GuideArea {
+QPlainTextEdit#LogArea, QTextBrowser#GuideArea {
     background-color: #050505;
     border: 1px solid #222222;
     border-radius: 8px;
@@ -101,6 +101,30 @@ QTextEdit#LogArea, QTextBrowser#GuideArea {
     color: #cccccc;
 }
 
+QTableWidget#JobTable, QTableView#ArchiveTable {
+    background-color: #050505;
+    border: 1px solid #222222;
+    border-radius: 8px;
+    gridline-color: #222222;
+    color: #cccccc;
+}
+
+QHeaderView::section {
+    background-color: #222222;
+    color: #888888;
+    border: none;
+    padding: 5px;
+    font-weight: bold;
+}
+
+QSpinBox {
+    background-color: #222222;
+    border: 1px solid #444444;
+    border-radius: 6px;
+    padding: 5px;
+    color: #ffffff;
+}
+
 QCheckBox {
     spacing: 10px;
 }
@@ -212,7 +236,7 @@ QTabBar::tab:selected {
     font-weight: bold;
 }
 
-QTextEdit#LogArea, QTextBrowser#GuideArea {
+QPlainTextEdit#LogArea, QTextBrowser#GuideArea {
     background-color: #ffffff;
     border: 1px solid #dddddd;
     border-radius: 8px;
@@ -220,6 +244,30 @@ QTextEdit#LogArea, QTextBrowser#GuideArea {
     color: #333333;
 }
 
+QTableWidget#JobTable, QTableView#ArchiveTable {
+    background-color: #ffffff;
+    border: 1px solid #dddddd;
+    border-radius: 8px;
+    gridline-color: #eeeeee;
+    color: #333333;
+}
+
+QHeaderView::section {
+    background-color: #eeeeee;
+    color: #999999;
+    border: none;
+    padding: 5px;
+    font-weight: bold;
+}
+
+QSpinBox {
+    background-color: #ffffff;
+    border: 1px solid #cccccc;
+    border-radius: 6px;
+    padding: 5px;
+    color: #000000;
+}
+
 QCheckBox {
     spacing: 10px;
 }
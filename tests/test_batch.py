@@ -0,0 +1,71 @@
+import threading
+import time
+
+import pytest
+
+from sleekes.core import batch
+from sleekes.core.batch import BatchRunner, host_key, iter_batch_urls
+
+def test_iter_batch_urls_skips_blanks_and_comments():
+    lines = ["https://a.com/1\n", "\n", "  # note\n", "  https://b.com/2  \n"]
+    assert list(iter_batch_urls(lines)) == ["https://a.com/1", "https://b.com/2"]
+
+def test_host_key():
+    assert host_key("https://www.youtube.com/watch?v=x") == "youtube.com"
+    assert host_key("https://m.youtube.com/watch?v=x") == "youtube.com"
+    assert host_key("not a url") == "unknown"
+
+class FakeDownloader:
+    """호스트별/전체 동시 실행 수를 기록하는 엔진 대역"""
+    lock = threading.Lock()
+    running = {}
+    peak = {}
+    order = []
+
+    def __init__(self, progress_callback=None, log_callback=None):
+        self.progress_callback = progress_callback
+        self.skipped = False
+
+    def download(self, url, output_path, options):
+        key = host_key(url)
+        with self.lock:
+            self.running[key] = self.running.get(key, 0) + 1
+            self.running["*"] = self.running.get("*", 0) + 1
+            for k in (key, "*"):
+                self.peak[k] = max(self.peak.get(k, 0), self.running[k])
+            self.order.append(url)
+        try:
+            time.sleep(0.05)
+            if "fail" in url:
+                raise RuntimeError("boom")
+            self.skipped = "archived" in url
+            self.progress_callback({"status": "finished", "total": 100, "downloaded": 100})
+            return True
+        finally:
+            with self.lock:
+                self.running[key] -= 1
+                self.running["*"] -= 1
+
+@pytest.fixture
+def fake(monkeypatch):
+    FakeDownloader.running, FakeDownloader.peak, FakeDownloader.order = {}, {}, []
+    monkeypatch.setattr(batch, "SleekesDownloader", FakeDownloader)
+    return FakeDownloader
+
+def test_per_host_limit_does_not_block_other_hosts(fake):
+    slow = [f"https://slow.com/{i}" for i in range(6)]
+    other = [f"https://other{i}.com/v" for i in range(6)]
+    stats = BatchRunner(workers=4, per_host=1).run(iter(slow + other), "/tmp", {})
+
+    assert stats["succeeded"] == 12
+    assert fake.peak["slow.com"] == 1
+    assert fake.peak["*"] <= 4
+    # 같은 호스트 URL이 앞에 몰려 있어도 다른 호스트의 작업이 그 사이에 실행됩니다
+    assert fake.order.index(other[-1]) < fake.order.index(slow[-1])
+
+def test_counts_failures_skips_and_duplicates(fake):
+    urls = ["https://a.com/ok", "https://a.com/ok", "https://b.com/fail", "https://c.com/archived"]
+    stats = BatchRunner(workers=2, per_host=1).run(iter(urls), "/tmp", {})
+
+    assert (stats["succeeded"], stats["failed"], stats["skipped"]) == (1, 1, 2)
+    assert stats["bytes"] == 200
@@ -0,0 +1,78 @@
+import json
+import os
+import shutil
+
+import pytest
+
+from sleekes.core import storage
+from sleekes.core.catalog import ArchiveCatalog
+
+def _write_info(folder, name, **info):
+    os.makedirs(folder, exist_ok=True)
+    with open(os.path.join(folder, name + ".info.json"), "w", encoding="utf-8") as f:
+        json.dump(info, f)
+
+@pytest.fixture
+def catalog(tmp_path):
+    catalog = ArchiveCatalog(str(tmp_path / "catalog.db"))
+    yield catalog
+    catalog.close()
+
+@pytest.fixture
+def root(tmp_path):
+    root = tmp_path / "Archives"
+    _write_info(root / "ch1", "First", id="a", title="Hello world", channel="Chan", upload_date="20240101")
+    _write_info(root / "ch1", "Second", id="b", title="Other video", channel="Chan", upload_date="20240301",
+                description="hello again")
+    _write_info(root / "pl2", "Third", id="c", title="Music", channel="Band", upload_date="20230505")
+    _write_info(root / "pl2", "List", id="pl", _type="playlist", title="Hello playlist")
+    return str(root)
+
+def test_scan_and_search(catalog, root):
+    assert catalog.scan(root) == {"folders": 2, "parsed": 2, "removed": 0}
+    assert catalog.count() == 3
+    assert [r["video_id"] for r in catalog.search()] == ["b", "a", "c"]
+    assert {r["video_id"] for r in catalog.search("hel")} == {"a", "b"}
+    assert [r["video_id"] for r in catalog.search(channel="band")] == ["c"]
+    assert [r["video_id"] for r in catalog.search(date_from="2024-01-01", date_to="20240201")] == ["a"]
+    # FTS 문법 문자가 들어가도 오류 없이 검색됩니다
+    assert catalog.count('"hello" OR (') == 0
+
+def test_scan_is_incremental(catalog, root):
+    catalog.scan(root)
+    assert catalog.scan(root)["parsed"] == 0
+
+    # 영상 파일만 추가되면 폴더 mtime은 바뀌지만 info.json은 다시 읽지 않습니다
+    open(os.path.join(root, "ch1", "First.mp4"), "wb").close()
+    assert catalog.scan(root)["parsed"] == 0
+
+    _write_info(os.path.join(root, "ch1"), "New", id="d", title="Brand new")
+    assert catalog.scan(root)["parsed"] == 1
+    assert catalog.count() == 4
+
+def test_scan_reads_compressed_info(catalog, root):
+    storage.compress_file(os.path.join(root, "pl2", "Third.info.json"), "gzip", compact_json=True)
+    catalog.scan(root)
+    assert [r["video_id"] for r in catalog.search("music")] == ["c"]
+
+def test_scan_removes_deleted_folders(catalog, root):
+    catalog.scan(root)
+    shutil.rmtree(os.path.join(root, "pl2"))
+    assert catalog.scan(root)["removed"] == 1
+    assert catalog.count() == 2
+
+def test_scan_missing_root_keeps_records(catalog, root, tmp_path):
+    catalog.scan(root)
+    os.rename(root, str(tmp_path / "unplugged"))
+    assert catalog.scan(root)["removed"] == 0
+    assert catalog.count() == 3
+
+def test_paths_are_normalized(catalog, root, monkeypatch):
+    monkeypatch.chdir(os.path.dirname(root))
+    catalog.scan("Archives")
+    assert catalog.scan(os.path.abspath("Archives"))["parsed"] == 0
+    assert catalog.count("hello") == 2
+    assert catalog.has_root("./Archives")
+
+    shutil.rmtree(os.path.join(root, "pl2"))
+    assert catalog.scan(root)["removed"] == 1
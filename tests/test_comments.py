@@ -0,0 +1,103 @@
+import json
+
+import pytest
+
+from sleekes.core import comments
+from sleekes.core.comments import CommentSidecar, iter_sidecar
+
+def _comments(ids):
+    return [{"id": cid, "text": cid, "parent": "root"} for cid in ids]
+
+def _crashing(items, after):
+    for i, comment in enumerate(items):
+        if i == after:
+            raise RuntimeError("connection reset")
+        yield comment
+
+def _ids(sidecar):
+    return [c["id"] for c in iter_sidecar(sidecar.path)]
+
+@pytest.fixture
+def interrupted(tmp_path, monkeypatch):
+    """c0..c49 수집이 12개째에서 끊긴 사이드카 (체크포인트는 c9까지 확정)"""
+    monkeypatch.setattr(comments, "CHECKPOINT_EVERY", 5)
+    sidecar = CommentSidecar(str(tmp_path / "Title"))
+    with pytest.raises(RuntimeError):
+        sidecar.capture(_crashing(_comments(f"c{i}" for i in range(50)), 12))
+    assert not sidecar.is_complete()
+    return sidecar
+
+def test_capture_resumes_after_last_recorded(interrupted):
+    assert interrupted.capture(iter(_comments(f"c{i}" for i in range(50)))) == 50
+    assert _ids(interrupted) == [f"c{i}" for i in range(50)]
+    assert interrupted.is_complete()
+
+def test_capture_resumes_when_anchor_was_deleted(interrupted):
+    # 마지막으로 기록한 c9가 삭제됨: 그 앞의 c8을 기준으로 이어받아 c10부터 빠짐없이 기록합니다
+    stream = _comments(f"c{i}" for i in range(50) if i != 9)
+    interrupted.capture(iter(stream))
+    assert _ids(interrupted) == [f"c{i}" for i in range(50)]
+
+def test_capture_resumes_when_anchor_moved(interrupted):
+    # 새 댓글이 맨 앞에 끼어들어 c9가 뒤로 밀린 경우 (새 댓글은 이후 refresh가 가져옵니다)
+    later = _comments([f"n{i}" for i in range(5)] + [f"c{i}" for i in range(50)])
+    interrupted.capture(iter(later))
+    assert _ids(interrupted) == [f"c{i}" for i in range(50)]
+
+def test_capture_resumes_when_anchor_moved_earlier(interrupted):
+    earlier = _comments(f"c{i}" for i in range(50) if i not in (0, 1, 2))
+    interrupted.capture(iter(earlier))
+    assert _ids(interrupted) == [f"c{i}" for i in range(50)]
+
+def test_capture_falls_back_to_position_without_anchor(interrupted):
+    # 기록한 댓글을 하나도 찾지 못하면 예상 위치(count)부터 기록하고, 그 뒤를 버리지 않습니다
+    stream = _comments(f"x{i}" for i in range(30))
+    interrupted.capture(iter(stream))
+    assert _ids(interrupted) == [f"c{i}" for i in range(10)] + [f"x{i}" for i in range(10, 30)]
+    assert interrupted.is_complete()
+
+def test_capture_resumes_old_checkpoint_by_position(interrupted):
+    # last_id/recent_ids가 없는 이전 형식의 체크포인트
+    with open(interrupted.checkpoint_path, "r", encoding="utf-8") as f:
+        state = json.load(f)
+    state.pop("recent_ids")
+    with open(interrupted.checkpoint_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    interrupted.capture(iter(_comments(f"c{i}" for i in range(50))))
+    assert _ids(interrupted) == [f"c{i}" for i in range(50)]
+
+def _dated(cid, timestamp, **extra):
+    return dict({"id": cid, "text": cid, "parent": "root", "timestamp": timestamp}, **extra)
+
+@pytest.fixture
+def archived(tmp_path):
+    """최신순으로 수집이 끝난 사이드카 (o2가 가장 최근)"""
+    sidecar = CommentSidecar(str(tmp_path / "Title"))
+    sidecar.capture(iter([_dated("o2", 3000), _dated("o1", 2000), _dated("o0", 1000)]))
+    return sidecar
+
+def test_refresh_adds_only_new_comments(archived):
+    newest_first = [_dated("pin", 10, is_pinned=True), _dated("n1", 5000), _dated("n0", 4000),
+                    _dated("o2", 3000), _dated("o1", 2000)]
+    assert archived.refresh(iter(newest_first)) == 3
+    assert _ids(archived) == ["o2", "o1", "o0", "pin", "n1", "n0"]
+    assert archived.is_complete()
+
+    # 고정 댓글은 이미 저장되어 있어도 중단 기준이 아닙니다
+    assert archived.refresh(iter([_dated("pin", 10, is_pinned=True), _dated("n2", 6000), _dated("n1", 5000)])) == 1
+    assert _ids(archived)[-1] == "n2"
+
+def test_interrupted_refresh_is_rolled_back_and_retried(archived, monkeypatch):
+    monkeypatch.setattr(comments, "CHECKPOINT_EVERY", 1)
+    # n1까지 덧붙인 뒤 중단: 되돌리지 않으면 다음 갱신이 n1에서 멈춰 n0을 놓칩니다
+    newest_first = [_dated("n1", 5000), _dated("n0", 4000), _dated("o2", 3000)]
+    with pytest.raises(RuntimeError):
+        archived.refresh(_crashing(newest_first, 1))
+    assert not archived.is_complete()
+
+    assert archived.refresh(iter(newest_first)) == 2
+    assert _ids(archived) == ["o2", "o1", "o0", "n1", "n0"]
+
+def test_refresh_finishes_an_interrupted_capture(interrupted):
+    assert interrupted.refresh(iter(_comments(f"c{i}" for i in range(50)))) == 40
+    assert _ids(interrupted) == [f"c{i}" for i in range(50)]
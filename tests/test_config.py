@@ -0,0 +1,75 @@
+import json
+import time
+
+from sleekes.core import config
+from sleekes.core.config import SettingsStore
+
+def test_background_save_failure_is_reported(tmp_path):
+    blocker = tmp_path / "settings"
+    blocker.write_text("not a directory")
+    store = SettingsStore(path=str(blocker / "config.json"), delay=60)
+    messages = []
+    store.log_callback = messages.append
+
+    store.save({"theme": "Dark"})
+    store._flush_in_background()
+
+    assert len(messages) == 1
+    assert messages[0].startswith("WARNING: Could not save settings")
+    # 실패한 변경 사항은 다음 저장 때 다시 시도됩니다
+    assert store._dirty
+
+def test_background_save_failure_without_callback_prints(tmp_path, capsys):
+    blocker = tmp_path / "settings"
+    blocker.write_text("not a directory")
+    store = SettingsStore(path=str(blocker / "config.json"), delay=60)
+
+    store.save({"theme": "Dark"})
+    store._flush_in_background()
+
+    assert "WARNING: Could not save settings" in capsys.readouterr().err
+
+def test_load_reads_file_once(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps({"theme": "Light"}), encoding="utf-8")
+    store = SettingsStore(path=str(path))
+
+    assert store.load()["theme"] == "Light"
+    path.write_text(json.dumps({"theme": "Dark"}), encoding="utf-8")
+    assert store.load()["theme"] == "Light"
+    # 반환값은 사본이므로 호출자가 수정해도 저장소에 반영되지 않습니다
+    store.load()["theme"] = "Changed"
+    assert store.load()["theme"] == "Light"
+
+def test_saves_are_coalesced(tmp_path, monkeypatch):
+    path = tmp_path / "config.json"
+    path.write_text("{}", encoding="utf-8")
+    writes = []
+    real_write = config.write_json_atomic
+    monkeypatch.setattr(config, "write_json_atomic", lambda p, data: (writes.append(dict(data)), real_write(p, data)))
+    store = SettingsStore(path=str(path), delay=0.05)
+
+    for i in range(5):
+        store.save({"n": i})
+    store.save({"n": 4})
+    time.sleep(0.3)
+
+    assert writes == [{"n": 4}]
+    assert json.loads(path.read_text(encoding="utf-8")) == {"n": 4}
+
+def test_flush_writes_pending_changes_immediately(tmp_path):
+    path = tmp_path / "config.json"
+    path.write_text("{}", encoding="utf-8")
+    store = SettingsStore(path=str(path), delay=60)
+
+    store.save({"theme": "Dark"})
+    assert json.loads(path.read_text(encoding="utf-8")) == {}
+    store.flush()
+    assert json.loads(path.read_text(encoding="utf-8")) == {"theme": "Dark"}
+    assert store._timer is None and not store._dirty
+
+def test_missing_file_uses_defaults(tmp_path):
+    store = SettingsStore(path=str(tmp_path / "config.json"), delay=60)
+    assert store.load() == config.DEFAULT_SETTINGS
+    store.flush()
+    assert (tmp_path / "config.json").exists()
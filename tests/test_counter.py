@@ -0,0 +1,30 @@
+import multiprocessing
+import os
+
+def _allocate(workdir, allocations, start, results):
+    # config의 경로는 작업 폴더 기준이므로 호출 전에 작업 폴더를 옮깁니다
+    os.chdir(workdir)
+    from sleekes.core.config import get_next_counter
+
+    start.wait()
+    results.put([int(get_next_counter()) for _ in range(allocations)])
+
+def test_counter_is_unique_across_processes(tmp_path):
+    processes, allocations = 4, 10
+    ctx = multiprocessing.get_context("spawn")
+    start = ctx.Event()
+    results = ctx.Queue()
+    procs = [ctx.Process(target=_allocate, args=(str(tmp_path), allocations, start, results)) for _ in range(processes)]
+    for proc in procs:
+        proc.start()
+    # 모든 프로세스가 같은 순간에 출발하도록 해 경합을 최대로 만듭니다
+    start.set()
+    values = []
+    for _ in procs:
+        values.extend(results.get(timeout=60))
+    for proc in procs:
+        proc.join(timeout=60)
+        assert proc.exitcode == 0
+
+    # 검사 도중 자정이 지나면 카운터가 1로 돌아가 실패할 수 있습니다
+    assert sorted(values) == list(range(1, processes * allocations + 1))
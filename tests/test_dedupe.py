@@ -0,0 +1,76 @@
+import json
+import os
+
+import pytest
+
+from sleekes.core.dedupe import (MIN_DEDUPE_SIZE, ContentStore, dedupe_folder, dedupe_tree, materialize_video,
+                                 video_files)
+from sleekes.core.manifest import load_manifest, verify_folders, write_manifest
+
+BLOB = os.urandom(MIN_DEDUPE_SIZE + 1)
+
+def _archive(folder, video_id="abc", title="Video", media=BLOB):
+    os.makedirs(folder, exist_ok=True)
+    with open(os.path.join(folder, f"{title}.mp4"), "wb") as f:
+        f.write(media)
+    with open(os.path.join(folder, f"{title}.info.json"), "w", encoding="utf-8") as f:
+        json.dump({"id": video_id, "title": title}, f)
+    return str(folder)
+
+def _same_file(a, b):
+    return os.path.samefile(a, b)
+
+@pytest.fixture
+def store(tmp_path):
+    store = ContentStore(str(tmp_path / "content_store.db"))
+    yield store
+    store.close()
+
+def test_video_files_matches_by_id(tmp_path):
+    folder = _archive(tmp_path / "a")
+    _archive(folder, video_id="other", title="Video 2", media=b"x")
+    open(os.path.join(folder, "Video.en.srt"), "wb").close()
+    assert video_files(folder, "abc") == ["Video.en.srt", "Video.info.json", "Video.mp4"]
+    assert video_files(folder, "other") == ["Video 2.info.json", "Video 2.mp4"]
+    assert video_files(folder, "missing") == []
+
+def test_dedupe_folder_links_known_content(tmp_path, store):
+    first = _archive(tmp_path / "a")
+    second = _archive(tmp_path / "b")
+    assert dedupe_folder(first, write_manifest(first), store)["linked"] == 0
+
+    stats = dedupe_folder(second, write_manifest(second), store)
+    assert stats == {"linked": 1, "bytes": len(BLOB)}
+    assert _same_file(os.path.join(first, "Video.mp4"), os.path.join(second, "Video.mp4"))
+    # 메타데이터는 링크하지 않습니다
+    assert not _same_file(os.path.join(first, "Video.info.json"), os.path.join(second, "Video.info.json"))
+    # 링크 후에도 매니페스트가 맞으므로 다시 해시할 파일이 없습니다
+    assert verify_folders([second])[second] == {"checked": 0, "problems": [], "untracked": [],
+                                                "manifest": True, "built": False}
+
+def test_dedupe_tree(tmp_path, store):
+    folders = [_archive(tmp_path / name) for name in ("a", "b", "c")]
+    _archive(tmp_path / "c", title="Different", media=os.urandom(MIN_DEDUPE_SIZE))
+    write_manifest(folders[0])
+
+    assert dedupe_tree(folders, dry_run=True)["linked"] == 2
+    assert not _same_file(os.path.join(folders[0], "Video.mp4"), os.path.join(folders[1], "Video.mp4"))
+
+    stats = dedupe_tree(folders, store=store)
+    assert (stats["linked"], stats["bytes"], stats["failed"]) == (2, 2 * len(BLOB), 0)
+    assert os.stat(os.path.join(folders[0], "Video.mp4")).st_nlink == 3
+    assert verify_folders(folders[:1])[folders[0]]["checked"] == 0
+    # 이미 같은 파일인 것은 다시 해시하지도 링크하지도 않습니다
+    assert dedupe_tree(folders, store=store)["linked"] == 0
+
+def test_materialize_video(tmp_path):
+    src = _archive(tmp_path / "a")
+    write_manifest(src)
+    dst = str(tmp_path / "b")
+    os.makedirs(dst)
+
+    stats = materialize_video("abc", src, dst)
+    assert (stats["linked"], stats["copied"]) == (1, 1)
+    assert _same_file(os.path.join(src, "Video.mp4"), os.path.join(dst, "Video.mp4"))
+    assert set(load_manifest(dst)["files"]) == {"Video.info.json", "Video.mp4"}
+    assert materialize_video("abc", src, dst) == {"linked": 0, "copied": 0, "bytes": 0}
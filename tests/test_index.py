@@ -0,0 +1,63 @@
+import threading
+
+import pytest
+
+from sleekes.core.index import ArchiveIndex, STATUS_COMPLETE, STATUS_PENDING
+
+@pytest.fixture
+def index(tmp_path):
+    index = ArchiveIndex(str(tmp_path / "index.db"), folder=str(tmp_path / "A"))
+    yield index
+    index.close()
+
+def test_add_marks_complete_and_contains(index, tmp_path):
+    assert "youtube abc" not in index
+    index.add("youtube abc")
+    assert index.lookup("Youtube", "abc") == (str(tmp_path / "A"), STATUS_COMPLETE)
+    assert "youtube abc" in index
+    assert index.hits == {"youtube abc"}
+
+def test_pending_is_not_skipped_and_complete_is_not_downgraded(index):
+    index.mark("youtube", "abc", "/A")
+    assert "youtube abc" not in index
+    index.complete("youtube", "abc")
+    index.mark("youtube", "abc", "/B")
+    assert index.lookup("youtube", "abc")[1] == STATUS_COMPLETE
+
+def test_reopen_keeps_folder(index):
+    index.complete("youtube", "abc")
+    index.reopen("youtube", "abc")
+    assert index.lookup("youtube", "abc")[1] == STATUS_PENDING
+    assert "youtube abc" not in index
+
+def test_defer_complete_keeps_item_pending(index):
+    index.defer_complete = lambda extractor, video_id: video_id == "slow"
+    index.add("youtube slow")
+    index.add("youtube fast")
+    assert index.lookup("youtube", "slow")[1] == STATUS_PENDING
+    assert index.lookup("youtube", "fast")[1] == STATUS_COMPLETE
+
+def test_unfinished_overrides_complete(index):
+    index.complete("youtube", "abc")
+    index.unfinished = lambda video_id: video_id == "abc"
+    assert "youtube abc" not in index
+    assert not index.hits
+
+def test_on_duplicate_only_for_other_folders(index, tmp_path):
+    seen = []
+    index.on_duplicate = lambda video_id, folder: seen.append((video_id, folder))
+    index.complete("youtube", "here")
+    index.mark("youtube", "there", str(tmp_path / "B"), STATUS_COMPLETE)
+
+    assert "youtube here" in index
+    assert "youtube there" in index
+    assert seen == [("there", str(tmp_path / "B"))]
+
+def test_shared_across_threads(index):
+    # 변환 풀 스레드에서 complete()가 호출되어도 같은 연결을 쓸 수 있어야 합니다
+    threads = [threading.Thread(target=index.complete, args=("youtube", f"v{i}")) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(f"youtube v{i}" in index for i in range(8))
@@ -0,0 +1,53 @@
+import json
+
+from sleekes.core.journal import (JOURNAL_NAME, SessionJournal, session_interrupted,
+                                  STAGE_DOWNLOADED, STAGE_EXTRACTED, STAGE_FINISHED)
+
+def _lines(folder):
+    return (folder / JOURNAL_NAME).read_text(encoding="utf-8").splitlines()
+
+def test_records_survive_reload(tmp_path):
+    journal = SessionJournal(str(tmp_path))
+    journal.record(STAGE_EXTRACTED, "a")
+    journal.record(STAGE_FINISHED, "a")
+    journal.record(STAGE_DOWNLOADED, "b", format="251")
+    journal.record(STAGE_EXTRACTED, None)
+
+    reloaded = SessionJournal(str(tmp_path))
+    assert reloaded.stages == {"a": STAGE_FINISHED, "b": STAGE_DOWNLOADED}
+    assert reloaded.finished_ids() == {"a"}
+    assert reloaded.is_unfinished("b") and not reloaded.is_unfinished("a") and not reloaded.is_unfinished("c")
+
+def test_truncated_last_line_is_ignored_and_not_appended_to(tmp_path):
+    journal = SessionJournal(str(tmp_path))
+    journal.record(STAGE_FINISHED, "a")
+    with open(tmp_path / JOURNAL_NAME, "a", encoding="utf-8") as f:
+        f.write('{"ts": 1, "stage": "finished", "id": "b')
+
+    resumed = SessionJournal(str(tmp_path))
+    assert resumed.stages == {"a": STAGE_FINISHED}
+    resumed.record(STAGE_FINISHED, "c")
+
+    # 잘린 줄 뒤에 이어 쓰지 않고 새 줄에 기록합니다
+    assert json.loads(_lines(tmp_path)[-1])["id"] == "c"
+    assert SessionJournal(str(tmp_path)).finished_ids() == {"a", "c"}
+
+def test_session_interrupted(tmp_path):
+    assert not session_interrupted(str(tmp_path))
+
+    journal = SessionJournal(str(tmp_path))
+    journal.record(STAGE_FINISHED, "a")
+    # 시작한 항목이 모두 끝났으면 중단된 세션이 아닙니다
+    assert not session_interrupted(str(tmp_path))
+
+    journal.record(STAGE_DOWNLOADED, "b")
+    assert session_interrupted(str(tmp_path))
+
+    journal.end_session()
+    assert not session_interrupted(str(tmp_path))
+    assert SessionJournal(str(tmp_path)).ended
+
+    # 종료 기록 뒤에 새 세션이 시작되면 다시 끝나지 않은 것으로 봅니다
+    journal.record(STAGE_EXTRACTED, "c")
+    assert session_interrupted(str(tmp_path))
+    assert not SessionJournal(str(tmp_path)).ended
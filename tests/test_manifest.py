@@ -0,0 +1,76 @@
+import json
+import os
+
+from sleekes.core.manifest import (MANIFEST_NAME, PROBLEM_HASH, PROBLEM_MISSING, PROBLEM_SIZE, archive_folders,
+                                   hash_file, list_files, load_manifest, verify_folders, write_manifest)
+
+def _make_folder(path):
+    os.makedirs(path)
+    for name, data in (("v.mp4", b"video" * 1000), ("v.info.json", b"{}"), ("v.en.srt", b"1\n")):
+        with open(os.path.join(path, name), "wb") as f:
+            f.write(data)
+    # 작업 파일은 매니페스트에 들어가지 않습니다
+    for name in ("w.mp4.part", "w.f137.mp4.part-Frag3", ".sleekes_journal.jsonl", "x.comments.ckpt.json"):
+        open(os.path.join(path, name), "wb").close()
+    return str(path)
+
+def test_write_manifest(tmp_path):
+    folder = _make_folder(tmp_path / "a")
+    manifest = write_manifest(folder, workers=2)
+    assert list(manifest["files"]) == ["v.en.srt", "v.info.json", "v.mp4"]
+    assert manifest["files"]["v.mp4"]["hash"] == hash_file(os.path.join(folder, "v.mp4"))
+    assert load_manifest(folder) == manifest
+    assert set(list_files(folder)) == set(manifest["files"])
+
+def test_write_manifest_reuses_unchanged_hashes(tmp_path):
+    folder = _make_folder(tmp_path / "a")
+    write_manifest(folder)
+    # 크기/시각이 그대로면 기존 해시를 그대로 씁니다 (다시 읽지 않음)
+    path = os.path.join(folder, MANIFEST_NAME)
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    data["files"]["v.mp4"]["hash"] = "stale"
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    assert write_manifest(folder)["files"]["v.mp4"]["hash"] == "stale"
+
+def test_verify_detects_problems(tmp_path):
+    folder = _make_folder(tmp_path / "a")
+    write_manifest(folder)
+    assert verify_folders([folder])[folder]["problems"] == []
+
+    os.remove(os.path.join(folder, "v.en.srt"))
+    with open(os.path.join(folder, "v.info.json"), "ab") as f:
+        f.write(b" ")
+    mp4 = os.path.join(folder, "v.mp4")
+    st = os.stat(mp4)
+    with open(mp4, "r+b") as f:
+        f.write(b"X")
+    # 크기/시각이 그대로인 비트 손상은 전체 검사에서만 발견됩니다
+    os.utime(mp4, ns=(st.st_atime_ns, st.st_mtime_ns))
+    open(os.path.join(folder, "new.txt"), "wb").close()
+
+    result = verify_folders([folder])[folder]
+    assert result["problems"] == [("v.en.srt", PROBLEM_MISSING), ("v.info.json", PROBLEM_SIZE)]
+    assert result["untracked"] == ["new.txt"]
+    assert (("v.mp4", PROBLEM_HASH)) in verify_folders([folder], full=True)[folder]["problems"]
+
+def test_verify_refreshes_mtime_of_identical_files(tmp_path):
+    folder = _make_folder(tmp_path / "a")
+    write_manifest(folder)
+    os.utime(os.path.join(folder, "v.mp4"), ns=(0, 10 ** 9))
+    assert verify_folders([folder])[folder]["checked"] == 1
+    assert verify_folders([folder])[folder]["checked"] == 0
+
+def test_verify_without_manifest(tmp_path):
+    folder = _make_folder(tmp_path / "a")
+    assert verify_folders([folder])[folder]["manifest"] is False
+    assert verify_folders([folder], build_missing=True)[folder]["built"] is True
+    assert load_manifest(folder) is not None
+
+def test_archive_folders(tmp_path):
+    for name in ("b", "a", ".hidden"):
+        os.makedirs(tmp_path / name)
+    open(tmp_path / "file", "wb").close()
+    assert archive_folders(str(tmp_path)) == [str(tmp_path / "a"), str(tmp_path / "b")]
+    assert archive_folders(str(tmp_path / "missing")) == []
@@ -0,0 +1,93 @@
+import os
+import stat
+
+import pytest
+
+from sleekes.core.downloader import SleekesDownloader
+from sleekes.core.index import ArchiveIndex, STATUS_COMPLETE, STATUS_PENDING
+from sleekes.core.postproc import PostProcessPool
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path):
+    """받은 인자를 한 줄씩 기록하고 성공하는 ffmpeg 대역"""
+    argv = tmp_path / "argv.txt"
+    script = tmp_path / "ffmpeg"
+    script.write_text(f'#!/bin/sh\nprintf "%s\\n" "$@" > "{argv}"\n')
+    script.chmod(script.stat().st_mode | stat.S_IEXEC)
+    return str(script), argv
+
+@pytest.mark.skipif(os.name != "posix", reason="needs a POSIX shell")
+def test_threads_is_an_output_option(tmp_path, fake_ffmpeg):
+    script, argv = fake_ffmpeg
+    pool = PostProcessPool(workers=1, ffmpeg_threads=3)
+    pool.ffmpeg = script
+    src = tmp_path / "a.webm"
+    src.write_bytes(b"x")
+
+    assert pool.extract_audio(str(src), "mp3", "192")
+    args = argv.read_text().splitlines()
+    # -threads는 -i 뒤, 출력 경로 바로 앞에 있어야 인코더에 적용됩니다
+    assert args[-3:] == ["-threads", "3", str(tmp_path / "a.mp3")]
+    assert args.index("-i") < args.index("-threads")
+    pool.join()
+
+def test_submit_reports_group_result():
+    pool = PostProcessPool(workers=2)
+    results = []
+
+    def broken():
+        raise OSError("disk full")
+
+    pool.submit([lambda: True, lambda: True], on_done=results.append)
+    pool.submit([lambda: True, broken], on_done=results.append)
+    pool.submit([], on_done=results.append)
+    pool.join()
+
+    assert sorted(results) == [False, True, True]
+    assert pool.stats["tasks"] == 4 and pool.stats["failed"] == 1
+
+@pytest.fixture
+def engine(tmp_path):
+    """변환 풀과 아카이브 인덱스가 연결된 상태의 엔진 (download() 내부와 같은 연결)"""
+    engine = SleekesDownloader()
+    index = engine._index = ArchiveIndex(str(tmp_path / "index.db"), folder=str(tmp_path))
+    index.defer_complete = engine._defer_complete
+    yield engine, index
+    index.close()
+
+def _enqueue_started(engine, video_id):
+    engine._postprocessor_hook({"postprocessor": "SleekesEnqueue", "status": "started", "info_dict": {"id": video_id}})
+
+def test_complete_waits_for_conversions(engine):
+    engine, index = engine
+    _enqueue_started(engine, "v")
+    index.add("youtube v")
+    assert index.lookup("youtube", "v")[1] == STATUS_PENDING
+
+    engine._on_conversions_done("v", True)
+    assert index.lookup("youtube", "v")[1] == STATUS_COMPLETE
+
+def test_conversions_finishing_before_add(engine):
+    engine, index = engine
+    _enqueue_started(engine, "v")
+    engine._on_conversions_done("v", True)
+    index.add("youtube v")
+    assert index.lookup("youtube", "v")[1] == STATUS_COMPLETE
+
+def test_failed_conversion_stays_pending(engine):
+    engine, index = engine
+    _enqueue_started(engine, "v")
+    index.add("youtube v")
+    engine._on_conversions_done("v", False)
+    assert index.lookup("youtube", "v")[1] == STATUS_PENDING
+
+    # 변환이 먼저 실패한 뒤 기록 요청이 와도 완료로 기록하지 않습니다
+    _enqueue_started(engine, "w")
+    engine._on_conversions_done("w", False)
+    index.add("youtube w")
+    assert index.lookup("youtube", "w")[1] == STATUS_PENDING
+
+def test_items_without_conversions_complete_immediately(engine):
+    engine, index = engine
+    index.add("youtube plain")
+    assert index.lookup("youtube", "plain")[1] == STATUS_COMPLETE
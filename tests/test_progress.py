@@ -0,0 +1,28 @@
+from sleekes.core import progress
+from sleekes.core.progress import ProgressThrottle, format_bytes, make_record
+
+def _hook(status="downloading", downloaded=50, total=200):
+    return {"status": status, "downloaded_bytes": downloaded, "total_bytes": total, "speed": 10.0, "eta": 15,
+            "info_dict": {"playlist_index": 2, "n_entries": 9, "formats": [{}] * 100}}
+
+def test_make_record_is_small_and_numeric():
+    assert make_record(_hook()) == {"status": "downloading", "downloaded": 50, "total": 200, "percent": 25.0,
+                                    "speed": 10.0, "eta": 15, "index": 2, "count": 9}
+    assert make_record(_hook("finished", 10, None))["percent"] == 100.0
+
+def test_throttle_limits_downloading_events(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(progress.time, "monotonic", lambda: now[0])
+    throttle = ProgressThrottle(interval=0.25)
+
+    assert throttle.feed(_hook()) is not None
+    now[0] += 0.1
+    assert throttle.feed(_hook()) is None
+    # 상태 변화는 간격과 관계없이 바로 전달됩니다
+    assert throttle.feed(_hook("finished"))["status"] == "finished"
+    now[0] += 0.3
+    assert throttle.feed(_hook()) is not None
+
+def test_format_bytes():
+    assert format_bytes(None) == format_bytes(0)
+    assert format_bytes(1536).endswith("KB")
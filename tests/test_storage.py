@@ -0,0 +1,35 @@
+import json
+
+import pytest
+
+from sleekes.core import storage
+
+@pytest.mark.parametrize("codec", storage.available_codecs())
+def test_compress_round_trip(tmp_path, codec):
+    path = tmp_path / "v.info.json"
+    data = {"id": "abc", "title": "제목", "tags": ["a", "b"]}
+    path.write_text(json.dumps(data, indent=4, ensure_ascii=False), encoding="utf-8")
+
+    packed = storage.compress_file(str(path), codec, compact_json=True)
+    assert packed == str(path) + storage.CODECS[codec]
+    assert not path.exists()
+    assert storage.resolve(str(path)) == packed
+    assert storage.strip_codec(packed) == str(path)
+    assert storage.read_json(str(path)) == data
+    with storage.open_file(packed, "rt") as f:
+        assert f.read() == json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+    assert storage.decompress_file(packed) == str(path)
+    assert storage.resolve(str(path)) == str(path)
+    assert json.loads(path.read_text(encoding="utf-8")) == data
+
+def test_resolve_prefers_plain_file(tmp_path):
+    path = tmp_path / "c.comments.jsonl"
+    assert storage.resolve(str(path)) is None
+    (tmp_path / "c.comments.jsonl.gz").write_bytes(b"")
+    path.write_text("", encoding="utf-8")
+    assert storage.resolve(str(path)) == str(path)
+
+def test_read_json_missing(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        storage.read_json(str(tmp_path / "none.info.json"))
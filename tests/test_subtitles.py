@@ -0,0 +1,66 @@
+from sleekes.core.subtitles import (SUB_TIER_ALL, SUB_TIER_ORIGINALS, iter_vtt_cues, parse_sub_langs,
+                                    select_tracks, vtt_to_srt)
+
+VTT = """WEBVTT
+Kind: captions
+Language: en
+
+STYLE
+::cue { color: white }
+
+NOTE this block is dropped
+
+intro
+00:00:01.000 --> 00:00:02.500 align:start position:0%
+<c.colorE5E5E5>Hello</c> <b>world</b>
+
+01:02:03.4 --> 01:02:04.050
+Tom &amp; Jerry
+<00:00:01.500><c>second</c> line
+"""
+
+def test_iter_vtt_cues_drops_blocks_and_cleans_tags():
+    cues = list(iter_vtt_cues(VTT.splitlines(keepends=True)))
+    assert cues == [
+        (1000, 2500, ["Hello <b>world</b>"]),
+        (3723400, 3724050, ["Tom & Jerry", "second line"]),
+    ]
+
+def test_iter_vtt_cues_handles_bom_crlf_and_missing_trailing_blank():
+    lines = ["﻿WEBVTT\r\n", "\r\n", "00:05.000 --> 00:06.000\r\n", "last"]
+    assert list(iter_vtt_cues(lines)) == [(5000, 6000, ["last"])]
+
+def test_vtt_to_srt(tmp_path):
+    src, dst = tmp_path / "a.en.vtt", tmp_path / "a.en.srt"
+    src.write_text(VTT, encoding="utf-8")
+    assert vtt_to_srt(str(src), str(dst)) == 2
+    assert dst.read_text(encoding="utf-8") == (
+        "1\n00:00:01,000 --> 00:00:02,500\nHello <b>world</b>\n\n"
+        "2\n01:02:03,400 --> 01:02:04,050\nTom & Jerry\nsecond line\n\n"
+    )
+
+def test_parse_sub_langs():
+    assert parse_sub_langs("orig, ko,en,ko,,") == [SUB_TIER_ORIGINALS, "ko", "en"]
+    assert parse_sub_langs(["originals", "all"]) == [SUB_TIER_ORIGINALS, SUB_TIER_ALL]
+    assert parse_sub_langs(None) == []
+
+def _formats(*exts):
+    return [{"ext": ext, "url": ext} for ext in exts]
+
+SUBS = {"en-US": _formats("srv3", "vtt"), "ko": _formats("vtt"), "empty": []}
+AUTO = {"en-orig": _formats("vtt"), "fr": _formats("json3", "vtt"), "de": _formats("vtt")}
+
+def test_select_tracks_originals_excludes_translations():
+    tracks = select_tracks(SUBS, AUTO, [SUB_TIER_ORIGINALS])
+    assert list(tracks) == ["en-US", "ko", "en-orig"]
+    assert tracks["en-US"]["ext"] == "vtt"
+
+def test_select_tracks_prefers_uploader_then_auto():
+    # 'en'은 업로더 자막의 지역 변형을, 'fr'은 업로더 자막이 없으므로 자동 자막을 고릅니다
+    assert list(select_tracks(SUBS, AUTO, ["en", "fr", "xx"])) == ["en-US", "fr"]
+
+def test_select_tracks_all_and_copies():
+    tracks = select_tracks(SUBS, AUTO, [SUB_TIER_ALL])
+    assert set(tracks) == {"en-US", "ko", "en-orig", "fr", "de"}
+    tracks["ko"]["data"] = "x"
+    assert "data" not in SUBS["ko"][0]